@@ -16,11 +16,27 @@ __version__ = "2.0.30"
 __author__ = "Tom Sapletta"
 __email__ = "tom@sapletta.com"
 
-from .core.iteration_manager import IterationManager
-from .core.cost_calculator import CostCalculator
-from .engines.generation_engine import GenerationEngine
-from .engines.repair_engine import RepairEngine
-from .docker.deployment_manager import DeploymentManager
+import importlib
+
+# Public components are imported on first attribute access so that importing a
+# submodule (e.g. ``coval.cli``) does not pull in the Docker SDK and LLM engines.
+_LAZY_IMPORTS = {
+    'IterationManager': '.core.iteration_manager',
+    'CostCalculator': '.core.cost_calculator',
+    'GenerationEngine': '.engines.generation_engine',
+    'RepairEngine': '.engines.repair_engine',
+    'DeploymentManager': '.docker.deployment_manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'IterationManager',
@@ -9,26 +9,210 @@ Provides user-friendly commands that orchestrate all COVAL components.
 import os
 import sys
 import json
+import shutil
+import argparse
+import asyncio
 import click
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, List
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 from rich import print as rprint
 
-# Import COVAL components
+# Import lightweight COVAL components; engines and the Docker deployer pull in
+# heavy dependencies and are imported lazily where they are needed.
 from .core.iteration_manager import IterationManager
 from .core.cost_calculator import CostCalculator, CostMetrics
-from .engines.generation_engine import GenerationEngine, GenerationRequest
-from .engines.repair_engine import RepairEngine, LLMModel
-from .deployers.docker_deployer import DockerDeployer, DeploymentConfig
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Logging is configured once per process; the file handler follows the project root
+_LOGGING_READY = False
+_LOG_FILE_HANDLER = None
+
+# CLI model names; mapped to LLMModel lazily by _get_model_enum
+_MODEL_CHOICES = ('qwen', 'deepseek', 'codellama13b', 'deepseek-r1', 'granite', 'mistral')
+_MODEL_MAP = None
+
+# Timestamp format used in status tables
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+# Directories created by 'coval init'
+_PROJECT_DIRS = ("iterations", "logs", "repairs", "configs", "templates")
+
+
+# Static files written by 'coval init'
+_GITIGNORE_BYTES = b"""# COVAL
+iterations/*/
+logs/*.log
+repairs/*/
+.coval_cache/
+*.coval.tmp
+
+# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+MANIFEST
+
+# Virtual environments
+venv/
+env/
+ENV/
+
+# IDEs
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Docker
+.dockerignore"""
+
+_README_TEMPLATE = """# {NAME}
+
+A COVAL project for intelligent code generation, execution, and repair.
+
+## Quick Start
+
+```bash
+# Generate new code
+coval generate -d "Your project description"
+
+# Deploy iteration
+coval run
+
+# Check status
+coval status
+
+# Repair issues
+coval repair -e error.log
+```
+
+## Project Structure
+
+- `iterations/` - Generated code iterations
+- `logs/` - System and deployment logs
+- `repairs/` - Repair history and analysis
+- `configs/` - LLM and system configurations
+- `coval.config.yaml` - Main project configuration
+
+## Configuration
+
+- **Framework**: {FRAMEWORK}
+- **Language**: {LANGUAGE}
+- **COVAL Version**: 2.0
+
+## Next Steps
+
+1. Review `coval.config.yaml` for project settings
+2. Customize `configs/llm.config.yaml` for LLM preferences  
+3. Start generating code with `coval generate`
+
+Generated by COVAL v2.0 🤖
+""".encode()
+
+# Starter files for 'coval init --template', keyed by (template, language)
+_PROJECT_TEMPLATES = {
+    ('fastapi', 'python'): {
+        'main.py': b"""from fastapi import FastAPI
+
+app = FastAPI(title="COVAL Generated API", version="1.0.0")
+
+@app.get("/")
+async def root():
+    return {"message": "Hello from COVAL FastAPI!"}
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)""",
+        'requirements.txt': b"""fastapi==0.104.1
+uvicorn==0.24.0""",
+    },
+    ('flask', 'python'): {
+        'app.py': b"""from flask import Flask, jsonify
+
+app = Flask(__name__)
+
+@app.route('/')
+def hello():
+    return jsonify({"message": "Hello from COVAL Flask!"})
+
+@app.route('/health')
+def health():
+    return jsonify({"status": "healthy"})
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000, debug=True)""",
+        'requirements.txt': b"Flask==2.3.3",
+    },
+    ('express', 'javascript'): {
+        'server.js': b"""const express = require('express');
+const app = express();
+const port = process.env.PORT || 3000;
+
+app.use(express.json());
+
+app.get('/', (req, res) => {
+    res.json({ message: 'Hello from COVAL Express!' });
+});
+
+app.get('/health', (req, res) => {
+    res.json({ status: 'healthy' });
+});
+
+app.listen(port, () => {
+    console.log(`Server running at http://localhost:${port}`);
+});""",
+        'package.json': b"""{
+    "name": "coval-express-app",
+    "version": "1.0.0",
+    "description": "COVAL generated Express.js application",
+    "main": "server.js",
+    "scripts": {
+        "start": "node server.js",
+        "dev": "nodemon server.js"
+    },
+    "dependencies": {
+        "express": "^4.18.2"
+    },
+    "devDependencies": {
+        "nodemon": "^3.0.1"
+    }
+}""",
+    },
+}
+
 
 class COVALOrchestrator:
     """
@@ -40,12 +224,19 @@ class COVALOrchestrator:
     
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).absolute()
+        self._root_str = str(self.project_root)
         
         # Initialize components
         self.iteration_manager = IterationManager(str(self.project_root))
         self.cost_calculator = CostCalculator()
-        self.generation_engine = GenerationEngine()
-        self.deployment_manager = DockerDeployer(str(self.project_root))
+        
+        # Stats of the iteration history files when iterations were last in sync
+        self._iter_fp = self._history_fingerprint()
+        
+        # Heavy components are created on first access
+        self._generation_engine = None
+        self._deployment_manager = None
+        self._deployer_lock = threading.Lock()
         
         # Current state
         self.current_iteration = None
@@ -54,30 +245,101 @@ class COVALOrchestrator:
         # Setup logging
         self._setup_logging()
     
+    def _history_fingerprint(self):
+        """Return the stats of the iteration history files, None where missing."""
+        return self.iteration_manager.history_fingerprint()
+    
+    def refresh_iterations(self):
+        """
+        Return the iteration records, reloading them only when the history
+        file was changed on disk by another process.
+        """
+        with self.iteration_manager.history_lock:
+            fingerprint = self._history_fingerprint()
+            if fingerprint != self._iter_fp:
+                self.iteration_manager.reload()
+                self._iter_fp = fingerprint
+            return self.iteration_manager.iterations
+    
+    def mark_iterations_saved(self):
+        """Record that the history file now matches the in-memory iterations."""
+        with self.iteration_manager.history_lock:
+            self._iter_fp = self._history_fingerprint()
+    
+    @property
+    def generation_engine(self):
+        """Code generation engine, created on first access."""
+        if self._generation_engine is None:
+            from .engines.generation_engine import GenerationEngine
+            self._generation_engine = GenerationEngine()
+        return self._generation_engine
+    
+    @property
+    def deployment_manager(self):
+        """Docker deployer, created on first access (connects to Docker)."""
+        if self._deployment_manager is None:
+            with self._deployer_lock:
+                if self._deployment_manager is None:
+                    from .deployers.docker_deployer import DockerDeployer
+                    self._deployment_manager = DockerDeployer(str(self.project_root))
+        return self._deployment_manager
+    
     def _setup_logging(self):
-        """Setup logging for CLI operations."""
+        """Setup logging for CLI operations once per process and log file."""
+        global _LOGGING_READY, _LOG_FILE_HANDLER
         log_dir = self.project_root / "logs"
+        log_file = str(log_dir / "coval.log")
+        
+        if _LOGGING_READY and _LOG_FILE_HANDLER.baseFilename == log_file:
+            return
+        
         log_dir.mkdir(exist_ok=True)
+        file_handler = logging.FileHandler(log_file)
         
-        logging.basicConfig(
-            level=logging.WARNING,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_dir / "coval.log"),
-                logging.StreamHandler()
-            ],
-            force=True
-        )
+        if _LOGGING_READY:
+            # Project root changed: replace the file handler instead of leaking it
+            root_logger = logging.getLogger()
+            file_handler.setFormatter(_LOG_FILE_HANDLER.formatter)
+            root_logger.removeHandler(_LOG_FILE_HANDLER)
+            _LOG_FILE_HANDLER.close()
+            root_logger.addHandler(file_handler)
+        else:
+            logging.basicConfig(
+                level=logging.WARNING,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    file_handler,
+                    logging.StreamHandler()
+                ],
+                force=True
+            )
+            # Docker SDK debug output is noisy on every API call
+            logging.getLogger('docker').setLevel(logging.WARNING)
+            _LOGGING_READY = True
+        
+        _LOG_FILE_HANDLER = file_handler
 
 
 # Global orchestrator instance
 orchestrator = None
 
+# project_root argument -> absolute path string (the CLI never changes cwd)
+_ABS_ROOT_CACHE = {}
+
+
+def _absolute_root(project_root: str) -> str:
+    """Resolve a project root to an absolute path string, memoized per process."""
+    root = _ABS_ROOT_CACHE.get(project_root)
+    if root is None:
+        root = str(Path(project_root).absolute())
+        _ABS_ROOT_CACHE[project_root] = root
+    return root
+
 
 def get_orchestrator(project_root: str = ".") -> COVALOrchestrator:
     """Get or create the global COVAL orchestrator."""
     global orchestrator
-    if orchestrator is None or str(orchestrator.project_root) != str(Path(project_root).absolute()):
+    if orchestrator is None or orchestrator._root_str != _absolute_root(project_root):
         orchestrator = COVALOrchestrator(project_root)
     return orchestrator
 
@@ -109,7 +371,7 @@ def cli(ctx, project_root, verbose):
 @click.option('--language', '-l', default='python', help='Programming language')
 @click.option('--features', multiple=True, help='Features to include')
 @click.option('--model', default='qwen', help='LLM model to use', 
-              type=click.Choice(['qwen', 'deepseek', 'codellama13b', 'deepseek-r1', 'granite', 'mistral']))
+              type=click.Choice(_MODEL_CHOICES))
 @click.option('--parent', help='Parent iteration ID to base this on')
 @click.option('--deploy', is_flag=True, help='Deploy immediately after generation')
 @click.pass_context
@@ -119,6 +381,8 @@ def generate(ctx, description, framework, language, features, model, parent, dep
     
     Creates a new iteration with generated code based on your description.
     """
+    from .engines.generation_engine import GenerationRequest
+    
     orch = get_orchestrator(ctx.obj['project_root'])
     
     # Simple step-by-step progress display
@@ -156,6 +420,7 @@ def generate(ctx, description, framework, language, features, model, parent, dep
             confidence_score=result.confidence_score,
             files_changed=list(result.generated_files.keys())
         )
+        orch.mark_iterations_saved()
         
         # Display results
         _display_generation_results(result, iteration_id)
@@ -184,32 +449,14 @@ def run(ctx, iteration, port, strategy):
     Deploys the specified iteration using transparent Docker volumes.
     """
     orch = get_orchestrator(ctx.obj['project_root'])
-    
-    # Get iteration to deploy
-    if not iteration:
-        iteration = orch.iteration_manager.get_latest_iteration()
-        if not iteration:
-            console.print("[red]No iterations found. Generate code first with 'coval generate'[/red]")
-            sys.exit(1)
-    
-    if iteration not in orch.iteration_manager.iterations:
-        console.print(f"[red]Iteration {iteration} not found[/red]")
-        sys.exit(1)
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Deploying iteration...", total=None)
-        _deploy_iteration(orch, iteration, port, progress, task)
+    _run_deployment(orch, iteration, port, strategy)
 
 
 @cli.command()
 @click.option('--error', '-e', required=True, help='Path to error log file')
 @click.option('--iteration', '-i', help='Iteration ID to repair (default: latest)')
 @click.option('--model', default='qwen', help='LLM model to use for repair',
-              type=click.Choice(['qwen', 'deepseek', 'codellama13b', 'deepseek-r1', 'granite', 'mistral']))
+              type=click.Choice(_MODEL_CHOICES))
 @click.option('--analyze', is_flag=True, help='Only analyze, do not repair')
 @click.option('--deploy', is_flag=True, help='Deploy after successful repair')
 @click.pass_context
@@ -220,14 +467,19 @@ def repair(ctx, error, iteration, model, analyze, deploy):
     Analyzes errors and repairs code using adaptive evaluation.
     """
     orch = get_orchestrator(ctx.obj['project_root'])
+    iterations = orch.refresh_iterations()
     
     # Get iteration to repair
     if not iteration:
-        iteration = orch.iteration_manager.get_latest_iteration()
+        iteration = _latest_iteration(iterations)
         if not iteration:
             console.print("[red]No iterations found. Generate code first.[/red]")
             sys.exit(1)
     
+    if iteration not in iterations:
+        console.print(f"[red]Iteration {iteration} not found[/red]")
+        sys.exit(1)
+    
     error_file = Path(error)
     if not error_file.exists():
         console.print(f"[red]Error file not found: {error}[/red]")
@@ -236,14 +488,12 @@ def repair(ctx, error, iteration, model, analyze, deploy):
     iteration_path = orch.iteration_manager.get_iteration_path(iteration)
     
     # Initialize repair engine
+    from .engines.repair_engine import RepairEngine
+    
     model_enum = _get_model_enum(model)
     repair_engine = RepairEngine(model=model_enum)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
+    with _progress() as progress:
         
         # Perform triage
         task = progress.add_task("Analyzing problem...", total=None)
@@ -282,13 +532,14 @@ def repair(ctx, error, iteration, model, analyze, deploy):
                 'repaired',
                 success_rate=result.historical_success_rate
             )
+            orch.mark_iterations_saved()
             
             console.print(f"[green]✅ Repair successful! New iteration: {repair_iteration_id}[/green]")
             
             # Deploy if requested
             if deploy:
                 progress.update(task, description="🚀 Deploying repaired iteration...")
-                _deploy_iteration(orch, repair_iteration_id, progress, task)
+                _deploy_iteration(orch, repair_iteration_id, progress=progress, task=task)
                 
         else:
             progress.update(task, description="❌ Repair failed")
@@ -309,30 +560,7 @@ def cleanup(ctx, count, force):
     Removes old iterations and stops unused deployments.
     """
     orch = get_orchestrator(ctx.obj['project_root'])
-    
-    if not force:
-        console.print(f"[yellow]This will remove old iterations, keeping only the {count} most recent.[/yellow]")
-        if not click.confirm("Continue?"):
-            return
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        
-        # Cleanup iterations
-        task = progress.add_task("Cleaning up iterations...", total=None)
-        removed_iterations = orch.iteration_manager.cleanup_old_iterations(count)
-        
-        # Cleanup deployments
-        progress.update(task, description="Cleaning up deployments...")
-        stopped_deployments = orch.deployment_manager.cleanup_old_deployments(count // 2)
-        
-        progress.update(task, description="✅ Cleanup completed")
-    
-    console.print(f"[green]Removed {len(removed_iterations)} old iterations[/green]")
-    console.print(f"[green]Stopped {len(stopped_deployments)} old deployments[/green]")
+    _cleanup_project(orch, count, force)
 
 
 @cli.command()
@@ -344,61 +572,7 @@ def status(ctx):
     Displays current iterations, deployments, and statistics.
     """
     orch = get_orchestrator(ctx.obj['project_root'])
-    
-    # Iterations table
-    iterations_table = Table(title="📁 Iterations")
-    iterations_table.add_column("ID", style="cyan")
-    iterations_table.add_column("Type", style="magenta")
-    iterations_table.add_column("Status", style="green")
-    iterations_table.add_column("Description", style="white")
-    iterations_table.add_column("Created", style="dim")
-    
-    for iteration_id, info in orch.iteration_manager.iterations.items():
-        iterations_table.add_row(
-            iteration_id,
-            info.generation_type,
-            info.status,
-            info.description[:50] + "..." if len(info.description) > 50 else info.description,
-            info.timestamp.strftime("%Y-%m-%d %H:%M")
-        )
-    
-    console.print(iterations_table)
-    
-    # Deployments table
-    deployments = orch.deployment_manager.active_deployments
-    if deployments:
-        deployments_table = Table(title="🐳 Active Deployments")
-        deployments_table.add_column("Iteration", style="cyan")
-        deployments_table.add_column("Container", style="blue")
-        deployments_table.add_column("Status", style="green")
-        deployments_table.add_column("Port", style="yellow")
-        deployments_table.add_column("Health", style="red")
-        
-        for deployment in deployments:
-            port = list(deployment.port_mappings.values())[0] if deployment.port_mappings else "N/A"
-            deployments_table.add_row(
-                deployment.iteration_id,
-                deployment.container_name,
-                deployment.status,
-                str(port),
-                deployment.health_status
-            )
-        
-        console.print(deployments_table)
-    
-    # Statistics
-    total_iterations = len(orch.iteration_manager.iterations)
-    active_deployments = len(deployments)
-    latest_iteration = orch.iteration_manager.get_latest_iteration()
-    
-    stats_panel = Panel(
-        f"📊 Total Iterations: [cyan]{total_iterations}[/cyan]\n"
-        f"🐳 Active Deployments: [green]{active_deployments}[/green]\n"
-        f"🔄 Latest Iteration: [yellow]{latest_iteration or 'None'}[/yellow]",
-        title="Project Statistics"
-    )
-    
-    console.print(stats_panel)
+    _show_status(orch)
 
 
 @cli.command()
@@ -424,10 +598,14 @@ def init(ctx, name, framework, language, template, force):
     console.print(f"🌱 Initializing COVAL project: [cyan]{name}[/cyan]")
     
     # Check if already initialized
-    coval_config = project_root / "coval.config.yaml"
-    iterations_dir = project_root / "iterations"
+    # One directory read answers every existence check below
+    try:
+        with os.scandir(project_root) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
     
-    if (coval_config.exists() or iterations_dir.exists()) and not force:
+    if ('coval.config.yaml' in present or 'iterations' in present) and not force:
         console.print("[yellow]⚠️  Project appears to already be initialized.[/yellow]")
         console.print("Use --force to reinitialize or choose a different directory.")
         return
@@ -437,39 +615,26 @@ def init(ctx, name, framework, language, template, force):
         console.print("📁 Creating project structure...")
         
         # Essential directories
-        (project_root / "iterations").mkdir(exist_ok=True)
-        (project_root / "logs").mkdir(exist_ok=True)
-        (project_root / "repairs").mkdir(exist_ok=True)
-        (project_root / "configs").mkdir(exist_ok=True)
-        (project_root / "templates").mkdir(exist_ok=True)
+        root = str(project_root)
+        for subdir in _PROJECT_DIRS:
+            if subdir not in present:
+                os.makedirs(os.path.join(root, subdir), exist_ok=True)
         
         # Copy configuration templates
         console.print("⚙️  Setting up configuration files...")
         
         package_config_dir = Path(__file__).parent / "config"
         
-        # Copy COVAL config template
-        if (package_config_dir / "coval.config.yaml").exists():
-            import shutil
-            shutil.copy2(
-                package_config_dir / "coval.config.yaml",
-                project_root / "coval.config.yaml"
-            )
-            
-            # Update project name in config
-            config_content = (project_root / "coval.config.yaml").read_text()
-            config_content = config_content.replace(
-                'name: "my-coval-project"',
-                f'name: "{name}"'
-            )
-            config_content = config_content.replace(
-                'framework: "auto-detect"',
-                f'framework: "{framework}"'
-            )
-            config_content = config_content.replace(
-                'language: "auto-detect"',
-                f'language: "{language}"'
-            )
+        # Render COVAL config template with project settings in a single write
+        config_template = package_config_dir / "coval.config.yaml"
+        if config_template.exists():
+            config_content = config_template.read_text()
+            for placeholder, value in (
+                ('name: "my-coval-project"', f'name: "{name}"'),
+                ('framework: "auto-detect"', f'framework: "{framework}"'),
+                ('language: "auto-detect"', f'language: "{language}"'),
+            ):
+                config_content = config_content.replace(placeholder, value)
             (project_root / "coval.config.yaml").write_text(config_content)
         
         # Copy LLM config
@@ -482,101 +647,17 @@ def init(ctx, name, framework, language, template, force):
         # Create .gitignore
         console.print("📝 Creating .gitignore...")
         gitignore = project_root / ".gitignore"
-        gitignore.write_text('''
-# COVAL
-iterations/*/
-logs/*.log
-repairs/*/
-.coval_cache/
-*.coval.tmp
-
-# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-MANIFEST
-
-# Virtual environments
-venv/
-env/
-ENV/
-
-# IDEs
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Docker
-.dockerignore
-'''.strip())
+        gitignore.write_bytes(_GITIGNORE_BYTES)
         
         # Create README template
         console.print("📖 Creating project README...")
         readme = project_root / "README.md"
-        readme.write_text(f'''# {name}
-
-A COVAL project for intelligent code generation, execution, and repair.
-
-## Quick Start
-
-```bash
-# Generate new code
-coval generate -d "Your project description"
-
-# Deploy iteration
-coval run
-
-# Check status
-coval status
-
-# Repair issues
-coval repair -e error.log
-```
-
-## Project Structure
-
-- `iterations/` - Generated code iterations
-- `logs/` - System and deployment logs
-- `repairs/` - Repair history and analysis
-- `configs/` - LLM and system configurations
-- `coval.config.yaml` - Main project configuration
-
-## Configuration
-
-- **Framework**: {framework}
-- **Language**: {language}
-- **COVAL Version**: 2.0
-
-## Next Steps
-
-1. Review `coval.config.yaml` for project settings
-2. Customize `configs/llm.config.yaml` for LLM preferences  
-3. Start generating code with `coval generate`
-
-Generated by COVAL v2.0 🤖
-''')
+        readme.write_bytes(
+            _README_TEMPLATE
+            .replace(b"{NAME}", name.encode())
+            .replace(b"{FRAMEWORK}", framework.encode())
+            .replace(b"{LANGUAGE}", language.encode())
+        )
         
         # Create initial project template if specified
         if template:
@@ -592,15 +673,19 @@ Generated by COVAL v2.0 🤖
         
         # Success message
         success_panel = Panel(
-            f"🎉 COVAL project initialized successfully!\n\n"
-            f"📁 Project: [cyan]{name}[/cyan]\n"
-            f"🏗️  Framework: [yellow]{framework}[/yellow]\n"
-            f"🔤 Language: [blue]{language}[/blue]\n"
-            f"📋 Initial iteration: [green]{initial_iteration}[/green]\n\n"
-            f"Next steps:\n"
-            f"• Review coval.config.yaml\n"
-            f"• Run: coval generate -d \"Your project idea\"\n"
-            f"• Check: coval status",
+            _panel_text(
+                "🎉 COVAL project initialized successfully!",
+                "",
+                ("📁 Project: ", name, "cyan"),
+                ("🏗️  Framework: ", framework, "yellow"),
+                ("🔤 Language: ", language, "blue"),
+                ("📋 Initial iteration: ", initial_iteration, "green"),
+                "",
+                "Next steps:",
+                "• Review coval.config.yaml",
+                "• Run: coval generate -d \"Your project idea\"",
+                "• Check: coval status"
+            ),
             title="✨ Project Initialized",
             border_style="green"
         )
@@ -622,26 +707,221 @@ def stop(ctx, iteration):
     Stops Docker containers and cleans up resources.
     """
     orch = get_orchestrator(ctx.obj['project_root'])
+    _stop_deployments(orch, iteration)
+
+
+# Helper functions
+
+def _panel_text(*lines) -> Text:
+    """
+    Build panel content without rich markup parsing.
+    
+    Each line is either plain text or a (label, value, style) tuple whose
+    value is rendered with the given style.
+    """
+    text = Text()
+    for index, line in enumerate(lines):
+        if index:
+            text.append("\n")
+        if isinstance(line, str):
+            text.append(line)
+        else:
+            label, value, style = line
+            text.append(label)
+            text.append(str(value), style=style)
+    return text
+
+
+class _NullProgress:
+    """Stand-in for rich Progress when output is not a terminal."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def add_task(self, description, **kwargs):
+        return 0
+    
+    def update(self, task_id, **kwargs):
+        pass
+
+
+def _progress():
+    """Spinner progress for interactive terminals, a no-op otherwise."""
+    if not sys.stdout.isatty():
+        return _NullProgress()
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
+
+
+def _latest_iteration(iterations) -> Optional[str]:
+    """Return the ID of the newest iteration in an already-loaded mapping."""
+    return max(iterations, key=lambda iteration_id: iterations[iteration_id].timestamp, default=None)
+
+
+def _run_deployment(orch: COVALOrchestrator, iteration: Optional[str], port: Optional[int], strategy: str):
+    """Deploy an iteration (latest by default) behind a progress spinner."""
+    iterations = orch.refresh_iterations()
+    
+    # Get iteration to deploy
+    if not iteration:
+        iteration = _latest_iteration(iterations)
+        if not iteration:
+            console.print("[red]No iterations found. Generate code first with 'coval generate'[/red]")
+            sys.exit(1)
+    
+    if iteration not in iterations:
+        console.print(f"[red]Iteration {iteration} not found[/red]")
+        sys.exit(1)
+    
+    with _progress() as progress:
+        task = progress.add_task("Deploying iteration...", total=None)
+        _deploy_iteration(orch, iteration, port, progress, task)
+
+
+def _cleanup_project(orch: COVALOrchestrator, count: int, force: bool):
+    """Remove old iterations and stop old deployments."""
+    if not force:
+        console.print(f"[yellow]This will remove old iterations, keeping only the {count} most recent.[/yellow]")
+        if not click.confirm("Continue?"):
+            return
+    
+    with _progress() as progress:
+        
+        # Iterations (filesystem) and deployments (Docker) are independent
+        task = progress.add_task("Cleaning up iterations and deployments...", total=None)
+        orch.refresh_iterations()
+        removed_iterations, stopped_deployments = asyncio.run(_cleanup_concurrently(orch, count))
+        orch.mark_iterations_saved()
+        
+        progress.update(task, description="✅ Cleanup completed")
+    
+    console.print(f"[green]Removed {len(removed_iterations)} old iterations[/green]")
+    console.print(f"[green]Stopped {len(stopped_deployments)} old deployments[/green]")
+
+
+def _show_status(orch: COVALOrchestrator):
+    """Print iterations, active deployments and project statistics."""
+    iterations, deployments = asyncio.run(_collect_status(orch))
+    
+    # Iterations table
+    iterations_table = Table(title="📁 Iterations")
+    iterations_table.add_column("ID", style="cyan")
+    iterations_table.add_column("Type", style="magenta")
+    iterations_table.add_column("Status", style="green")
+    iterations_table.add_column("Description", style="white")
+    iterations_table.add_column("Created", style="dim")
+    
+    # Most recent iterations first
+    for iteration_id, info in sorted(iterations.items(), key=lambda item: item[1].timestamp, reverse=True):
+        description = info.description
+        if len(description) > 50:
+            description = f"{description[:50]}..."
+        iterations_table.add_row(
+            iteration_id,
+            info.generation_type,
+            info.status,
+            description,
+            info.timestamp.strftime(_TIMESTAMP_FORMAT)
+        )
+    
+    console.print(iterations_table)
+    
+    # Deployments table
+    if deployments:
+        deployments_table = Table(title="🐳 Active Deployments")
+        deployments_table.add_column("Iteration", style="cyan")
+        deployments_table.add_column("Container", style="blue")
+        deployments_table.add_column("Status", style="green")
+        deployments_table.add_column("Port", style="yellow")
+        deployments_table.add_column("Health", style="red")
+        
+        for deployment in deployments:
+            port = next(iter(deployment.port_mappings.values()), None) if deployment.port_mappings else None
+            deployments_table.add_row(
+                deployment.iteration_id,
+                deployment.container_name,
+                "deployed" if deployment.success else "failed",
+                str(port) if port is not None else "N/A",
+                deployment.health_status.value
+            )
+        
+        console.print(deployments_table)
+    
+    # Statistics
+    total_iterations = len(iterations)
+    active_deployments = len(deployments)
+    latest_iteration = orch.iteration_manager.get_latest_iteration()
+    
+    stats_panel = Panel(
+        _panel_text(
+            ("📊 Total Iterations: ", total_iterations, "cyan"),
+            ("🐳 Active Deployments: ", active_deployments, "green"),
+            ("🔄 Latest Iteration: ", latest_iteration or 'None', "yellow")
+        ),
+        title="Project Statistics"
+    )
+    
+    console.print(stats_panel)
+
+
+async def _collect_status(orch: COVALOrchestrator):
+    """Load iterations and probe deployment health concurrently."""
+    async def list_deployments():
+        # Creating the deployer pings Docker, so keep it off the event loop
+        deployer = await asyncio.to_thread(lambda: orch.deployment_manager)
+        return await deployer.alist_active_deployments()
     
+    return await asyncio.gather(
+        asyncio.to_thread(orch.refresh_iterations),
+        list_deployments()
+    )
+
+
+def _stop_deployments(orch: COVALOrchestrator, iteration: Optional[str]):
+    """Stop one deployment, or all active deployments when no iteration is given."""
     if iteration:
         # Stop specific iteration
-        if orch.deployment_manager.stop(iteration):
+        if orch.deployment_manager.stop_deployment(iteration):
             console.print(f"[green]✅ Stopped deployment: {iteration}[/green]")
         else:
             console.print(f"[red]❌ Failed to stop deployment: {iteration}[/red]")
     else:
         # Stop all deployments
-        deployments = orch.deployment_manager.active_deployments
-        stopped_count = 0
-        
-        for deployment in deployments:
-            if orch.deployment_manager.stop(deployment.iteration_id):
-                stopped_count += 1
+        deployments = orch.deployment_manager.list_active_deployments()
+        results = asyncio.run(_stop_all(
+            orch.deployment_manager,
+            [deployment.iteration_id for deployment in deployments]
+        ))
+        stopped_count = sum(results)
         
         console.print(f"[green]✅ Stopped {stopped_count} deployments[/green]")
 
 
-# Helper functions
+async def _stop_all(deployment_manager, iteration_ids: List[str]) -> List[bool]:
+    """Stop deployments concurrently; each stop blocks on Docker API round trips."""
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(asyncio.to_thread(deployment_manager.stop_deployment, iteration_id))
+            for iteration_id in iteration_ids
+        ]
+    return [task.result() for task in tasks]
+
+
+async def _cleanup_concurrently(orch: COVALOrchestrator, count: int):
+    """Cleanup iterations and deployments at the same time."""
+    return await asyncio.gather(
+        asyncio.to_thread(orch.iteration_manager.cleanup_old_iterations, count),
+        asyncio.to_thread(orch.deployment_manager.cleanup_old_deployments, count // 2)
+    )
+
 
 def _create_project_template(project_root: Path, template: str, framework: str, language: str):
     """Create initial project template files."""
@@ -649,109 +929,39 @@ def _create_project_template(project_root: Path, template: str, framework: str,
     template_dir = project_root / "templates" / template
     template_dir.mkdir(parents=True, exist_ok=True)
     
-    if template == "fastapi" and language == "python":
-        # Create basic FastAPI template
-        main_py = template_dir / "main.py"
-        main_py.write_text('''
-from fastapi import FastAPI
+    for filename, content in _PROJECT_TEMPLATES.get((template, language), {}).items():
+        (template_dir / filename).write_bytes(content)
 
-app = FastAPI(title="COVAL Generated API", version="1.0.0")
 
-@app.get("/")
-async def root():
-    return {"message": "Hello from COVAL FastAPI!"}
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+def _save_deploy_status(orch: COVALOrchestrator, iteration_id: str, status: str, docker_status: str):
+    """Record a deploy outcome; the fingerprint is taken before other deploys can write."""
+    with orch.iteration_manager.history_lock:
+        orch.iteration_manager.update_iteration_status(iteration_id, status, docker_status=docker_status)
+        orch.mark_iterations_saved()
 
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-'''.strip())
-        
-        requirements = template_dir / "requirements.txt"
-        requirements.write_text('''
-fastapi==0.104.1
-uvicorn==0.24.0
-'''.strip())
-        
-    elif template == "flask" and language == "python":
-        # Create basic Flask template
-        app_py = template_dir / "app.py"
-        app_py.write_text('''
-from flask import Flask, jsonify
 
-app = Flask(__name__)
-
-@app.route('/')
-def hello():
-    return jsonify({"message": "Hello from COVAL Flask!"})
-
-@app.route('/health')
-def health():
-    return jsonify({"status": "healthy"})
-
-if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
-'''.strip())
-        
-        requirements = template_dir / "requirements.txt"
-        requirements.write_text('''
-Flask==2.3.3
-'''.strip())
-    
-    elif template == "express" and language == "javascript":
-        # Create basic Express template
-        server_js = template_dir / "server.js"
-        server_js.write_text('''
-const express = require('express');
-const app = express();
-const port = process.env.PORT || 3000;
-
-app.use(express.json());
-
-app.get('/', (req, res) => {
-    res.json({ message: 'Hello from COVAL Express!' });
-});
-
-app.get('/health', (req, res) => {
-    res.json({ status: 'healthy' });
-});
-
-app.listen(port, () => {
-    console.log(`Server running at http://localhost:${port}`);
-});
-'''.strip())
-        
-        package_json = template_dir / "package.json"
-        package_json.write_text('''{
-    "name": "coval-express-app",
-    "version": "1.0.0",
-    "description": "COVAL generated Express.js application",
-    "main": "server.js",
-    "scripts": {
-        "start": "node server.js",
-        "dev": "nodemon server.js"
-    },
-    "dependencies": {
-        "express": "^4.18.2"
-    },
-    "devDependencies": {
-        "nodemon": "^3.0.1"
-    }
-}''')
+def _deploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = None, progress=None, task=None):
+    """Deploy an iteration with simple progress display (blocking wrapper)."""
+    asyncio.run(_adeploy_iteration(orch, iteration_id, port, progress, task))
 
 
-def _deploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = None, progress=None, task=None):
-    """Deploy an iteration with simple progress display."""
+async def _adeploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = None, progress=None, task=None):
+    """
+    Deploy an iteration with simple progress display.
+    
+    Blocking Docker and history calls run in worker threads, so several
+    iterations can be deployed concurrently with asyncio.gather.
+    """
+    from .deployers.docker_deployer import DeploymentConfig
+    
     try:
         print("🐳 Preparing deployment...", end=" ", flush=True)
         iteration_path = orch.iteration_manager.get_iteration_path(iteration_id)
         
         # Get parent iterations for overlay
         parent_iterations = []
-        iteration_info = orch.iteration_manager.iterations.get(iteration_id)
+        iterations = await asyncio.to_thread(orch.refresh_iterations)
+        iteration_info = iterations.get(iteration_id)
         if iteration_info and iteration_info.parent_iteration:
             parent_iterations = [iteration_info.parent_iteration]
         print("✅")
@@ -768,27 +978,27 @@ def _deploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = No
             base_port=base_port
         )
         
-        # Deploy using new modular deployer (fixes container cleanup issues)
-        deployment_result = orch.deployment_manager.deploy(deployment_config)
+        # Deploy using new modular deployer (fixes container cleanup issues);
+        # creating it pings Docker, so that happens off the event loop too
+        deployment_result = await asyncio.to_thread(
+            lambda: orch.deployment_manager.deploy(deployment_config)
+        )
         print("✅")
         
         print("📊 Updating status...", end=" ", flush=True)
         # Update iteration status based on real status
         status = 'deployed' if deployment_result.success else 'failed'
-        orch.iteration_manager.update_iteration_status(
+        await asyncio.to_thread(
+            _save_deploy_status,
+            orch,
             iteration_id,
             status,
-            docker_status=deployment_result.health_status.value
+            deployment_result.health_status.value
         )
         print("✅")
         
-        port = None
-        if deployment_result.port_mappings:
-            try:
-                # host_port
-                port = list(deployment_result.port_mappings.values())[0]
-            except Exception:
-                port = None
+        # First host port, if any
+        port = next(iter(deployment_result.port_mappings.values()), None) if deployment_result.port_mappings else None
         
         # Update progress if provided (backward compatibility)
         if progress and task:
@@ -804,15 +1014,16 @@ def _deploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = No
         
         title = "Deployment Info"
         header = "🚀 Deployment successful!" if deployment_result.success else "⚠️ Deployment failed"
-        url_line = f"🌐 URL: [green]http://localhost:{port}[/green]" if port else "🌐 URL: [yellow]N/A[/yellow]"
-        status_line = f"📊 Status: [yellow]{deployment_result.health_status.value}[/yellow]"
+        url_line = ("🌐 URL: ", f"http://localhost:{port}", "green") if port else ("🌐 URL: ", "N/A", "yellow")
         
         deployment_panel = Panel(
-            f"{header}\n"
-            f"📁 Iteration: [cyan]{iteration_id}[/cyan]\n"
-            f"🐳 Container: [blue]{deployment_result.container_name}[/blue]\n"
-            f"{url_line}\n"
-            f"{status_line}",
+            _panel_text(
+                header,
+                ("📁 Iteration: ", iteration_id, "cyan"),
+                ("🐳 Container: ", deployment_result.container_name, "blue"),
+                url_line,
+                ("📊 Status: ", deployment_result.health_status.value, "yellow")
+            ),
             title=title
         )
         
@@ -828,30 +1039,41 @@ def _deploy_iteration(orch: COVALOrchestrator, iteration_id: str, port: int = No
 
 def _display_generation_results(result, iteration_id: str):
     """Display code generation results."""
-    files_count = len(result.generated_files)
+    # Single pass over the generated files; the table is built from these rows
+    rows = []
+    total_size = 0
+    for filename, content in result.generated_files.items():
+        size = len(content)
+        total_size += size
+        rows.append((filename, f"{size} chars"))
+    files_count = len(rows)
     tests_count = len(result.tests)
     
     result_panel = Panel(
-        f"🤖 Code generation completed!\n"
-        f"📁 Iteration: [cyan]{iteration_id}[/cyan]\n"
-        f"📄 Files generated: [green]{files_count}[/green]\n"
-        f"🧪 Test files: [blue]{tests_count}[/blue]\n"
-        f"🔧 Model used: [yellow]{result.model_used}[/yellow]\n"
-        f"📊 Confidence: [magenta]{result.confidence_score:.1%}[/magenta]\n"
-        f"⏱️  Time: [dim]{result.execution_time:.2f}s[/dim]",
+        _panel_text(
+            "🤖 Code generation completed!",
+            ("📁 Iteration: ", iteration_id, "cyan"),
+            ("📄 Files generated: ", files_count, "green"),
+            ("🧪 Test files: ", tests_count, "blue"),
+            ("🔧 Model used: ", result.model_used, "yellow"),
+            ("📊 Confidence: ", f"{result.confidence_score:.1%}", "magenta"),
+            ("⏱️  Time: ", f"{result.execution_time:.2f}s", "dim")
+        ),
         title="Generation Results"
     )
     
     console.print(result_panel)
     
-    if result.generated_files:
+    if rows:
         files_table = Table(title="📄 Generated Files")
         files_table.add_column("Filename", style="cyan")
         files_table.add_column("Size", style="dim")
         
-        for filename in result.generated_files.keys():
-            size = len(result.generated_files[filename])
-            files_table.add_row(filename, f"{size} chars")
+        add_row = files_table.add_row
+        for filename, size_text in rows:
+            add_row(filename, size_text)
+        files_table.add_section()
+        add_row("Total", f"{total_size} chars", style="bold")
         
         console.print(files_table)
 
@@ -859,35 +1081,113 @@ def _display_generation_results(result, iteration_id: str):
 def _display_repair_analysis(metrics, iteration_id: str):
     """Display repair analysis results."""
     analysis_panel = Panel(
-        f"🔍 Repair Analysis for [cyan]{iteration_id}[/cyan]\n\n"
-        f"📊 Technical Debt: [red]{metrics.technical_debt:.1f}[/red]\n"
-        f"🧪 Test Coverage: [green]{metrics.test_coverage:.1%}[/green]\n"
-        f"📋 Available Context: [blue]{metrics.available_context:.1%}[/blue]\n"
-        f"🤖 Model Capability: [magenta]{metrics.model_capability:.1%}[/magenta]\n"
-        f"📈 Historical Success: [yellow]{metrics.historical_success_rate:.1%}[/yellow]\n"
-        f"🏷️  Problem Category: [cyan]{metrics.problem_category}[/cyan]",
+        _panel_text(
+            ("🔍 Repair Analysis for ", iteration_id, "cyan"),
+            "",
+            ("📊 Technical Debt: ", f"{metrics.technical_debt:.1f}", "red"),
+            ("🧪 Test Coverage: ", f"{metrics.test_coverage:.1%}", "green"),
+            ("📋 Available Context: ", f"{metrics.available_context:.1%}", "blue"),
+            ("🤖 Model Capability: ", f"{metrics.model_capability:.1%}", "magenta"),
+            ("📈 Historical Success: ", f"{metrics.historical_success_rate:.1%}", "yellow"),
+            ("🏷️  Problem Category: ", metrics.problem_category, "cyan")
+        ),
         title="Repair Analysis"
     )
     
     console.print(analysis_panel)
 
 
-def _get_model_enum(model_name: str) -> LLMModel:
+def _get_model_enum(model_name: str):
     """Convert model name to enum."""
-    model_mapping = {
-        'qwen': LLMModel.QWEN_CODER,
-        'deepseek': LLMModel.DEEPSEEK_CODER,
-        'codellama13b': LLMModel.CODELLAMA_13B,
-        'deepseek-r1': LLMModel.DEEPSEEK_R1,
-        'granite': LLMModel.GRANITE_CODE,
-        'mistral': LLMModel.MISTRAL
-    }
-    return model_mapping.get(model_name, LLMModel.QWEN_CODER)
+    global _MODEL_MAP
+    if _MODEL_MAP is None:
+        from .engines.repair_engine import LLMModel
+        
+        _MODEL_MAP = {
+            'qwen': LLMModel.QWEN_CODER,
+            'deepseek': LLMModel.DEEPSEEK_CODER,
+            'codellama13b': LLMModel.CODELLAMA_13B,
+            'deepseek-r1': LLMModel.DEEPSEEK_R1,
+            'granite': LLMModel.GRANITE_CODE,
+            'mistral': LLMModel.MISTRAL
+        }
+    return _MODEL_MAP.get(model_name, _MODEL_MAP['qwen'])
+
+
+# Fast path for hot commands
+
+_FAST_COMMANDS = frozenset({'status', 'stop', 'run', 'cleanup'})
+_FAST_PARSER = None
+
+
+class _FastPathUnavailable(Exception):
+    """Raised when argv cannot be handled by the fast parser."""
+
+
+class _FastArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that defers to Click instead of printing its own errors."""
+    
+    def error(self, message):
+        raise _FastPathUnavailable(message)
+
+
+def _get_fast_parser() -> argparse.ArgumentParser:
+    """Build the fast-path parser once per process."""
+    global _FAST_PARSER
+    if _FAST_PARSER is None:
+        parser = _FastArgumentParser(prog='coval', add_help=False, allow_abbrev=False)
+        commands = parser.add_subparsers(dest='command')
+        
+        commands.add_parser('status', add_help=False, allow_abbrev=False)
+        
+        stop_parser = commands.add_parser('stop', add_help=False, allow_abbrev=False)
+        stop_parser.add_argument('--iteration', '-i')
+        
+        run_parser = commands.add_parser('run', add_help=False, allow_abbrev=False)
+        run_parser.add_argument('--iteration', '-i')
+        run_parser.add_argument('--port', '-p', type=int)
+        run_parser.add_argument('--strategy', default='overlay', choices=('overlay', 'copy', 'symlink'))
+        
+        cleanup_parser = commands.add_parser('cleanup', add_help=False, allow_abbrev=False)
+        cleanup_parser.add_argument('--count', '-c', type=int, default=10)
+        cleanup_parser.add_argument('--force', action='store_true')
+        
+        _FAST_PARSER = parser
+    return _FAST_PARSER
+
+
+def _fast_dispatch(argv: List[str]) -> bool:
+    """
+    Run status/stop/run/cleanup without building the Click context.
+    
+    Returns False when argv should be handled by Click instead (other
+    commands, group options, --help or any parse error).
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS or '--help' in argv:
+        return False
+    
+    try:
+        args = _get_fast_parser().parse_args(argv)
+    except _FastPathUnavailable:
+        return False
+    
+    orch = get_orchestrator('.')
+    if args.command == 'status':
+        _show_status(orch)
+    elif args.command == 'stop':
+        _stop_deployments(orch, args.iteration)
+    elif args.command == 'run':
+        _run_deployment(orch, args.iteration, args.port, args.strategy)
+    else:
+        _cleanup_project(orch, args.count, args.force)
+    return True
 
 
 # Entry points for console scripts
 def main():
     """Main CLI entry point."""
+    if _fast_dispatch(sys.argv[1:]):
+        return
     cli()
 
 
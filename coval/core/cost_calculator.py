@@ -8,16 +8,46 @@ Helps decide whether to repair existing code or generate new iterations.
 
 import math
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
-from pathlib import Path
+from enum import IntFlag
 
 logger = logging.getLogger(__name__)
 
+# Normaliser for the logarithmic size factors (log base 1000)
+_LOG_1000 = math.log(1000)
 
-@dataclass
+# Base effort in hours per recommended action
+_BASE_HOURS = {
+    'modify': 4.0,
+    'generate': 12.0,
+    'hybrid': 8.0
+}
+
+# Time size scale for projects at or below the 100 LOC floor
+_MIN_TIME_SIZE_SCALE = 0.5 + math.log(100) / _LOG_1000
+
+# Metrics fields read by the cost formulas, in batch column order
+_COST_FIELDS = attrgetter(
+    'lines_of_code', 'complexity_score', 'technical_debt', 'modification_scope',
+    'dependencies_count', 'test_coverage', 'historical_success_rate',
+    'iteration_count', 'framework_maturity', 'team_familiarity'
+)
+
+# Metrics element of an (iteration_id, metrics) pair
+_SECOND = itemgetter(1)
+
+# Maximum number of memoized estimates per CostCalculator
+_ESTIMATE_CACHE_SIZE = 1024
+
+# Weighted success score for hybrid recommendations (three factors of 0.6)
+_HYBRID_SUCCESS_SCORE = 0.6 * 0.25 * 3
+
+
+@dataclass(frozen=True, slots=True)
 class CostMetrics:
-    """Metrics used for cost calculation."""
+    """Metrics used for cost calculation (immutable and hashable)."""
     lines_of_code: int
     complexity_score: float
     technical_debt: float
@@ -30,17 +60,211 @@ class CostMetrics:
     team_familiarity: float
 
 
-@dataclass
+class ReasonFlag(IntFlag):
+    """Reasoning findings behind a recommendation, in display order."""
+    MODIFY_CHEAPER = 1 << 0
+    GENERATE_CHEAPER = 1 << 1
+    COSTS_SIMILAR = 1 << 2
+    SMALL_SCOPE = 1 << 3
+    LARGE_SCOPE = 1 << 4
+    MEDIUM_SCOPE = 1 << 5
+    HIGH_DEBT = 1 << 6
+    LOW_DEBT = 1 << 7
+    EXCELLENT_COVERAGE = 1 << 8
+    POOR_COVERAGE = 1 << 9
+    STRONG_HISTORY = 1 << 10
+    WEAK_HISTORY = 1 << 11
+
+
+class RiskFlag(IntFlag):
+    """Risk factors of a recommendation, in display order."""
+    HIGH_DEBT = 1 << 0
+    LOW_COVERAGE = 1 << 1
+    HIGH_COMPLEXITY = 1 << 2
+    MANY_DEPENDENCIES = 1 << 3
+    LARGE_SCOPE = 1 << 4
+    POOR_HISTORY = 1 << 5
+    MANY_ITERATIONS = 1 << 6
+    IMMATURE_FRAMEWORK = 1 << 7
+
+
+@dataclass(slots=True)
 class CostEstimate:
-    """Cost estimation result."""
+    """
+    Cost estimation result.
+    
+    Reasoning and risk factors are stored as flags; the human-readable
+    ``reasoning`` and ``risk_factors`` lists are only formatted on access.
+    """
     modify_cost: float
     generate_cost: float
     recommended_action: str  # 'modify', 'generate', 'hybrid'
     confidence: float
-    reasoning: List[str]
-    risk_factors: List[str]
     estimated_time_hours: float
     success_probability: float
+    reasoning_flags: int = 0  # ReasonFlag bits
+    risk_flags: int = 0  # RiskFlag bits
+    metrics: Optional[CostMetrics] = None  # Source of the values quoted in reasoning
+    
+    @property
+    def reasoning(self) -> List[str]:
+        """Human-readable reasoning for the recommendation."""
+        return _format_reasoning(self.reasoning_flags, self.modify_cost,
+                                 self.generate_cost, self.metrics)
+    
+    @property
+    def risk_factors(self) -> List[str]:
+        """Human-readable risk factors."""
+        return _messages_for_mask(self.risk_flags, _RISK_MESSAGES)
+
+
+# Risk factor messages, indexed by RiskFlag bit position
+_RISK_MESSAGES = (
+    "Very high technical debt may cause unexpected issues",
+    "Low test coverage increases chance of regressions",
+    "High complexity makes changes unpredictable",
+    "Many dependencies increase integration risks",
+    "Large scope changes are inherently risky",
+    "Poor historical performance indicates systemic issues",
+    "Many iterations suggest fundamental problems",
+    "Immature framework increases generation complexity",
+)
+
+# Optimization suggestions, indexed by bit position in the suggestion mask
+_SUGGESTION_MESSAGES = (
+    "Refactor high-debt areas to reduce future modification costs",
+    "Improve test coverage to reduce modification risks and costs",
+    "Simplify complex components to reduce change impact",
+    "Consider consolidating or removing unnecessary dependencies",
+    "Analyze past failures to improve future success rates",
+)
+
+
+def _messages_for_mask(mask: int, messages: Tuple[str, ...]) -> List[str]:
+    """Return the messages whose bit is set in mask, in bit order."""
+    if not mask:
+        return []
+    return [message for bit, message in enumerate(messages) if mask >> bit & 1]
+
+
+# Reasoning templates in display order, keyed by the flag that selects them
+_REASONING_TEMPLATES = (
+    (ReasonFlag.MODIFY_CHEAPER, "Modification is significantly cheaper ({modify_cost:.1f} vs {generate_cost:.1f})"),
+    (ReasonFlag.GENERATE_CHEAPER, "Generation is significantly cheaper ({generate_cost:.1f} vs {modify_cost:.1f})"),
+    (ReasonFlag.COSTS_SIMILAR, "Costs are similar (modify: {modify_cost:.1f}, generate: {generate_cost:.1f})"),
+    (ReasonFlag.SMALL_SCOPE, "Small scope of changes ({scope_pct:.0f}%) favors modification"),
+    (ReasonFlag.LARGE_SCOPE, "Large scope of changes ({scope_pct:.0f}%) favors generation"),
+    (ReasonFlag.MEDIUM_SCOPE, "Medium scope of changes ({scope_pct:.0f}%)"),
+    (ReasonFlag.HIGH_DEBT, "High technical debt ({technical_debt:.1f}) suggests fresh start"),
+    (ReasonFlag.LOW_DEBT, "Low technical debt ({technical_debt:.1f}) supports modification"),
+    (ReasonFlag.EXCELLENT_COVERAGE, "Excellent test coverage ({coverage_pct:.0f}%) reduces modification risk"),
+    (ReasonFlag.POOR_COVERAGE, "Poor test coverage ({coverage_pct:.0f}%) increases modification risk"),
+    (ReasonFlag.STRONG_HISTORY, "Strong historical success rate ({history_pct:.0f}%)"),
+    (ReasonFlag.WEAK_HISTORY, "Weak historical success rate ({history_pct:.0f}%) suggests trying new approach"),
+)
+
+# Reasoning flags whose templates only quote the two costs
+_COST_REASONS = ReasonFlag.MODIFY_CHEAPER | ReasonFlag.GENERATE_CHEAPER | ReasonFlag.COSTS_SIMILAR
+
+
+def _format_reasoning(flags: int, modify_cost: float, generate_cost: float,
+                      metrics: Optional[CostMetrics]) -> List[str]:
+    """Format the reasoning lines selected by flags, in flag order."""
+    values = {'modify_cost': modify_cost, 'generate_cost': generate_cost}
+    if metrics is None:
+        # The remaining templates quote metric values
+        flags &= _COST_REASONS
+    else:
+        values['scope_pct'] = metrics.modification_scope * 100
+        values['technical_debt'] = metrics.technical_debt
+        values['coverage_pct'] = metrics.test_coverage * 100
+        values['history_pct'] = metrics.historical_success_rate * 100
+    
+    if not flags:
+        return []
+    return [template.format_map(values) for flag, template in _REASONING_TEMPLATES if flags & flag]
+
+
+class _MetricsAnalysis(NamedTuple):
+    """Threshold findings for one set of metrics, as plain int bitmasks."""
+    reason_mask: int  # ReasonFlag bits
+    risk_mask: int  # RiskFlag bits
+    suggestion_mask: int  # Bits into _SUGGESTION_MESSAGES
+
+
+def _copy_estimate(estimate: CostEstimate) -> CostEstimate:
+    """Copy a memoized estimate so callers cannot mutate the cached one."""
+    # Positional construction is several times cheaper than dataclasses.replace()
+    return CostEstimate(
+        estimate.modify_cost, estimate.generate_cost, estimate.recommended_action,
+        estimate.confidence, estimate.estimated_time_hours, estimate.success_probability,
+        estimate.reasoning_flags, estimate.risk_flags, estimate.metrics
+    )
+
+
+def _recommend_by_cost(cost_ratio: float) -> str:
+    """Recommended action from the modify/generate cost ratio alone."""
+    if cost_ratio < 0.7:
+        return 'modify'
+    elif cost_ratio > 1.4:
+        return 'generate'
+    else:
+        return 'hybrid'  # Consider hybrid approach
+
+
+def _make_modify_cost(base_cost: float, complexity_multiplier: float, debt_penalty: float,
+                      scope_multiplier: float, dependency_factor: float,
+                      test_bonus: float) -> Callable[..., float]:
+    """
+    Specialize the modification cost formula for one configuration.
+    
+    The config values are folded into closure constants so the returned
+    function only takes the per-metrics scalars.
+    """
+    log = math.log
+    sqrt = math.sqrt
+    scope_cost_factor = scope_multiplier * base_cost
+    
+    def modify_cost(lines_of_code: int, complexity_score: float, technical_debt: float,
+                    modification_scope: float, dependencies_count: int, test_coverage: float,
+                    historical_success_rate: float) -> float:
+        """Cost of modifying existing code."""
+        total_cost = (
+            base_cost +
+            (log(lines_of_code) / _LOG_1000 * 5 if lines_of_code > 1 else 0.0) +  # Size, with diminishing returns
+            complexity_score * complexity_multiplier +
+            technical_debt * debt_penalty +
+            modification_scope * scope_cost_factor +  # More changes = higher cost
+            sqrt(dependencies_count) * dependency_factor +
+            (1 - test_coverage) * test_bonus  # Good tests make modification cheaper
+        ) * (1.5 - historical_success_rate)  # Historical success bonus/penalty
+        
+        return total_cost if total_cost > 1.0 else 1.0  # Minimum cost of 1.0
+    
+    return modify_cost
+
+
+def _make_generate_cost(base_cost: float) -> Callable[..., float]:
+    """Specialize the generation cost formula for one base cost."""
+    sqrt = math.sqrt
+    
+    def generate_cost(lines_of_code: int, framework_maturity: float, team_familiarity: float,
+                      dependencies_count: int, iteration_count: int,
+                      test_coverage: float) -> float:
+        """Cost of generating new code."""
+        total_cost = (
+            base_cost +
+            sqrt(lines_of_code) / 10 +  # Scale by target size
+            (1 - framework_maturity) * 10 +  # Mature frameworks are easier to generate for
+            (1 - team_familiarity) * 8 +  # Team familiarity bonus
+            dependencies_count * 2 +  # Need to recreate integrations
+            iteration_count * 2 +  # Context switching across iterations
+            test_coverage * lines_of_code * 0.01  # Test recreation cost
+        )
+        
+        return total_cost if total_cost > 5.0 else 5.0  # Minimum cost of 5.0
+    
+    return generate_cost
 
 
 class CostCalculator:
@@ -64,10 +288,24 @@ class CostCalculator:
         self.complexity_multiplier = self.config['costs']['complexity_multiplier']
         self.debt_penalty = self.config['costs']['debt_penalty']
         self.scope_multiplier = self.config['costs']['scope_multiplier']
+        self.dependency_factor = self.config['costs']['dependency_factor']
+        self.test_bonus = self.config['costs']['test_bonus']
+        
+        # Cost formulas specialized for this configuration
+        self._modify_cost = _make_modify_cost(
+            self.modify_base_cost, self.complexity_multiplier, self.debt_penalty,
+            self.scope_multiplier, self.dependency_factor, self.test_bonus
+        )
+        self._generate_cost = _make_generate_cost(self.generate_base_cost)
         
         # Thresholds
         self.modify_threshold = self.config['thresholds']['prefer_modify_below']
         self.generate_threshold = self.config['thresholds']['prefer_generate_above']
+        self.high_debt_threshold = self.config['thresholds']['high_debt_threshold']
+        self.low_coverage_threshold = self.config['thresholds']['low_coverage_threshold']
+        
+        # Estimates memoized by metrics value; the config is fixed after __init__
+        self._estimate_cache: Dict[CostMetrics, CostEstimate] = {}
         
     def _default_config(self) -> Dict[str, Any]:
         """Default cost calculation configuration."""
@@ -108,23 +346,45 @@ class CostCalculator:
         """
         logger.info(f"Calculating costs for {metrics.lines_of_code} LOC project")
         
-        # Calculate modification cost
-        modify_cost = self._calculate_modify_cost(metrics)
-        
-        # Calculate generation cost
-        generate_cost = self._calculate_generate_cost(metrics)
+        estimate = self._estimate_cache.get(metrics)
+        if estimate is None:
+            # Calculate modification cost
+            modify_cost = self._calculate_modify_cost(metrics)
+            
+            # Calculate generation cost
+            generate_cost = self._calculate_generate_cost(metrics)
+            
+            estimate = self._cache_estimate(
+                metrics, self._build_estimate(metrics, modify_cost, generate_cost)
+            )
         
-        # Determine recommendation
-        cost_ratio = modify_cost / generate_cost if generate_cost > 0 else float('inf')
-        recommendation = self._determine_recommendation(metrics, cost_ratio)
+        return _copy_estimate(estimate)
+    
+    def _cache_estimate(self, metrics: CostMetrics, estimate: CostEstimate) -> CostEstimate:
+        """Memoize an estimate, evicting the oldest entry when the cache is full."""
+        cache = self._estimate_cache
+        if len(cache) >= _ESTIMATE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[metrics] = estimate
+        return estimate
+    
+    def _build_estimate(self, metrics: CostMetrics, modify_cost: float,
+                        generate_cost: float) -> CostEstimate:
+        """Build the full estimate once both costs are known."""
+        # Determine recommendation; strong indicators decide without the cost ratio
+        recommendation = self._strong_recommendation(metrics)
+        if recommendation is None:
+            cost_ratio = modify_cost / generate_cost if generate_cost > 0 else float('inf')
+            recommendation = _recommend_by_cost(cost_ratio)
+        else:
+            cost_ratio = None
         
         # Calculate confidence and success probability
         confidence = self._calculate_confidence(metrics, cost_ratio)
         success_prob = self._calculate_success_probability(metrics, recommendation)
         
         # Generate reasoning and risk factors
-        reasoning = self._generate_reasoning(metrics, modify_cost, generate_cost, recommendation)
-        risk_factors = self._identify_risk_factors(metrics)
+        analysis = self._analyze_metrics(metrics, modify_cost, generate_cost)
         
         # Estimate time
         estimated_time = self._estimate_time_hours(metrics, recommendation)
@@ -134,255 +394,209 @@ class CostCalculator:
             generate_cost=generate_cost,
             recommended_action=recommendation,
             confidence=confidence,
-            reasoning=reasoning,
-            risk_factors=risk_factors,
             estimated_time_hours=estimated_time,
-            success_probability=success_prob
+            success_probability=success_prob,
+            reasoning_flags=analysis.reason_mask,
+            risk_flags=analysis.risk_mask,
+            metrics=metrics
         )
     
     def _calculate_modify_cost(self, metrics: CostMetrics) -> float:
         """Calculate the cost of modifying existing code."""
-        base_cost = self.modify_base_cost
-        
-        # Scale by lines of code (with diminishing returns)
-        loc_factor = math.log(max(metrics.lines_of_code, 1)) / math.log(1000)
-        
-        # Complexity penalty
-        complexity_penalty = metrics.complexity_score * self.complexity_multiplier
-        
-        # Technical debt penalty
-        debt_penalty = metrics.technical_debt * self.debt_penalty
-        
-        # Scope multiplier - more changes = higher cost
-        scope_cost = metrics.modification_scope * self.scope_multiplier * base_cost
-        
-        # Dependencies penalty
-        dep_penalty = math.sqrt(metrics.dependencies_count) * self.config['costs']['dependency_factor']
-        
-        # Test coverage bonus (good tests make modification safer/cheaper)
-        test_bonus = (1 - metrics.test_coverage) * self.config['costs']['test_bonus']
-        
-        # Historical success bonus/penalty
-        history_factor = 1.0 + (0.5 - metrics.historical_success_rate)
-        
-        total_cost = (
-            base_cost + 
-            loc_factor * 5 +
-            complexity_penalty +
-            debt_penalty +
-            scope_cost +
-            dep_penalty +
-            test_bonus
-        ) * history_factor
-        
-        return max(total_cost, 1.0)  # Minimum cost of 1.0
+        return self._modify_cost(
+            metrics.lines_of_code, metrics.complexity_score, metrics.technical_debt,
+            metrics.modification_scope, metrics.dependencies_count, metrics.test_coverage,
+            metrics.historical_success_rate
+        )
     
     def _calculate_generate_cost(self, metrics: CostMetrics) -> float:
         """Calculate the cost of generating new code."""
-        base_cost = self.generate_base_cost
-        
-        # Scale by target size (estimated from existing code)
-        size_factor = math.sqrt(metrics.lines_of_code) / 10
-        
-        # Framework maturity bonus (mature frameworks are easier to generate for)
-        framework_bonus = (1 - metrics.framework_maturity) * 10
-        
-        # Team familiarity bonus
-        familiarity_bonus = (1 - metrics.team_familiarity) * 8
+        return self._generate_cost(
+            metrics.lines_of_code, metrics.framework_maturity, metrics.team_familiarity,
+            metrics.dependencies_count, metrics.iteration_count, metrics.test_coverage
+        )
+    
+    def _calculate_costs_batch(self, metrics_list: List[CostMetrics]) -> Tuple[List[float], List[float]]:
+        """
+        Calculate modify and generate costs for many metrics in one pass.
         
-        # Dependencies cost (need to recreate integrations)
-        dep_cost = metrics.dependencies_count * 2
+        The metrics are transposed into per-field columns and both cost
+        functions are mapped over them, so the per-item loop runs in C.
         
-        # Iteration penalty (more iterations = higher cost due to context switching)
-        iteration_penalty = metrics.iteration_count * 2
+        Args:
+            metrics_list: Metrics to evaluate
+            
+        Returns:
+            Tuple of (modify_costs, generate_costs), aligned with metrics_list
+        """
+        if not metrics_list:
+            return [], []
         
-        # Test recreation cost
-        test_recreation_cost = metrics.test_coverage * metrics.lines_of_code * 0.01
+        (loc, complexity, debt, scope, deps, coverage, history,
+         iterations, maturity, familiarity) = zip(*map(_COST_FIELDS, metrics_list))
         
-        total_cost = (
-            base_cost +
-            size_factor +
-            framework_bonus +
-            familiarity_bonus +
-            dep_cost +
-            iteration_penalty +
-            test_recreation_cost
-        )
+        modify_costs = list(map(
+            self._modify_cost, loc, complexity, debt, scope, deps, coverage, history
+        ))
+        generate_costs = list(map(
+            self._generate_cost, loc, maturity, familiarity, deps, iterations, coverage
+        ))
         
-        return max(total_cost, 5.0)  # Minimum cost of 5.0
+        return modify_costs, generate_costs
     
     def _determine_recommendation(self, metrics: CostMetrics, cost_ratio: float) -> str:
         """Determine the recommended action based on metrics and cost ratio."""
+        return self._strong_recommendation(metrics) or _recommend_by_cost(cost_ratio)
+    
+    def _strong_recommendation(self, metrics: CostMetrics) -> Optional[str]:
+        """Return the action implied by strong metric indicators, if any."""
+        scope = metrics.modification_scope
+        debt = metrics.technical_debt
+        
         # Strong indicators for modification
-        if (metrics.modification_scope < self.modify_threshold and 
-            metrics.technical_debt < self.config['thresholds']['high_debt_threshold'] and
-            metrics.test_coverage > self.config['thresholds']['low_coverage_threshold']):
+        if (scope < self.modify_threshold and 
+            debt < self.high_debt_threshold and
+            metrics.test_coverage > self.low_coverage_threshold):
             return 'modify'
         
         # Strong indicators for generation
-        if (metrics.modification_scope > self.generate_threshold or
-            metrics.technical_debt > self.config['thresholds']['high_debt_threshold'] * 1.5 or
+        if (scope > self.generate_threshold or
+            debt > self.high_debt_threshold * 1.5 or
             metrics.historical_success_rate < 0.3):
             return 'generate'
         
-        # Cost-based decision
-        if cost_ratio < 0.7:
-            return 'modify'
-        elif cost_ratio > 1.4:
-            return 'generate'
-        else:
-            return 'hybrid'  # Consider hybrid approach
+        return None
     
-    def _calculate_confidence(self, metrics: CostMetrics, cost_ratio: float) -> float:
-        """Calculate confidence in the recommendation."""
-        confidence_factors = []
-        
-        # Strong cost difference increases confidence
-        if cost_ratio < 0.5 or cost_ratio > 2.0:
-            confidence_factors.append(0.9)
-        elif 0.7 < cost_ratio < 1.3:
-            confidence_factors.append(0.4)  # Close costs = low confidence
-        else:
-            confidence_factors.append(0.7)
+    def _calculate_confidence(self, metrics: CostMetrics, cost_ratio: Optional[float]) -> float:
+        """
+        Calculate confidence in the recommendation.
         
-        # Good test coverage increases confidence
-        if metrics.test_coverage > 0.8:
-            confidence_factors.append(0.8)
-        elif metrics.test_coverage < 0.3:
-            confidence_factors.append(0.3)
-        else:
-            confidence_factors.append(0.6)
+        A cost_ratio of None means a strong metric indicator decided the
+        recommendation, which counts as fully decisive for the cost factor.
+        """
+        # Strong cost difference increases confidence, close costs lower it
+        cost_factor = (0.9 if cost_ratio is None or cost_ratio < 0.5 or cost_ratio > 2.0
+                       else 0.4 if 0.7 < cost_ratio < 1.3
+                       else 0.7)
         
-        # Historical success rate
-        confidence_factors.append(metrics.historical_success_rate)
+        # Good test coverage increases confidence
+        coverage = metrics.test_coverage
+        coverage_factor = 0.8 if coverage > 0.8 else 0.3 if coverage < 0.3 else 0.6
         
         # Clear scope boundaries
-        if metrics.modification_scope < 0.2 or metrics.modification_scope > 0.8:
-            confidence_factors.append(0.8)
-        else:
-            confidence_factors.append(0.5)
+        scope = metrics.modification_scope
+        scope_factor = 0.8 if scope < 0.2 or scope > 0.8 else 0.5
         
-        return sum(confidence_factors) / len(confidence_factors)
+        # Average with the historical success rate as the fourth factor
+        return (cost_factor + coverage_factor + metrics.historical_success_rate + scope_factor) / 4
     
     def _calculate_success_probability(self, metrics: CostMetrics, recommendation: str) -> float:
         """Calculate the probability of success for the recommendation."""
         base_prob = 0.7  # Base probability
         
-        # Adjust based on recommendation type
+        # Adjust based on recommendation type, each factor weighted 0.25
         if recommendation == 'modify':
             # Modification success factors
-            factors = [
-                metrics.test_coverage,  # Good tests help
-                1 - metrics.modification_scope,  # Smaller scope = higher success
-                1 - (metrics.technical_debt / 100),  # Less debt = higher success
-                metrics.historical_success_rate,  # Historical performance
-            ]
+            weighted_score = (
+                metrics.test_coverage * 0.25 +  # Good tests help
+                (1 - metrics.modification_scope) * 0.25 +  # Smaller scope = higher success
+                (1 - (metrics.technical_debt / 100)) * 0.25 +  # Less debt = higher success
+                metrics.historical_success_rate * 0.25  # Historical performance
+            )
         elif recommendation == 'generate':
             # Generation success factors
-            factors = [
-                metrics.framework_maturity,  # Mature frameworks
-                metrics.team_familiarity,  # Team experience
-                1 - (metrics.complexity_score / 10),  # Less complexity
-                0.8,  # Fresh start bonus
-            ]
+            weighted_score = (
+                metrics.framework_maturity * 0.25 +  # Mature frameworks
+                metrics.team_familiarity * 0.25 +  # Team experience
+                (1 - (metrics.complexity_score / 10)) * 0.25 +  # Less complexity
+                0.8 * 0.25  # Fresh start bonus
+            )
         else:  # hybrid
-            factors = [0.6, 0.6, 0.6]  # Moderate across the board
+            weighted_score = _HYBRID_SUCCESS_SCORE  # Moderate across the board
         
-        # Weight and combine factors
-        weighted_score = sum(f * 0.25 for f in factors)
         success_prob = base_prob * (0.5 + weighted_score)
         
-        return min(max(success_prob, 0.1), 0.95)  # Clamp between 10% and 95%
+        # Clamp between 10% and 95%
+        return 0.1 if success_prob < 0.1 else 0.95 if success_prob > 0.95 else success_prob
     
     def _generate_reasoning(self, metrics: CostMetrics, modify_cost: float, 
                           generate_cost: float, recommendation: str) -> List[str]:
         """Generate human-readable reasoning for the recommendation."""
-        reasoning = []
-        
-        cost_ratio = modify_cost / generate_cost if generate_cost > 0 else float('inf')
-        
-        # Cost comparison
-        if cost_ratio < 0.8:
-            reasoning.append(f"Modification is significantly cheaper ({modify_cost:.1f} vs {generate_cost:.1f})")
-        elif cost_ratio > 1.2:
-            reasoning.append(f"Generation is significantly cheaper ({generate_cost:.1f} vs {modify_cost:.1f})")
-        else:
-            reasoning.append(f"Costs are similar (modify: {modify_cost:.1f}, generate: {generate_cost:.1f})")
-        
-        # Scope analysis
-        scope_pct = metrics.modification_scope * 100
-        if scope_pct < 30:
-            reasoning.append(f"Small scope of changes ({scope_pct:.0f}%) favors modification")
-        elif scope_pct > 70:
-            reasoning.append(f"Large scope of changes ({scope_pct:.0f}%) favors generation")
-        else:
-            reasoning.append(f"Medium scope of changes ({scope_pct:.0f}%)")
-        
-        # Technical debt
-        if metrics.technical_debt > 50:
-            reasoning.append(f"High technical debt ({metrics.technical_debt:.1f}) suggests fresh start")
-        elif metrics.technical_debt < 20:
-            reasoning.append(f"Low technical debt ({metrics.technical_debt:.1f}) supports modification")
-        
-        # Test coverage
-        coverage_pct = metrics.test_coverage * 100
-        if coverage_pct > 80:
-            reasoning.append(f"Excellent test coverage ({coverage_pct:.0f}%) reduces modification risk")
-        elif coverage_pct < 40:
-            reasoning.append(f"Poor test coverage ({coverage_pct:.0f}%) increases modification risk")
-        
-        # Historical performance
-        history_pct = metrics.historical_success_rate * 100
-        if history_pct > 80:
-            reasoning.append(f"Strong historical success rate ({history_pct:.0f}%)")
-        elif history_pct < 50:
-            reasoning.append(f"Weak historical success rate ({history_pct:.0f}%) suggests trying new approach")
-        
-        return reasoning
+        reason_mask = self._analyze_metrics(metrics, modify_cost, generate_cost).reason_mask
+        return _format_reasoning(reason_mask, modify_cost, generate_cost, metrics)
     
     def _identify_risk_factors(self, metrics: CostMetrics) -> List[str]:
         """Identify potential risk factors."""
-        risks = []
-        
-        if metrics.technical_debt > 60:
-            risks.append("Very high technical debt may cause unexpected issues")
-        
-        if metrics.test_coverage < 0.3:
-            risks.append("Low test coverage increases chance of regressions")
-        
-        if metrics.complexity_score > 8:
-            risks.append("High complexity makes changes unpredictable")
-        
-        if metrics.dependencies_count > 20:
-            risks.append("Many dependencies increase integration risks")
-        
-        if metrics.modification_scope > 0.8:
-            risks.append("Large scope changes are inherently risky")
+        return _messages_for_mask(self._analyze_metrics(metrics).risk_mask, _RISK_MESSAGES)
+    
+    def _analyze_metrics(self, metrics: CostMetrics, modify_cost: Optional[float] = None,
+                         generate_cost: Optional[float] = None) -> _MetricsAnalysis:
+        """
+        Run every reasoning, risk and suggestion threshold check in one pass.
         
-        if metrics.historical_success_rate < 0.4:
-            risks.append("Poor historical performance indicates systemic issues")
+        Findings are packed into integer bitmasks; no strings are formatted here.
         
-        if metrics.iteration_count > 10:
-            risks.append("Many iterations suggest fundamental problems")
+        Args:
+            metrics: Code and project metrics
+            modify_cost: Modification cost; the cost comparison flag is only
+                set when both costs are given
+            generate_cost: Generation cost
+            
+        Returns:
+            _MetricsAnalysis with reasoning, risk and suggestion masks
+        """
+        debt = metrics.technical_debt
+        coverage = metrics.test_coverage
+        complexity = metrics.complexity_score
+        dependencies = metrics.dependencies_count
+        scope = metrics.modification_scope
+        history = metrics.historical_success_rate
+        
+        # Cost comparison: MODIFY_CHEAPER / GENERATE_CHEAPER / COSTS_SIMILAR
+        reason_mask = 0
+        if modify_cost is not None and generate_cost is not None:
+            cost_ratio = modify_cost / generate_cost if generate_cost > 0 else float('inf')
+            reason_mask = 1 if cost_ratio < 0.8 else 2 if cost_ratio > 1.2 else 4
+        
+        # Remaining reasoning groups, one ReasonFlag bit pair/triple each
+        scope_pct = scope * 100
+        coverage_pct = coverage * 100
+        history_pct = history * 100
+        reason_mask |= (
+            (1 if scope_pct < 30 else 2 if scope_pct > 70 else 4) << 3 |  # *_SCOPE
+            ((debt > 50) | (debt < 20) << 1) << 6 |  # HIGH_DEBT / LOW_DEBT
+            ((coverage_pct > 80) | (coverage_pct < 40) << 1) << 8 |  # *_COVERAGE
+            ((history_pct > 80) | (history_pct < 50) << 1) << 10  # *_HISTORY
+        )
         
-        if metrics.framework_maturity < 0.5:
-            risks.append("Immature framework increases generation complexity")
+        # Risk factors (RiskFlag bits) and suggestions (_SUGGESTION_MESSAGES bits)
+        risk_mask = (
+            (debt > 60) |
+            (coverage < 0.3) << 1 |
+            (complexity > 8) << 2 |
+            (dependencies > 20) << 3 |
+            (scope > 0.8) << 4 |
+            (history < 0.4) << 5 |
+            (metrics.iteration_count > 10) << 6 |
+            (metrics.framework_maturity < 0.5) << 7
+        )
+        suggestion_mask = (
+            (debt > 40) |
+            (coverage < 0.6) << 1 |
+            (complexity > 6) << 2 |
+            (dependencies > 15) << 3 |
+            (history < 0.6) << 4
+        )
         
-        return risks
+        return _MetricsAnalysis(reason_mask, risk_mask, suggestion_mask)
     
     def _estimate_time_hours(self, metrics: CostMetrics, recommendation: str) -> float:
         """Estimate time in hours for the recommended approach."""
-        base_hours = {
-            'modify': 4.0,
-            'generate': 12.0,
-            'hybrid': 8.0
-        }
-        
-        hours = base_hours[recommendation]
+        hours = _BASE_HOURS[recommendation]
         
-        # Scale by size
-        size_factor = math.log(max(metrics.lines_of_code, 100)) / math.log(1000)
-        hours *= (0.5 + size_factor)
+        # Scale by size; projects at or below the 100 LOC floor share one factor
+        loc = metrics.lines_of_code
+        hours *= (0.5 + math.log(loc) / _LOG_1000) if loc > 100 else _MIN_TIME_SIZE_SCALE
         
         # Complexity adjustment
         hours *= (1 + metrics.complexity_score / 10)
@@ -411,21 +625,38 @@ class CostCalculator:
         Returns:
             Comparison analysis with recommendations
         """
+        logger.info(f"Calculating costs for {len(iteration_metrics)} iterations")
+        
+        # Dedupe the metrics and resolve memoized estimates in a single dict
+        # build, then score the remaining distinct values in one batch
+        cached = self._estimate_cache.get
+        estimates = {metrics: cached(metrics) for metrics in map(_SECOND, iteration_metrics)}
+        pending = [metrics for metrics, estimate in estimates.items() if estimate is None]
+        
+        modify_costs, generate_costs = self._calculate_costs_batch(pending)
+        for metrics, modify_cost, generate_cost in zip(pending, modify_costs, generate_costs):
+            estimates[metrics] = self._cache_estimate(
+                metrics, self._build_estimate(metrics, modify_cost, generate_cost)
+            )
+        
+        # Build the per-iteration analyses and track the cheapest iteration per
+        # recommended action in the same pass
         analyses = {}
-        
+        best_modify = None
+        best_generate = None
+        best_modify_cost = math.inf
+        best_generate_cost = math.inf
         for iteration_id, metrics in iteration_metrics:
-            analyses[iteration_id] = self.calculate_cost(metrics)
-        
-        # Find best options
-        best_modify = min(
-            (id, analysis) for id, analysis in analyses.items() 
-            if analysis.recommended_action == 'modify'
-        ) if any(a.recommended_action == 'modify' for a in analyses.values()) else None
-        
-        best_generate = min(
-            (id, analysis) for id, analysis in analyses.items()
-            if analysis.recommended_action == 'generate'
-        ) if any(a.recommended_action == 'generate' for a in analyses.values()) else None
+            analysis = analyses[iteration_id] = _copy_estimate(estimates[metrics])
+            action = analysis.recommended_action
+            if action == 'modify':
+                if analysis.modify_cost < best_modify_cost:
+                    best_modify_cost = analysis.modify_cost
+                    best_modify = (iteration_id, analysis)
+            elif action == 'generate':
+                if analysis.generate_cost < best_generate_cost:
+                    best_generate_cost = analysis.generate_cost
+                    best_generate = (iteration_id, analysis)
         
         # Overall recommendation
         if best_modify and best_generate:
@@ -450,21 +681,5 @@ class CostCalculator:
     
     def get_optimization_suggestions(self, metrics: CostMetrics) -> List[str]:
         """Get suggestions for optimizing the codebase to reduce future costs."""
-        suggestions = []
-        
-        if metrics.technical_debt > 40:
-            suggestions.append("Refactor high-debt areas to reduce future modification costs")
-        
-        if metrics.test_coverage < 0.6:
-            suggestions.append("Improve test coverage to reduce modification risks and costs")
-        
-        if metrics.complexity_score > 6:
-            suggestions.append("Simplify complex components to reduce change impact")
-        
-        if metrics.dependencies_count > 15:
-            suggestions.append("Consider consolidating or removing unnecessary dependencies")
-        
-        if metrics.historical_success_rate < 0.6:
-            suggestions.append("Analyze past failures to improve future success rates")
-        
-        return suggestions
+        return _messages_for_mask(self._analyze_metrics(metrics).suggestion_mask,
+                                  _SUGGESTION_MESSAGES)
@@ -7,21 +7,98 @@ with Docker Compose integration and transparent volume mounting.
 """
 
 import os
+import sys
+import copy
 import shutil
 import json
 import yaml
 import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 # Set to WARNING to suppress verbose INFO logs that break clean progress display
 logger.setLevel(logging.WARNING)
 
+# Vendored, generated and VCS directories that are never part of the code
+_SKIP_DIRS = frozenset({
+    'node_modules', '.git', '__pycache__', 'venv', '.venv', 'dist', 'build', 'target'
+})
 
-@dataclass
+# Read size for line counting
+_READ_CHUNK = 64 * 1024
+# Per-thread read buffer reused by every _count_lines call
+_line_buffers = threading.local()
+
+# Languages recognised by their file extension
+_LANGUAGE_EXTENSIONS = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.java': 'java',
+    '.php': 'php',
+    '.rb': 'ruby'
+}
+
+# Extensions counted as code and config files in code metrics
+_CODE_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.go', '.rs', '.java'})
+_CONFIG_EXTENSIONS = frozenset({'.json', '.yaml', '.yml', '.toml', '.ini'})
+
+# Candidate paths in priority order, relative to the iteration root
+_DOCKERFILE_LOCATIONS = ("Dockerfile", "docker/Dockerfile", "src/Dockerfile")
+_COMPOSE_LOCATIONS = ("docker-compose.yml", "docker/docker-compose.yml", "compose.yml")
+_ENTRY_POINTS = ("main.py", "app.py", "server.py", "index.js", "server.js", "app.js")
+# Each entry point is looked for under src/ first, then at the root
+_ENTRY_POINT_PATHS = tuple(
+    candidate for entry in _ENTRY_POINTS for candidate in (f"src/{entry}", entry)
+)
+# Top-level files a child iteration inherits from its parent
+_INHERITED_FILES = ("requirements.txt", "package.json", "Dockerfile", "docker-compose.yml")
+
+# Framework markers in priority order: (requirements.txt substring, framework)
+_PYTHON_FRAMEWORKS = (('fastapi', 'fastapi'), ('flask', 'flask'), ('django', 'django'))
+# (package.json dependency, framework)
+_NODE_FRAMEWORKS = (('express', 'express'), ('next', 'nextjs'), ('react', 'react'))
+
+# Low-cardinality string fields interned when records are loaded
+_INTERNED_FIELDS = frozenset({'generation_type', 'status', 'docker_status'})
+
+# Docker states that mark an iteration as deployed
+_ACTIVE_DOCKER_STATUSES = frozenset({'running', 'deployed'})
+
+# Sort key for scans over iteration records
+_BY_TIMESTAMP = attrgetter('timestamp')
+
+# ioctl request for a copy-on-write file clone (Linux FICLONE)
+_FICLONE = 0x40049409
+
+# Iteration history: a JSON snapshot plus an append-only log of changes
+_HISTORY_FILE = "iteration_history.json"
+_HISTORY_LOG = "iteration_history.jsonl"
+# Fold the log into the snapshot once it grows past this multiple of it
+_COMPACT_RATIO = 4
+
+
+@dataclass(slots=True)
 class IterationInfo:
     """Information about a code iteration."""
     iteration_id: str
@@ -35,6 +112,49 @@ class IterationInfo:
     files_changed: List[str]
     docker_status: str
     performance_metrics: Dict[str, Any]
+    
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> 'IterationInfo':
+        """
+        Build a record from its JSON form.
+        
+        Decoded history may be shared between managers, so the list and dict
+        the record owns are copied. Low-cardinality strings are interned.
+        """
+        return cls(
+            item['iteration_id'],
+            datetime.fromisoformat(item['timestamp']),
+            item['description'],
+            item['parent_iteration'],
+            sys.intern(item['generation_type']),
+            sys.intern(item['status']),
+            item['cost_estimate'],
+            item['success_rate'],
+            list(item['files_changed']),
+            sys.intern(item['docker_status']),
+            dict(item['performance_metrics']),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the JSON form of the record.
+        
+        Containers are shared rather than deep-copied like asdict() would;
+        the result is meant to be serialized right away.
+        """
+        return {
+            'iteration_id': self.iteration_id,
+            'timestamp': self.timestamp.isoformat(),
+            'description': self.description,
+            'parent_iteration': self.parent_iteration,
+            'generation_type': self.generation_type,
+            'status': self.status,
+            'cost_estimate': self.cost_estimate,
+            'success_rate': self.success_rate,
+            'files_changed': self.files_changed,
+            'docker_status': self.docker_status,
+            'performance_metrics': self.performance_metrics,
+        }
 
 
 @dataclass
@@ -50,6 +170,165 @@ class ProjectStructure:
     test_files: List[str]
 
 
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every file under root in a single scandir pass.
+    
+    Directory entries carry their type from readdir, so only files that are
+    later asked for their size cost a stat call. Symlinked directories are
+    not followed, matching Path.rglob, and directories in _SKIP_DIRS are
+    pruned without being entered.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _suffix(name: str) -> str:
+    """
+    Return the lowercased extension of a file name, like os.path.splitext.
+    
+    Most names have no leading dot and an already-lowercase extension, so
+    they cost one rfind and a slice without lowering the whole name.
+    """
+    if name[:1] == '.':
+        suffix = os.path.splitext(name)[1]  # Leading dots do not start an extension
+    else:
+        dot = name.rfind('.')
+        suffix = name[dot:] if dot > 0 else ''
+    return suffix if suffix.islower() else suffix.lower()
+
+
+def _count_lines(path: str) -> Tuple[int, int]:
+    """
+    Count lines like len(readlines()) in text mode without building a list.
+    
+    Universal newlines are honoured: \\n, \\r and \\r\\n each end one line.
+    
+    Returns:
+        Tuple of (line_count, bytes_read); the byte count is the file size,
+        so callers need no separate stat call
+    """
+    buf = getattr(_line_buffers, 'buf', None)
+    if buf is None:
+        buf = _line_buffers.buf = bytearray(_READ_CHUNK)
+    
+    lines = 0
+    size = 0
+    last = 0x0A  # \n
+    with open(path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            size += n
+            lines += buf.count(b'\n', 0, n)
+            # One memchr rules out the two slower \r scans for \n-only text
+            if buf.find(b'\r', 0, n) >= 0:
+                lines += buf.count(b'\r', 0, n) - buf.count(b'\r\n', 0, n)
+            if last == 0x0D and buf[0] == 0x0A:
+                lines -= 1  # \r\n split across two reads
+            last = buf[n - 1]
+    # A final line without a line break still counts
+    return lines + (last not in (0x0A, 0x0D)), size
+
+
+@lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size) version."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file once per (path, mtime, size) version."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _stat_key(path: str) -> Optional[Tuple[str, int, int]]:
+    """Return the cache key for a file, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    Copy a file as a copy-on-write clone where the filesystem supports it.
+    
+    Btrfs, XFS and bcachefs share the source extents, so the copy costs only
+    metadata. Elsewhere this falls back to shutil.copy2, which already copies
+    in the kernel.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            pass  # Not supported here (EOPNOTSUPP, EXDEV, EINVAL...)
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes in history records as ISO strings."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _AnalysisCtx:
+    """
+    File lookups shared by the checks of one project analysis.
+    
+    Existence checks are answered from the paths of a single tree walk and
+    each file is read at most once, so requirements.txt and package.json are
+    opened once no matter how many checks look at them. Without a walk,
+    existence falls back to a stat per path.
+    """
+    
+    __slots__ = ('root', 'paths', 'contents', '_json')
+    
+    def __init__(self, root: Path, files: Optional[List[os.DirEntry]] = None):
+        self.root = str(root)
+        root_len = len(self.root) + 1
+        self.paths = None if files is None else {entry.path[root_len:] for entry in files}
+        self.contents: Dict[str, str] = {}
+        self._json: Dict[str, Any] = {}
+    
+    def exists(self, relative: str) -> bool:
+        """Check whether a file exists at a '/'-separated relative path."""
+        if self.paths is None:
+            return os.path.exists(os.path.join(self.root, relative))
+        return relative.replace('/', os.sep) in self.paths
+    
+    def read_text(self, relative: str) -> str:
+        """Read a file once and return its text."""
+        content = self.contents.get(relative)
+        if content is None:
+            with open(os.path.join(self.root, relative), 'r') as f:
+                content = self.contents[relative] = f.read()
+        return content
+    
+    def read_json(self, relative: str) -> Any:
+        """Parse a JSON file once and return the decoded data."""
+        if relative not in self._json:
+            self._json[relative] = json.loads(self.read_text(relative))
+        return self._json[relative]
+
+
 class IterationManager:
     """
     Manages iterative code generation with Docker deployment.
@@ -67,6 +346,8 @@ class IterationManager:
         self.iterations_dir = self.project_root / "iterations"
         self.deployments_dir = self.project_root / "deployments"
         self.config_path = config_path or str(self.project_root / "coval.config.yaml")
+        self.history_file = self.project_root / _HISTORY_FILE
+        self.history_log = self.project_root / _HISTORY_LOG
         
         # Ensure directories exist
         self.iterations_dir.mkdir(parents=True, exist_ok=True)
@@ -77,6 +358,10 @@ class IterationManager:
         
         # Track iterations
         self.iterations: Dict[str, IterationInfo] = {}
+        # Serializes history updates and snapshots across deploy threads
+        self.history_lock = threading.RLock()
+        # (record count, ID) of the newest iteration, found lazily
+        self._latest: Optional[Tuple[int, str]] = None
         self._load_iteration_history()
         
         # Setup logging
@@ -84,9 +369,10 @@ class IterationManager:
     
     def _load_config(self) -> Dict[str, Any]:
         """Load COVAL configuration."""
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+        key = _stat_key(self.config_path)
+        if key is not None:
+            # Managers are rebuilt per command; parse each file version once
+            return copy.deepcopy(_load_yaml_cached(*key))
         
         # Default configuration
         default_config = {
@@ -137,34 +423,105 @@ class IterationManager:
     
     def _load_iteration_history(self):
         """Load iteration history from disk."""
-        history_file = self.project_root / "iteration_history.json"
-        if history_file.exists():
+        key = _stat_key(str(self.history_file))
+        if key is not None:
             try:
-                with open(history_file, 'r') as f:
-                    data = json.load(f)
-                    for item in data:
-                        # Convert timestamp string back to datetime
-                        item['timestamp'] = datetime.fromisoformat(item['timestamp'])
-                        iteration = IterationInfo(**item)
-                        self.iterations[iteration.iteration_id] = iteration
+                for item in _load_json_cached(*key):
+                    iteration = IterationInfo.from_dict(item)
+                    self.iterations[iteration.iteration_id] = iteration
             except Exception as e:
                 logger.warning(f"Could not load iteration history: {e}")
+        
+        self._replay_history_log()
     
-    def _save_iteration_history(self):
-        """Save iteration history to disk."""
-        history_file = self.project_root / "iteration_history.json"
+    def _replay_history_log(self):
+        """Apply the changes logged since the last snapshot."""
         try:
-            data = []
-            for iteration in self.iterations.values():
-                item = asdict(iteration)
-                # Convert datetime to string for JSON serialization
-                item['timestamp'] = iteration.timestamp.isoformat()
-                data.append(item)
+            with open(self.history_log, 'r') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Could not read iteration history log: {e}")
+            return
+        
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                iteration_id = entry['iteration_id']
+                if entry.get('removed'):
+                    self.iterations.pop(iteration_id, None)
+                    continue
+                fields = entry['fields']
+                iteration = self.iterations.get(iteration_id)
+                if iteration is None:
+                    # New iterations are logged with every field
+                    self.iterations[iteration_id] = IterationInfo.from_dict(fields)
+                    continue
+                for key, value in fields.items():
+                    if key == 'timestamp':
+                        value = datetime.fromisoformat(value)
+                    elif key in _INTERNED_FIELDS:
+                        value = sys.intern(value)
+                    setattr(iteration, key, value)
+            except (ValueError, KeyError, TypeError) as e:
+                # A torn final line from an interrupted write is skipped too
+                logger.debug(f"Skipping unreadable history log entry: {e}")
+    
+    def history_fingerprint(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """Return (mtime_ns, size) of the history snapshot and log, None where missing."""
+        return tuple(
+            key and key[1:]
+            for key in (_stat_key(str(self.history_file)), _stat_key(str(self.history_log)))
+        )
+    
+    def reload(self):
+        """Reload iteration history from disk, replacing in-memory records."""
+        with self.history_lock:
+            self.iterations.clear()
+            self._latest = None
+            self._load_iteration_history()
+    
+    def _append_history(self, *entries: Dict[str, Any]):
+        """
+        Log iteration changes instead of rewriting the whole history.
+        
+        Args:
+            entries: {'iteration_id', 'fields'} records with the changed fields
+                (every field for a new iteration), or {'iteration_id', 'removed'}
+                records for deleted iterations
+        """
+        with self.history_lock:
+            try:
+                lines = ''.join(json.dumps(entry, default=_json_default) + '\n' for entry in entries)
+                with open(self.history_log, 'a') as f:
+                    f.write(lines)
+                    log_size = f.tell()
+            except Exception as e:
+                logger.error(f"Could not save iteration history: {e}")
+                return
             
-            with open(history_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save iteration history: {e}")
+            snapshot = _stat_key(str(self.history_file))
+            if snapshot is None or log_size > _COMPACT_RATIO * snapshot[2]:
+                self._save_iteration_history()
+    
+    def _save_iteration_history(self):
+        """Write a full history snapshot and drop the change log it covers."""
+        tmp_file = self.history_file.with_name(_HISTORY_FILE + ".tmp")
+        with self.history_lock:
+            try:
+                data = [iteration.to_dict() for iteration in self.iterations.values()]
+                
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.history_file)
+                
+                # Replaying the log over the new snapshot is harmless if this fails
+                self.history_log.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error(f"Could not save iteration history: {e}")
     
     def create_iteration(self, 
                         description: str, 
@@ -216,8 +573,13 @@ class IterationManager:
             performance_metrics={}
         )
         
+        # Creation times only grow, so the new iteration is normally the newest
+        latest_id = self.get_latest_iteration()
         self.iterations[iteration_id] = iteration_info
-        self._save_iteration_history()
+        if latest_id is None or self.iterations[latest_id].timestamp < timestamp:
+            latest_id = iteration_id
+        self._latest = (len(self.iterations), latest_id)
+        self._append_history({'iteration_id': iteration_id, 'fields': iteration_info.to_dict()})
         
         logger.debug(f"Created iteration {iteration_id}: {description}")
         return iteration_id
@@ -226,30 +588,36 @@ class IterationManager:
         """Copy base files from source iteration to target iteration."""
         # Copy source code
         if (source_path / "src").exists():
-            shutil.copytree(source_path / "src", target_path / "src", dirs_exist_ok=True)
+            shutil.copytree(source_path / "src", target_path / "src",
+                            copy_function=_clone_file, dirs_exist_ok=True)
         
         # Copy configuration files
-        for config_file in ["requirements.txt", "package.json", "Dockerfile", "docker-compose.yml"]:
+        for config_file in _INHERITED_FILES:
             source_file = source_path / config_file
             if source_file.exists():
-                shutil.copy2(source_file, target_path / config_file)
+                _clone_file(source_file, target_path / config_file)
         
         # Copy docker configuration
         if (source_path / "docker").exists():
-            shutil.copytree(source_path / "docker", target_path / "docker", dirs_exist_ok=True)
+            shutil.copytree(source_path / "docker", target_path / "docker",
+                            copy_function=_clone_file, dirs_exist_ok=True)
     
     def get_latest_iteration(self) -> Optional[str]:
         """Get the ID of the latest iteration."""
-        if not self.iterations:
-            return None
-        
-        return max(self.iterations.keys(), key=lambda x: self.iterations[x].timestamp)
+        latest = self._latest
+        if latest is None or latest[0] != len(self.iterations):
+            # Records were added or removed without going through create_iteration
+            newest = max(self.iterations.values(), key=_BY_TIMESTAMP, default=None)
+            if newest is None:
+                return None
+            latest = self._latest = (len(self.iterations), newest.iteration_id)
+        return latest[1]
     
     def get_active_iterations(self) -> List[str]:
         """Get list of iterations that are currently deployed."""
         return [
-            iteration_id for iteration_id, info in self.iterations.items()
-            if info.docker_status in ['running', 'deployed']
+            info.iteration_id for info in self.iterations.values()
+            if info.docker_status in _ACTIVE_DOCKER_STATUSES
         ]
     
     def get_iteration_path(self, iteration_id: str) -> Path:
@@ -258,15 +626,19 @@ class IterationManager:
     
     def update_iteration_status(self, iteration_id: str, status: str, **kwargs):
         """Update the status and metrics of an iteration."""
-        if iteration_id in self.iterations:
+        with self.history_lock:
+            if iteration_id not in self.iterations:
+                return
             self.iterations[iteration_id].status = status
+            changed = {'status': status}
             
             # Update other fields if provided
             for key, value in kwargs.items():
                 if hasattr(self.iterations[iteration_id], key):
                     setattr(self.iterations[iteration_id], key, value)
+                    changed[key] = value
             
-            self._save_iteration_history()
+            self._append_history({'iteration_id': iteration_id, 'fields': changed})
             logger.debug(f"Updated iteration {iteration_id} status to: {status}")
     
     def cleanup_old_iterations(self, keep_count: Optional[int] = None) -> List[str]:
@@ -282,11 +654,7 @@ class IterationManager:
         keep_count = keep_count or self.config['project']['cleanup_threshold']
         
         # Sort iterations by timestamp (newest first)
-        sorted_iterations = sorted(
-            self.iterations.items(),
-            key=lambda x: x[1].timestamp,
-            reverse=True
-        )
+        sorted_iterations = sorted(self.iterations.values(), key=_BY_TIMESTAMP, reverse=True)
         
         # Keep active iterations and recent ones
         to_keep = set()
@@ -294,46 +662,60 @@ class IterationManager:
         to_keep.update(active_iterations)
         
         # Keep the most recent iterations
-        for iteration_id, _ in sorted_iterations[:keep_count]:
-            to_keep.add(iteration_id)
+        to_keep.update(info.iteration_id for info in sorted_iterations[:keep_count])
         
         # Remove old iterations
-        removed = []
-        for iteration_id, info in sorted_iterations[keep_count:]:
-            if iteration_id not in to_keep and info.docker_status not in ['running', 'deployed']:
-                iteration_path = self.get_iteration_path(iteration_id)
-                if iteration_path.exists():
-                    shutil.rmtree(iteration_path)
-                    removed.append(iteration_id)
-                    logger.debug(f"Removed old iteration: {iteration_id}")
+        removed = [
+            info.iteration_id for info in sorted_iterations[keep_count:]
+            if info.iteration_id not in to_keep
+            and info.docker_status not in _ACTIVE_DOCKER_STATUSES
+            and self.get_iteration_path(info.iteration_id).exists()
+        ]
+        if removed:
+            # rmtree is bound by unlink/rmdir syscalls, which release the GIL
+            workers = min(len(removed), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(shutil.rmtree, map(self.get_iteration_path, removed)))
+            for iteration_id in removed:
+                logger.debug(f"Removed old iteration: {iteration_id}")
         
         # Update iteration tracking
         for iteration_id in removed:
             del self.iterations[iteration_id]
+        if removed:
+            self._latest = None
+            # Only the removed records are written
+            self._append_history(*({'iteration_id': iteration_id, 'removed': True}
+                                   for iteration_id in removed))
         
-        self._save_iteration_history()
         return removed
     
     def analyze_project_structure(self, iteration_id: str) -> ProjectStructure:
         """Analyze the structure of a project iteration."""
         iteration_path = self.get_iteration_path(iteration_id)
         
+        # Walk the tree once for every file-based check
+        files = list(_walk_files(str(iteration_path)))
+        
+        # Share file lookups and reads between the checks below
+        ctx = _AnalysisCtx(iteration_path, files)
+        
         # Auto-detect framework and language
-        framework = self._detect_framework(iteration_path)
-        language = self._detect_language(iteration_path)
+        framework = self._detect_framework(iteration_path, ctx)
+        language = self._detect_language(iteration_path, files)
         
         # Find dependencies
-        dependencies = self._find_dependencies(iteration_path)
+        dependencies = self._find_dependencies(iteration_path, ctx)
         
         # Find Docker files
-        dockerfile_path = self._find_dockerfile(iteration_path)
-        compose_path = self._find_docker_compose(iteration_path)
+        dockerfile_path = self._find_dockerfile(iteration_path, ctx)
+        compose_path = self._find_docker_compose(iteration_path, ctx)
         
         # Find entry point
-        entry_point = self._find_entry_point(iteration_path)
+        entry_point = self._find_entry_point(iteration_path, ctx)
         
         # Find test files
-        test_files = self._find_test_files(iteration_path)
+        test_files = self._find_test_files(iteration_path, files)
         
         return ProjectStructure(
             name=f"coval-{iteration_id}",
@@ -346,128 +728,105 @@ class IterationManager:
             test_files=test_files
         )
     
-    def _detect_framework(self, path: Path) -> str:
+    def _detect_framework(self, path: Path, ctx: Optional[_AnalysisCtx] = None) -> str:
         """Auto-detect the framework used in the project."""
+        ctx = ctx or _AnalysisCtx(path)
+        
         # Check for common framework indicators
-        if (path / "requirements.txt").exists():
-            with open(path / "requirements.txt", 'r') as f:
-                content = f.read().lower()
-                if 'fastapi' in content:
-                    return 'fastapi'
-                elif 'flask' in content:
-                    return 'flask'
-                elif 'django' in content:
-                    return 'django'
-        
-        if (path / "package.json").exists():
-            with open(path / "package.json", 'r') as f:
-                data = json.load(f)
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                if 'express' in deps:
-                    return 'express'
-                elif 'next' in deps:
-                    return 'nextjs'
-                elif 'react' in deps:
-                    return 'react'
+        if ctx.exists("requirements.txt"):
+            content = ctx.read_text("requirements.txt").lower()
+            for marker, framework in _PYTHON_FRAMEWORKS:
+                if marker in content:
+                    return framework
+        
+        if ctx.exists("package.json"):
+            data = ctx.read_json("package.json")
+            deps = data.get('dependencies', {})
+            dev_deps = data.get('devDependencies', {})
+            for package, framework in _NODE_FRAMEWORKS:
+                if package in deps or package in dev_deps:
+                    return framework
         
         return 'unknown'
     
-    def _detect_language(self, path: Path) -> str:
+    def _detect_language(self, path: Path, files: Optional[List[os.DirEntry]] = None) -> str:
         """Auto-detect the primary language."""
-        file_counts = {}
+        if files is None:
+            files = _walk_files(str(path))
         
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                suffix = file_path.suffix.lower()
-                file_counts[suffix] = file_counts.get(suffix, 0) + 1
+        # Only known extensions can decide the language, so count just those
+        counts = Counter()
+        for entry in files:
+            suffix = _suffix(entry.name)
+            if suffix in _LANGUAGE_EXTENSIONS:
+                counts[suffix] += 1
         
         # Return the most common language
-        common_extensions = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.java': 'java',
-            '.php': 'php',
-            '.rb': 'ruby'
-        }
-        
-        for ext in sorted(file_counts.keys(), key=file_counts.get, reverse=True):
-            if ext in common_extensions:
-                return common_extensions[ext]
+        if counts:
+            return _LANGUAGE_EXTENSIONS[counts.most_common(1)[0][0]]
         
         return 'unknown'
     
-    def _find_dependencies(self, path: Path) -> List[str]:
+    def _find_dependencies(self, path: Path, ctx: Optional[_AnalysisCtx] = None) -> List[str]:
         """Find project dependencies."""
+        ctx = ctx or _AnalysisCtx(path)
         deps = []
         
         # Python
-        req_file = path / "requirements.txt"
-        if req_file.exists():
-            with open(req_file, 'r') as f:
-                deps.extend([line.strip() for line in f if line.strip() and not line.startswith('#')])
+        if ctx.exists("requirements.txt"):
+            lines = ctx.read_text("requirements.txt").split('\n')
+            deps.extend([line.strip() for line in lines if line.strip() and not line.startswith('#')])
         
         # Node.js
-        package_file = path / "package.json"
-        if package_file.exists():
-            with open(package_file, 'r') as f:
-                data = json.load(f)
-                deps.extend(data.get('dependencies', {}).keys())
+        if ctx.exists("package.json"):
+            deps.extend(ctx.read_json("package.json").get('dependencies', {}).keys())
         
         return deps
     
-    def _find_dockerfile(self, path: Path) -> str:
+    def _find_dockerfile(self, path: Path, ctx: Optional[_AnalysisCtx] = None) -> str:
         """Find Dockerfile in the iteration."""
-        dockerfile_locations = ["Dockerfile", "docker/Dockerfile", "src/Dockerfile"]
+        ctx = ctx or _AnalysisCtx(path)
         
-        for location in dockerfile_locations:
-            dockerfile = path / location
-            if dockerfile.exists():
-                return str(dockerfile.relative_to(path))
+        for location in _DOCKERFILE_LOCATIONS:
+            if ctx.exists(location):
+                return str(Path(location))
         
         return ""
     
-    def _find_docker_compose(self, path: Path) -> str:
+    def _find_docker_compose(self, path: Path, ctx: Optional[_AnalysisCtx] = None) -> str:
         """Find docker-compose.yml in the iteration."""
-        compose_locations = ["docker-compose.yml", "docker/docker-compose.yml", "compose.yml"]
+        ctx = ctx or _AnalysisCtx(path)
         
-        for location in compose_locations:
-            compose_file = path / location
-            if compose_file.exists():
-                return str(compose_file.relative_to(path))
+        for location in _COMPOSE_LOCATIONS:
+            if ctx.exists(location):
+                return str(Path(location))
         
         return ""
     
-    def _find_entry_point(self, path: Path) -> str:
+    def _find_entry_point(self, path: Path, ctx: Optional[_AnalysisCtx] = None) -> str:
         """Find the main entry point of the application."""
-        entry_points = ["main.py", "app.py", "server.py", "index.js", "server.js", "app.js"]
+        ctx = ctx or _AnalysisCtx(path)
         
-        for entry in entry_points:
-            entry_file = path / "src" / entry
-            if entry_file.exists():
-                return f"src/{entry}"
-            
-            entry_file = path / entry
-            if entry_file.exists():
-                return entry
+        for candidate in _ENTRY_POINT_PATHS:
+            if ctx.exists(candidate):
+                return candidate
         
         return ""
     
-    def _find_test_files(self, path: Path) -> List[str]:
+    def _find_test_files(self, path: Path, files: Optional[List[os.DirEntry]] = None) -> List[str]:
         """Find test files in the iteration."""
-        test_files = []
+        if files is None:
+            files = _walk_files(str(path))
         
-        # Look for test files
-        for test_file in path.rglob('test_*.py'):
-            test_files.append(str(test_file.relative_to(path)))
-        
-        for test_file in path.rglob('*_test.py'):
-            test_files.append(str(test_file.relative_to(path)))
+        root_len = len(str(path)) + 1
+        test_files = []
         
-        for test_file in path.rglob('*.test.js'):
-            test_files.append(str(test_file.relative_to(path)))
+        # Look for test files: test_*.py, *_test.py and *.test.js
+        for entry in files:
+            name = entry.name
+            if ((name.endswith('.py') and (name.startswith('test_') or name.endswith('_test.py')))
+                    or name.endswith('.test.js')):
+                test_files.append(entry.path[root_len:])
         
         return test_files
     
@@ -479,52 +838,76 @@ class IterationManager:
         iteration = self.iterations[iteration_id]
         iteration_path = self.get_iteration_path(iteration_id)
         
-        # Calculate code metrics
-        code_metrics = self._calculate_code_metrics(iteration_path)
+        # One walk and one read per file give both the code metrics and the size
+        code_metrics, total_bytes = self._scan_code_metrics(_walk_files(str(iteration_path)))
         
         return {
             'iteration_info': asdict(iteration),
             'code_metrics': code_metrics,
             'path': str(iteration_path),
-            'size_mb': sum(f.stat().st_size for f in iteration_path.rglob('*') if f.is_file()) / 1024 / 1024
+            'size_mb': total_bytes / 1024 / 1024
         }
     
-    def _calculate_code_metrics(self, path: Path) -> Dict[str, Any]:
+    def _calculate_code_metrics(self, path: Path, files: Optional[List[os.DirEntry]] = None) -> Dict[str, Any]:
         """Calculate code quality and complexity metrics."""
-        metrics = {
-            'total_files': 0,
-            'total_lines': 0,
-            'code_files': 0,
-            'test_files': 0,
-            'config_files': 0,
-            'languages': {}
-        }
+        if files is None:
+            files = _walk_files(str(path))
+        return self._scan_code_metrics(files)[0]
+    
+    def _scan_code_metrics(self, files) -> Tuple[Dict[str, Any], int]:
+        """
+        Calculate code metrics and the total size of the given files.
         
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                metrics['total_files'] += 1
-                
-                # Count lines
+        Sizes come from the bytes read while counting lines; only files that
+        cannot be read fall back to a stat call.
+        
+        Args:
+            files: Iterable of os.DirEntry for the files to measure
+            
+        Returns:
+            Tuple of (code_metrics, total_bytes)
+        """
+        # Plain local counters keep the per-file work to a few bytecodes
+        total_bytes = 0
+        total_files = total_lines = code_files = test_files = config_files = 0
+        languages = {}
+        
+        for entry in files:
+            total_files += 1
+            
+            # Count lines
+            try:
+                lines, size = _count_lines(entry.path)
+            except OSError:
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        lines = len(f.readlines())
-                        metrics['total_lines'] += lines
-                except:
-                    continue
-                
-                # Categorize files
-                suffix = file_path.suffix.lower()
-                name = file_path.name.lower()
-                
-                if 'test' in name:
-                    metrics['test_files'] += 1
-                elif suffix in ['.py', '.js', '.ts', '.go', '.rs', '.java']:
-                    metrics['code_files'] += 1
-                elif suffix in ['.json', '.yaml', '.yml', '.toml', '.ini']:
-                    metrics['config_files'] += 1
-                
-                # Track languages
-                if suffix in ['.py', '.js', '.ts', '.go', '.rs', '.java', '.php', '.rb']:
-                    metrics['languages'][suffix] = metrics['languages'].get(suffix, 0) + 1
+                    total_bytes += entry.stat().st_size
+                except OSError:
+                    pass
+                continue
+            total_lines += lines
+            total_bytes += size
+            
+            # Categorize files
+            name = entry.name
+            suffix = _suffix(name)
+            
+            if 'test' in name or (not name.islower() and 'test' in name.lower()):
+                test_files += 1
+            elif suffix in _CODE_EXTENSIONS:
+                code_files += 1
+            elif suffix in _CONFIG_EXTENSIONS:
+                config_files += 1
+            
+            # Track languages
+            if suffix in _LANGUAGE_EXTENSIONS:
+                languages[suffix] = languages.get(suffix, 0) + 1
         
-        return metrics
+        metrics = {
+            'total_files': total_files,
+            'total_lines': total_lines,
+            'code_files': code_files,
+            'test_files': test_files,
+            'config_files': config_files,
+            'languages': languages
+        }
+        return metrics, total_bytes
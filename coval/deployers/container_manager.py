@@ -6,20 +6,93 @@ Handles Docker container lifecycle management with proper cleanup and error hand
 Fixes the container naming conflicts and cleanup issues from the monolithic deployment manager.
 """
 
+import asyncio
 import logging
+import os
+import socket
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import docker
-from docker.models.containers import Container
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from docker.models.networks import Network
-from docker.errors import DockerException, NotFound, APIError
+from docker.errors import DockerException, ImageNotFound, NotFound, APIError
 
 logger = logging.getLogger(__name__)
 
+# Seconds an inspect result is reused by status polling
+_INSPECT_TTL = 0.5
 
-@dataclass
+# Container event actions that change the tracked status
+_EVENT_STATUS = {
+    'start': 'running',
+    'unpause': 'running',
+    'pause': 'paused',
+    'die': 'exited',
+    'destroy': 'removed',
+}
+
+# Image event actions that add to or invalidate the known-images cache
+_IMAGE_ADDED_EVENTS = ('pull', 'tag')
+_IMAGE_REMOVED_EVENTS = ('delete', 'untag')
+
+# Upper bound on Docker API calls issued concurrently by batch operations
+_MAX_PARALLEL_ACTIONS = 16
+
+# Distinct container shapes whose create arguments are kept prepared
+_MAX_CREATE_SPECS = 64
+
+# Docker connection pool size; room for every batch worker, the event
+# stream and status polling. Override with COVAL_DOCKER_POOL.
+_DEFAULT_DOCKER_POOL = 32
+
+# Keep-alive probes for TCP Docker endpoints, so idle pooled connections
+# survive between deployment bursts instead of being dropped and reopened
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _KEEPALIVE_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections enable TCP keep-alive."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _image_key(image: str) -> str:
+    """Normalize an image reference to the repo:tag form Docker lists."""
+    name = image.rsplit('/', 1)[-1]
+    return image if ':' in name or '@' in name else f"{image}:latest"
+
+
+def _freeze(value: Any) -> Any:
+    """Turn nested dicts and lists into hashable tuples for use as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _docker_pool_size() -> int:
+    """Return the Docker connection pool size from COVAL_DOCKER_POOL or the default."""
+    value = os.environ.get('COVAL_DOCKER_POOL')
+    if not value:
+        return _DEFAULT_DOCKER_POOL
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning("Ignoring invalid COVAL_DOCKER_POOL=%r", value)
+        return _DEFAULT_DOCKER_POOL
+
+
+@dataclass(frozen=True, slots=True)
 class ContainerConfig:
     """Configuration for Docker container creation."""
     name: str
@@ -31,9 +104,40 @@ class ContainerConfig:
     restart_policy: Dict[str, str] = None
     auto_remove: bool = False
     detach: bool = True
+    
+    # Docker API wire forms of the fields above, built once in __post_init__
+    _port_bindings: Dict[str, Any] = field(init=False, repr=False, compare=False, default=None)
+    _exposed_ports: List[Tuple[str, ...]] = field(init=False, repr=False, compare=False, default=None)
+    _binds: List[str] = field(init=False, repr=False, compare=False, default=None)
+    _volume_targets: List[str] = field(init=False, repr=False, compare=False, default=None)
+    _env_list: List[str] = field(init=False, repr=False, compare=False, default=None)
+    _shape: Any = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        """Pre-build the create arguments that do not depend on the name."""
+        port_bindings = {
+            port if '/' in str(port) else f"{port}/tcp": host_port
+            for port, host_port in (self.ports or {}).items()
+        }
+        volumes = self.volumes or {}
+        setattr_ = object.__setattr__  # The dataclass is frozen
+        setattr_(self, '_port_bindings', port_bindings)
+        setattr_(self, '_exposed_ports', [tuple(port.split('/', 1)) for port in sorted(port_bindings)])
+        setattr_(self, '_binds', [
+            f"{host_path}:{bind['bind']}:{bind.get('mode', 'rw')}" for host_path, bind in volumes.items()
+        ])
+        setattr_(self, '_volume_targets', [bind.get('bind') for bind in volumes.values()])
+        setattr_(self, '_env_list', [
+            key if value is None else f"{key}={value}" for key, value in (self.environment or {}).items()
+        ])
+        # Everything but the name and network, so same-shaped configs share a key
+        setattr_(self, '_shape', _freeze((
+            self.image, port_bindings, volumes, self.environment, self.restart_policy,
+            self.auto_remove, self.detach
+        )))
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStatus:
     """Status information for a container."""
     container_id: Optional[str]
@@ -45,6 +149,38 @@ class ContainerStatus:
     stopped_at: Optional[datetime]
     exit_code: Optional[int] = None
     error_message: Optional[str] = None
+    create_duration_ns: Optional[int] = None  # Time spent in the create call
+
+
+@dataclass(frozen=True, slots=True)
+class _StateView:
+    """The parts of an inspect response's State that status reads use."""
+    status: str
+    exit_code: Optional[int]
+    started_at: Optional[datetime]
+
+
+def _parse_state(attrs: Dict[str, Any]) -> _StateView:
+    """
+    Read the container state out of an inspect response once.
+    
+    Args:
+        attrs: Container inspect response
+        
+    Returns:
+        _StateView with the status, exit code and local start time; a
+        container that never started has no start time
+    """
+    state = attrs.get('State') or {}
+    started_at = state.get('StartedAt')
+    if started_at and not started_at.startswith('0001-'):
+        try:
+            started_at = datetime.fromisoformat(started_at).astimezone().replace(tzinfo=None)
+        except ValueError:
+            started_at = None
+    else:
+        started_at = None
+    return _StateView(state.get('Status', 'unknown'), state.get('ExitCode'), started_at)
 
 
 class ContainerManager:
@@ -62,16 +198,68 @@ class ContainerManager:
     def __init__(self):
         """Initialize the ContainerManager with Docker client."""
         try:
-            self.docker_client = docker.from_env()
-            # Test Docker connection
+            # The default pool of 10 connections would make concurrent
+            # batch operations queue for a socket
+            pool_size = _docker_pool_size()
+            self.docker_client = docker.from_env(max_pool_size=pool_size)
+            # Lifecycle actions go straight to the API by name, skipping the
+            # inspect round trip that containers.get() makes first
+            self.api = self.docker_client.api
+            self._mount_keepalive_adapter(pool_size)
+            # Test Docker connection; this also opens the first pooled socket
             self.docker_client.ping()
             logger.debug("✓ Docker client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Docker client: {e}")
+            logger.error("Failed to initialize Docker client: %s", e)
             raise DockerException(f"Docker connection failed: {e}")
         
         # Track managed containers
         self.managed_containers: Dict[str, ContainerStatus] = {}
+        
+        # name -> (monotonic time, inspect attrs) for status polling
+        self._inspect_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # name -> inspect in progress, shared by concurrent pollers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Guards managed_containers, which worker threads, waiters and the
+        # event stream update concurrently; reentrant so helpers that take
+        # it can be called with it held. Never held across a Docker call.
+        self._lock = threading.RLock()
+        
+        # network name -> ID of networks known to exist
+        self._networks: Dict[str, str] = {}
+        
+        # repo:tag of local images, listed on first use
+        self._images: Optional[set] = None
+        
+        # Container shape -> prepared api.create_container arguments
+        self._create_specs: Dict[Any, Dict[str, Any]] = {}
+        
+        # name -> thread blocked in api.wait, used when events are unavailable
+        self._waiters: Dict[str, threading.Thread] = {}
+        
+        # Container events keep tracked statuses current once streaming
+        self._events = None
+        self._events_thread: Optional[threading.Thread] = None
+        self._events_active = False
+    
+    def _mount_keepalive_adapter(self, pool_size: int):
+        """
+        Serve tcp:// Docker endpoints through a sized keep-alive adapter.
+        
+        docker-py applies max_pool_size only to its socket adapters; TCP
+        endpoints fall back to the default requests adapter with its pool of
+        10 and no keep-alive. Unix sockets, named pipes and SSH are left as
+        they are.
+        
+        Args:
+            pool_size: Connections to keep per endpoint
+        """
+        base_url = self.api.base_url
+        if base_url.startswith(('http://', 'https://')):
+            adapter = _KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.api.mount(base_url.split('://', 1)[0] + '://', adapter)
     
     def create_container(self, config: ContainerConfig) -> ContainerStatus:
         """
@@ -83,50 +271,78 @@ class ContainerManager:
         Returns:
             ContainerStatus: Status of the created container
         """
-        logger.debug(f"Creating container: {config.name}")
+        return self.create_containers([config])[0]
+    
+    def create_containers(self, configs: List[ContainerConfig]) -> List[ContainerStatus]:
+        """
+        Create several Docker containers with proper cleanup of existing ones.
+        
+        Name conflicts are found with one list call for the whole batch, so
+        only names that are actually taken pay for a forced cleanup.
+        
+        Args:
+            configs: Container configurations
+            
+        Returns:
+            List of ContainerStatus, one per config in the same order
+        """
+        existing = self._container_ids([config.name for config in configs])
+        return [self._create_container(config, config.name in existing) for config in configs]
+    
+    def _create_container(self, config: ContainerConfig, name_taken: bool) -> ContainerStatus:
+        """
+        Create one container, first removing any container holding its name.
+        
+        Args:
+            config: Container configuration
+            name_taken: Whether a container with this name already exists
+            
+        Returns:
+            ContainerStatus: Status of the created container
+        """
+        logger.debug("Creating container: %s", config.name)
+        self._inspect_cache.pop(config.name, None)
         
         # First, ensure any existing container with the same name is properly cleaned up
-        self._force_cleanup_container(config.name)
+        if name_taken:
+            self._force_cleanup_container(config.name)
         
         container_status = ContainerStatus(
             container_id=None,
             name=config.name,
             status='creating',
             ports=config.ports,
-            created_at=datetime.now(),
+            created_at=None,  # Set once the container exists
             started_at=None,
             stopped_at=None
         )
         
         try:
-            # Prepare restart policy
-            restart_policy = config.restart_policy or {"Name": "unless-stopped"}
+            # Creating does not pull, so fetch a missing image first
+            self._ensure_image(config.image)
             
             # Create the container
-            container = self.docker_client.containers.create(
-                image=config.image,
-                name=config.name,
-                ports=config.ports,
-                volumes=config.volumes,
-                environment=config.environment,
-                detach=config.detach,
-                auto_remove=config.auto_remove,
-                restart_policy=restart_policy
-            )
+            started_ns = time.monotonic_ns()
+            response = self.api.create_container(name=config.name, **self._prepare_create(config))
+            container_id = response['Id']
             
             # Update status
-            container_status.container_id = container.id
+            container_status.create_duration_ns = time.monotonic_ns() - started_ns
+            container_status.container_id = container_id
             container_status.status = 'created'
             container_status.created_at = datetime.now()
             
             # Connect to network if specified
             if config.network:
-                self._connect_to_network(container, config.network)
+                self._connect_to_network(container_id, config.name, config.network)
             
-            # Track the container
-            self.managed_containers[config.name] = container_status
+            # Track the container; its later transitions arrive as events
+            with self._lock:
+                self.managed_containers[config.name] = container_status
+            self._start_event_stream()
             
-            logger.info(f"✓ Container created successfully: {config.name} ({container.short_id})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✓ Container created successfully: %s (%s)", config.name, container_id[:12])
             return container_status
             
         except APIError as e:
@@ -142,6 +358,49 @@ class ContainerManager:
             container_status.error_message = error_msg
             return container_status
     
+    def _prepare_create(self, config: ContainerConfig) -> Dict[str, Any]:
+        """
+        Build the low-level create arguments for a container configuration.
+        
+        Configurations differing only in name share one prepared set of
+        arguments, so a batch of same-shaped containers builds its HostConfig
+        once from the wire-format fields each config pre-computes. Calling api.create_container directly also
+        skips the inspect that containers.create makes after creating.
+        
+        Args:
+            config: Container configuration
+            
+        Returns:
+            Keyword arguments for api.create_container, without the name;
+            shared between calls and must not be modified
+        """
+        spec = self._create_specs.get(config._shape)
+        if spec is not None:
+            return spec
+        
+        host_config = self.api.create_host_config(
+            port_bindings=config._port_bindings or None,
+            binds=config._binds or None,
+            restart_policy=config.restart_policy or {"Name": "unless-stopped"},
+            auto_remove=config.auto_remove
+        )
+        spec = {
+            'image': config.image,
+            'detach': config.detach,
+            'host_config': host_config,
+            'environment': config._env_list or None,
+        }
+        # Exposed ports and volume targets, as containers.create derives them
+        if config._exposed_ports:
+            spec['ports'] = config._exposed_ports
+        if config._volume_targets:
+            spec['volumes'] = config._volume_targets
+        
+        if len(self._create_specs) >= _MAX_CREATE_SPECS:
+            self._create_specs.clear()
+        self._create_specs[config._shape] = spec
+        return spec
+    
     def start_container(self, container_name: str) -> bool:
         """
         Start a container by name.
@@ -152,28 +411,34 @@ class ContainerManager:
         Returns:
             bool: True if started successfully, False otherwise
         """
-        logger.debug(f"Starting container: {container_name}")
+        logger.debug("Starting container: %s", container_name)
+        self._inspect_cache.pop(container_name, None)
         
         try:
-            container = self.docker_client.containers.get(container_name)
-            container.start()
+            self.api.start(container_name)
             
             # Update status
-            if container_name in self.managed_containers:
-                self.managed_containers[container_name].status = 'running'
-                self.managed_containers[container_name].started_at = datetime.now()
+            with self._lock:
+                tracked = self.managed_containers.get(container_name)
+                if tracked is not None:
+                    tracked.status = 'running'
+                    tracked.started_at = datetime.now()
             
-            logger.info(f"✓ Container started successfully: {container_name}")
+            # Without the event stream, learn the exit code from a blocking wait
+            if tracked is not None and not self._events_active:
+                self._watch_exit(container_name, tracked.container_id or container_name)
+            
+            logger.info("✓ Container started successfully: %s", container_name)
             return True
             
         except NotFound:
-            logger.error(f"Container not found: {container_name}")
+            logger.error("Container not found: %s", container_name)
             return False
         except APIError as e:
-            logger.error(f"Failed to start container {container_name}: {e}")
+            logger.error("Failed to start container %s: %s", container_name, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error starting container {container_name}: {e}")
+            logger.error("Unexpected error starting container %s: %s", container_name, e)
             return False
     
     def stop_container(self, container_name: str, timeout: int = 30) -> bool:
@@ -187,30 +452,30 @@ class ContainerManager:
         Returns:
             bool: True if stopped successfully, False otherwise
         """
-        logger.debug(f"Stopping container: {container_name}")
+        logger.debug("Stopping container: %s", container_name)
+        self._inspect_cache.pop(container_name, None)
         
         try:
-            container = self.docker_client.containers.get(container_name)
-            
-            # Stop the container
-            container.stop(timeout=timeout)
+            self.api.stop(container_name, timeout=timeout)
             
             # Update status
-            if container_name in self.managed_containers:
-                self.managed_containers[container_name].status = 'stopped'
-                self.managed_containers[container_name].stopped_at = datetime.now()
+            with self._lock:
+                tracked = self.managed_containers.get(container_name)
+                if tracked is not None:
+                    tracked.status = 'stopped'
+                    tracked.stopped_at = datetime.now()
             
-            logger.info(f"✓ Container stopped successfully: {container_name}")
+            logger.info("✓ Container stopped successfully: %s", container_name)
             return True
             
         except NotFound:
-            logger.warning(f"Container not found when stopping: {container_name}")
+            logger.warning("Container not found when stopping: %s", container_name)
             return True  # Already stopped/removed
         except APIError as e:
-            logger.error(f"Failed to stop container {container_name}: {e}")
+            logger.error("Failed to stop container %s: %s", container_name, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error stopping container {container_name}: {e}")
+            logger.error("Unexpected error stopping container %s: %s", container_name, e)
             return False
     
     def remove_container(self, container_name: str, force: bool = False) -> bool:
@@ -224,33 +489,32 @@ class ContainerManager:
         Returns:
             bool: True if removed successfully, False otherwise
         """
-        logger.debug(f"Removing container: {container_name} (force={force})")
+        logger.debug("Removing container: %s (force=%s)", container_name, force)
+        self._inspect_cache.pop(container_name, None)
         
         try:
-            container = self.docker_client.containers.get(container_name)
-            
-            # Remove the container
-            container.remove(force=force)
+            self.api.remove_container(container_name, force=force)
             
             # Update status and remove from tracking
-            if container_name in self.managed_containers:
-                self.managed_containers[container_name].status = 'removed'
-                del self.managed_containers[container_name]
+            with self._lock:
+                tracked = self.managed_containers.pop(container_name, None)
+            if tracked is not None:
+                tracked.status = 'removed'
             
-            logger.info(f"✓ Container removed successfully: {container_name}")
+            logger.info("✓ Container removed successfully: %s", container_name)
             return True
             
         except NotFound:
-            logger.debug(f"Container not found when removing: {container_name}")
+            logger.debug("Container not found when removing: %s", container_name)
             # Clean up from tracking if it exists
-            if container_name in self.managed_containers:
-                del self.managed_containers[container_name]
+            with self._lock:
+                self.managed_containers.pop(container_name, None)
             return True  # Already removed
         except APIError as e:
-            logger.error(f"Failed to remove container {container_name}: {e}")
+            logger.error("Failed to remove container %s: %s", container_name, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error removing container {container_name}: {e}")
+            logger.error("Unexpected error removing container %s: %s", container_name, e)
             return False
     
     def stop_and_remove_container(self, container_name: str, timeout: int = 30) -> bool:
@@ -264,16 +528,72 @@ class ContainerManager:
         Returns:
             bool: True if stopped and removed successfully, False otherwise
         """
-        logger.debug(f"Stopping and removing container: {container_name}")
+        logger.debug("Stopping and removing container: %s", container_name)
         
         # First attempt graceful stop and remove
         if self.stop_container(container_name, timeout):
             return self.remove_container(container_name)
         else:
             # If graceful stop failed, force remove
-            logger.warning(f"Graceful stop failed, force removing container: {container_name}")
+            logger.warning("Graceful stop failed, force removing container: %s", container_name)
             return self.remove_container(container_name, force=True)
     
+    async def acreate_container(self, config: ContainerConfig) -> ContainerStatus:
+        """
+        Create a container without blocking the event loop.
+        
+        The Docker call runs in a worker thread, so several containers can
+        be created concurrently with asyncio.gather.
+        
+        Args:
+            config: Container configuration
+            
+        Returns:
+            ContainerStatus: Status of the created container
+        """
+        return await asyncio.to_thread(self.create_container, config)
+    
+    async def astart_container(self, container_name: str) -> bool:
+        """
+        Start a container without blocking the event loop.
+        
+        Args:
+            container_name: Name of the container to start
+            
+        Returns:
+            bool: True if started successfully, False otherwise
+        """
+        return await asyncio.to_thread(self.start_container, container_name)
+    
+    async def astop_and_remove_container(self, container_name: str, timeout: int = 30) -> bool:
+        """
+        Stop and remove a container without blocking the event loop.
+        
+        Args:
+            container_name: Name of the container to stop and remove
+            timeout: Timeout in seconds for graceful stop
+            
+        Returns:
+            bool: True if stopped and removed successfully, False otherwise
+        """
+        return await asyncio.to_thread(self.stop_and_remove_container, container_name, timeout)
+    
+    async def acleanup_containers(self, container_names: List[str], timeout: int = 30) -> Dict[str, bool]:
+        """
+        Stop and remove several containers concurrently.
+        
+        Args:
+            container_names: Names of the containers to clean up
+            timeout: Timeout in seconds for graceful stop
+            
+        Returns:
+            Dict mapping container names to cleanup success status
+        """
+        results = await asyncio.gather(*(
+            self.astop_and_remove_container(name, timeout) for name in container_names
+        ))
+        return dict(zip(container_names, results))
+    
     def _force_cleanup_container(self, container_name: str):
         """
         Force cleanup of any existing container with the given name.
@@ -283,25 +603,190 @@ class ContainerManager:
             container_name: Name of the container to cleanup
         """
         try:
-            existing_container = self.docker_client.containers.get(container_name)
-            logger.warning(f"Found existing container with name {container_name}, cleaning up...")
+            attrs = self.api.inspect_container(container_name)
+            logger.warning("Found existing container with name %s, cleaning up...", container_name)
             
-            # Try to stop gracefully first
-            try:
-                existing_container.stop(timeout=10)
-                logger.debug(f"Gracefully stopped existing container: {container_name}")
-            except Exception as e:
-                logger.debug(f"Graceful stop failed for {container_name}: {e}")
+            # Try to stop gracefully first; exited or created containers
+            # have nothing to stop
+            if (attrs.get('State') or {}).get('Running'):
+                try:
+                    self.api.stop(container_name, timeout=10)
+                    logger.debug("Gracefully stopped existing container: %s", container_name)
+                except Exception as e:
+                    logger.debug("Graceful stop failed for %s: %s", container_name, e)
             
             # Force remove
-            existing_container.remove(force=True)
-            logger.info(f"✓ Cleaned up existing container: {container_name}")
+            self.api.remove_container(container_name, v=False, force=True)
+            logger.info("✓ Cleaned up existing container: %s", container_name)
             
         except NotFound:
             # No existing container, this is good
-            logger.debug(f"No existing container found with name: {container_name}")
+            logger.debug("No existing container found with name: %s", container_name)
+        except Exception as e:
+            logger.warning("Failed to cleanup existing container %s: %s", container_name, e)
+    
+    def _start_event_stream(self):
+        """Start the background consumer of container events, once."""
+        with self._lock:
+            if self._events is not None:
+                return
+            try:
+                self._events = self.docker_client.events(decode=True, filters={
+                    'type': ['container', 'network', 'image'],
+                    'event': [*_EVENT_STATUS, *_IMAGE_ADDED_EVENTS, *_IMAGE_REMOVED_EVENTS],
+                })
+            except Exception as e:
+                logger.debug("Container event stream unavailable, polling instead: %s", e)
+                self._events = False
+                return
+            self._events_thread = threading.Thread(
+                target=self._event_loop, name="coval-container-events", daemon=True
+            )
+            self._events_thread.start()
+    
+    def _event_loop(self):
+        """Apply container events to tracked statuses until the stream ends."""
+        self._events_active = True
+        try:
+            for event in self._events:
+                action = event.get('Action') or event.get('status')
+                attributes = (event.get('Actor') or {}).get('Attributes') or {}
+                name = attributes.get('name')
+                
+                if event.get('Type') == 'network':
+                    if action == 'destroy':
+                        self._networks.pop(name, None)
+                    continue
+                
+                if event.get('Type') == 'image':
+                    images = self._images
+                    if action in _IMAGE_REMOVED_EVENTS:
+                        self._images = None  # List again on next use
+                        continue
+                    # Pull events name only the repository; their ID is the
+                    # full repo:tag. Tag events carry the new tag as name.
+                    reference = (event.get('Actor') or {}).get('ID') if action == 'pull' else name
+                    if images is not None and reference:
+                        images.add(_image_key(reference))
+                    continue
+                
+                status = _EVENT_STATUS.get(action)
+                if status is None:
+                    continue
+                
+                with self._lock:
+                    tracked = self.managed_containers.get(name)
+                    if tracked is None:
+                        continue
+                    tracked.status = status
+                    if status == 'running':
+                        tracked.started_at = datetime.now()
+                    elif status == 'exited':
+                        tracked.stopped_at = datetime.now()
+                        if 'exitCode' in attributes:
+                            tracked.exit_code = int(attributes['exitCode'])
         except Exception as e:
-            logger.warning(f"Failed to cleanup existing container {container_name}: {e}")
+            logger.debug("Container event stream ended: %s", e)
+        finally:
+            self._events_active = False
+    
+    def _watch_exit(self, container_name: str, container_id: str):
+        """Start a background wait for the container to exit, once per container."""
+        with self._lock:
+            waiter = self._waiters.get(container_name)
+            if waiter is not None and waiter.is_alive():
+                return
+            waiter = threading.Thread(
+                target=self._await_exit, args=(container_name, container_id),
+                name=f"coval-wait-{container_name}", daemon=True
+            )
+            self._waiters[container_name] = waiter
+        waiter.start()
+    
+    def _await_exit(self, container_name: str, container_id: str):
+        """
+        Block in api.wait until the container exits and record its exit code.
+        
+        The daemon answers when the container stops, so tracked statuses
+        reach their terminal state without inspect polling.
+        
+        Args:
+            container_name: Name of the tracked container
+            container_id: ID (or name) to wait on
+        """
+        try:
+            exit_code = self.api.wait(container_id, timeout=None)['StatusCode']
+        except Exception as e:
+            logger.debug("Stopped waiting for container %s: %s", container_name, e)
+            exit_code = None
+        
+        with self._lock:
+            if self._waiters.get(container_name) is threading.current_thread():
+                del self._waiters[container_name]
+            tracked = self.managed_containers.get(container_name)
+            if exit_code is None or tracked is None:
+                return
+            if (tracked.container_id or container_name) != container_id:
+                return  # Replaced by a newer container meanwhile
+            tracked.exit_code = exit_code
+            if tracked.status == 'running':
+                tracked.status = 'exited'
+            if tracked.stopped_at is None:
+                tracked.stopped_at = datetime.now()
+    
+    def close(self):
+        """Stop consuming container events."""
+        events, self._events = self._events, None
+        if events:
+            try:
+                events.close()
+            except Exception as e:
+                logger.debug("Failed to close container event stream: %s", e)
+    
+    def _inspect(self, container_name: str, ttl: float = _INSPECT_TTL) -> Dict[str, Any]:
+        """
+        Inspect a container, reusing a result younger than ttl seconds.
+        
+        Tight status polling then costs one daemon round trip per ttl
+        instead of one per call, and concurrent callers share a single
+        in-flight request. Lifecycle actions drop the cached entry.
+        
+        Args:
+            container_name: Name of the container
+            ttl: Maximum age in seconds of a reused result
+            
+        Returns:
+            Raw inspect attributes
+            
+        Raises:
+            NotFound: If the container does not exist
+        """
+        now = time.monotonic()
+        cached = self._inspect_cache.get(container_name)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        # Callers arriving while an inspect is in flight wait for its result
+        with self._inflight_lock:
+            future = self._inflight.get(container_name)
+            leader = future is None
+            if leader:
+                future = self._inflight[container_name] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            attrs = self.api.inspect_container(container_name)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._inspect_cache[container_name] = (now, attrs)
+            future.set_result(attrs)
+            return attrs
+        finally:
+            with self._inflight_lock:
+                del self._inflight[container_name]
     
     def get_container_status(self, container_name: str) -> Optional[ContainerStatus]:
         """
@@ -314,73 +799,235 @@ class ContainerManager:
             ContainerStatus or None if not found
         """
         # Check our tracking first
-        if container_name in self.managed_containers:
-            status = self.managed_containers[container_name]
-            
+        with self._lock:
+            status = self.managed_containers.get(container_name)
+            if status is not None:
+                if self._events_active:
+                    return status  # Kept current by the event stream
+                if status.status == 'running' and container_name in self._waiters:
+                    return status  # The pending wait records the exit
+        
+        if status is not None:
             # Update with live Docker status if container exists
             try:
-                container = self.docker_client.containers.get(container_name)
-                status.status = container.status
-                if hasattr(container.attrs, 'State'):
-                    state = container.attrs.get('State', {})
-                    if 'ExitCode' in state:
-                        status.exit_code = state['ExitCode']
+                state = _parse_state(self._inspect(container_name))
+                with self._lock:
+                    if state.status != 'unknown':
+                        status.status = state.status
+                    if state.exit_code is not None:
+                        status.exit_code = state.exit_code
             except NotFound:
-                status.status = 'removed'
+                with self._lock:
+                    status.status = 'removed'
             except Exception as e:
-                logger.warning(f"Failed to get live status for {container_name}: {e}")
+                logger.warning("Failed to get live status for %s: %s", container_name, e)
             
             return status
         
         # Not in our tracking, check Docker directly
         try:
-            container = self.docker_client.containers.get(container_name)
+            attrs = self._inspect(container_name)
+            state = _parse_state(attrs)
             return ContainerStatus(
-                container_id=container.id,
+                container_id=attrs.get('Id'),
                 name=container_name,
-                status=container.status,
+                status=state.status,
                 ports={},  # Would need to parse from container.attrs
                 created_at=None,  # Would need to parse from container.attrs
-                started_at=None,
-                stopped_at=None
+                started_at=state.started_at,
+                stopped_at=None,
+                exit_code=state.exit_code
             )
         except NotFound:
             return None
         except Exception as e:
-            logger.warning(f"Failed to get container status for {container_name}: {e}")
+            logger.warning("Failed to get container status for %s: %s", container_name, e)
             return None
     
     def list_managed_containers(self) -> List[ContainerStatus]:
         """Get list of all managed containers."""
-        return list(self.managed_containers.values())
+        with self._lock:
+            return list(self.managed_containers.values())
     
-    def _connect_to_network(self, container: Container, network_name: str):
-        """Connect container to specified network."""
+    def containers_by_status(self, status: str) -> List[str]:
+        """
+        Get the names of managed containers in a given status.
+        
+        Args:
+            status: Status to match, e.g. 'running' or 'exited'
+            
+        Returns:
+            Names of the matching containers, in creation order
+        """
+        with self._lock:
+            return [name for name, tracked in self.managed_containers.items() if tracked.status == status]
+    
+    def _ensure_image(self, image: str):
+        """
+        Pull an image unless it is known to be present locally.
+        
+        Local images are listed once and then kept current by image events,
+        so repeated creates from the same image need no extra API call. An
+        unlisted image is inspected before deciding to pull it, since it may
+        have been built after the listing.
+        
+        Args:
+            image: Image reference from the container config
+        """
+        if '@' in image:
+            return  # Digest references are left to the daemon
+        
+        # The event thread may reset self._images at any time, so work on
+        # one snapshot of it
+        images = self._images
+        if images is None:
+            try:
+                images = {
+                    tag for listed in self.api.images() for tag in listed.get('RepoTags') or ()
+                }
+            except Exception as e:
+                logger.debug("Failed to list local images: %s", e)
+                return
+            self._images = images
+        
+        key = _image_key(image)
+        if key in images:
+            return
+        
         try:
-            # Get or create network
+            # Built since the listing without an event reaching us
+            self.api.inspect_image(key)
+        except ImageNotFound:
+            logger.info("Pulling missing image: %s", key)
+            repository, _, tag = key.rpartition(':')
+            self.api.pull(repository, tag=tag)
+        images.add(key)
+    
+    def _network_id(self, network_name: str) -> str:
+        """Get or create a network, looking it up only once per manager."""
+        network_id = self._networks.get(network_name)
+        if network_id is None:
             try:
                 network = self.docker_client.networks.get(network_name)
             except NotFound:
                 network = self.docker_client.networks.create(network_name, driver="bridge")
-                logger.debug(f"Created network: {network_name}")
+                logger.debug("Created network: %s", network_name)
+            network_id = self._networks[network_name] = network.id
+        return network_id
+    
+    def _connect_to_network(self, container_id: str, container_name: str, network_name: str):
+        """Connect container to specified network."""
+        try:
+            try:
+                self.api.connect_container_to_network(container_id, self._network_id(network_name))
+            except NotFound:
+                # The cached network was removed behind our back; look it up again
+                self._networks.pop(network_name, None)
+                self.api.connect_container_to_network(container_id, self._network_id(network_name))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Connected container %s to network %s", container_name, network_name)
             
-            # Connect container to network
-            network.connect(container)
-            logger.debug(f"Connected container {container.name} to network {network_name}")
+        except Exception as e:
+            logger.warning("Failed to connect container to network %s: %s", network_name, e)
+    
+    def _container_ids(self, names: List[str]) -> Dict[str, str]:
+        """
+        Resolve container names to IDs with a single list call.
+        
+        Args:
+            names: Container names to look up
             
+        Returns:
+            Dict mapping each existing container name to its ID; missing
+            containers are left out
+        """
+        try:
+            listed = self.api.containers(all=True, filters={'name': names})
         except Exception as e:
-            logger.warning(f"Failed to connect container to network {network_name}: {e}")
+            logger.warning("Failed to list containers, addressing them by name: %s", e)
+            return {name: name for name in names}
+        
+        # The name filter matches substrings, so keep exact matches only
+        wanted = set(names)
+        ids = {}
+        for container in listed:
+            for name in container.get('Names') or ():
+                name = name.lstrip('/')
+                if name in wanted:
+                    ids[name] = container['Id']
+        return ids
     
-    def cleanup_all_managed_containers(self) -> Dict[str, bool]:
+    def _batch_action(self, ids: Dict[str, str], names: List[str], action: str, **kwargs) -> Dict[str, bool]:
+        """
+        Run one low-level API action on many containers concurrently.
+        
+        Args:
+            ids: Name to ID mapping from _container_ids
+            names: Names of the containers to act on
+            action: 'stop' or 'remove'
+            **kwargs: Extra arguments for the API call (timeout, force)
+            
+        Returns:
+            Dict mapping container names to success; containers that no
+            longer exist count as done
+        """
+        call = self.api.stop if action == 'stop' else self.api.remove_container
+        
+        def run(name: str) -> Tuple[str, bool]:
+            self._inspect_cache.pop(name, None)
+            container_id = ids.get(name)
+            if container_id is None:
+                return name, True  # Already removed
+            try:
+                call(container_id, **kwargs)
+                return name, True
+            except NotFound:
+                return name, True
+            except Exception as e:
+                logger.error("Failed to %s container %s: %s", action, name, e)
+                return name, False
+        
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(names), _MAX_PARALLEL_ACTIONS)) as executor:
+            return dict(executor.map(run, names))
+    
+    def cleanup_all_managed_containers(self, timeout: int = 30) -> Dict[str, bool]:
         """
         Cleanup all managed containers.
         
+        Containers are looked up once and then stopped and removed
+        concurrently; those that fail to stop gracefully are force removed.
+        
+        Args:
+            timeout: Timeout in seconds for graceful stop
+            
         Returns:
             Dict mapping container names to cleanup success status
         """
-        results = {}
+        with self._lock:
+            names = list(self.managed_containers)
+        if not names:
+            return {}
+        
+        ids = self._container_ids(names)
+        stopped = self._batch_action(ids, names, 'stop', timeout=timeout)
+        
+        graceful = [name for name in names if stopped[name]]
+        forced = [name for name in names if not stopped[name]]
+        for name in forced:
+            logger.warning("Graceful stop failed, force removing container: %s", name)
+        
+        results = self._batch_action(ids, graceful, 'remove')
+        results.update(self._batch_action(ids, forced, 'remove', force=True))
         
-        for container_name in list(self.managed_containers.keys()):
-            results[container_name] = self.stop_and_remove_container(container_name)
+        # Update tracking for everything that is gone now
+        with self._lock:
+            for name, removed in results.items():
+                if removed:
+                    self.managed_containers.pop(name, None)
+        for name, removed in results.items():
+            if removed:
+                logger.info("✓ Container removed successfully: %s", name)
         
-        return results
+        return {name: results[name] for name in names}
@@ -6,23 +6,55 @@ Main deployment orchestrator that uses modular components to handle Docker deplo
 Replaces the monolithic deployment_manager.py with a clean, modular architecture.
 """
 
+import io
 import os
+import asyncio
+import heapq
 import logging
+import tarfile
 import tempfile
-import shutil
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
-import docker
+from string import Template
+from typing import IO, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from docker.errors import DockerException, BuildError, APIError
+from docker.utils.build import exclude_paths
 
 from .container_manager import ContainerManager, ContainerConfig, ContainerStatus
 from .health_checker import HealthChecker, HealthCheckConfig, HealthStatus, ApplicationHealth
 
 logger = logging.getLogger(__name__)
 
+# Kernel socket tables listing local TCP endpoints (Linux only)
+_PROC_NET_TCP = ('/proc/net/tcp', '/proc/net/tcp6')
+_TCP_LISTEN = '0A'
+
+# Top-level source directories left out of the build context
+_CONTEXT_SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules'})
+
+# Build contexts up to this size are packed in memory, larger ones spill
+# to a temporary file
+_CONTEXT_SPOOL_SIZE = 64 * 1024 * 1024
+
+# Seconds the published container ports are reused between port scans
+_PORT_CACHE_TTL = 2.0
+
+# Upper bound on deployments stopped at once by cleanup_old_deployments
+_MAX_PARALLEL_STOPS = 8
+
+# Upper bound on health checks run at once by refresh_all_health
+_MAX_PARALLEL_HEALTH_CHECKS = 16
+
+# Ports probed above the requested start port before asking the kernel
+# for an ephemeral port instead
+_PORT_SCAN_WINDOW = 100
+
 
 @dataclass
 class DeploymentConfig:
@@ -52,6 +84,207 @@ class DeploymentResult:
     deployment_time: float
     error_message: Optional[str] = None
     logs_path: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.now)
+
+
+# Default build files; only the port and framework name vary per deployment
+_PYTHON_DOCKERFILE = Template("""FROM python:3.11-slim
+
+WORKDIR /app
+
+# Copy requirements first for better caching
+COPY requirements.txt* ./
+RUN if [ -f requirements.txt ]; then pip install --no-cache-dir -r requirements.txt; fi
+
+# Copy application code
+COPY . .
+
+# Make start script executable
+RUN chmod +x start.sh
+
+# Expose port
+EXPOSE ${port}
+
+# Health check
+HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
+    CMD curl -f http://localhost:${port}/health || exit 1
+
+# Run application
+CMD ["./start.sh"]
+""")
+
+_NODE_DOCKERFILE = Template("""FROM node:18-alpine
+
+WORKDIR /app
+
+# Copy package files first for better caching
+COPY package*.json ./
+RUN npm ci --only=production
+
+# Copy application code
+COPY . .
+
+# Make start script executable
+RUN chmod +x start.sh
+
+# Expose port
+EXPOSE ${port}
+
+# Health check
+HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
+    CMD curl -f http://localhost:${port}/health || exit 1
+
+# Run application
+CMD ["./start.sh"]
+""")
+
+_FASTAPI_START_SCRIPT = Template("""#!/bin/bash
+set -e
+
+echo "Starting ${framework} application..."
+
+# Install dependencies if requirements.txt exists
+if [ -f requirements.txt ]; then
+    echo "Installing dependencies..."
+    pip install -r requirements.txt
+fi
+
+# Start the application
+if [ -f main.py ]; then
+    echo "Starting with uvicorn..."
+    uvicorn main:app --host 0.0.0.0 --port ${port}
+elif [ -f app.py ]; then
+    echo "Starting with uvicorn..."
+    uvicorn app:app --host 0.0.0.0 --port ${port}
+else
+    echo "No main.py or app.py found, starting with python..."
+    python -m uvicorn main:app --host 0.0.0.0 --port ${port}
+fi
+""")
+
+_FLASK_START_SCRIPT = Template("""#!/bin/bash
+set -e
+
+echo "Starting ${framework} application..."
+
+# Install dependencies if requirements.txt exists
+if [ -f requirements.txt ]; then
+    echo "Installing dependencies..."
+    pip install -r requirements.txt
+fi
+
+# Start the application
+export FLASK_APP=main.py
+export FLASK_RUN_HOST=0.0.0.0
+export FLASK_RUN_PORT=${port}
+flask run
+""")
+
+_GENERIC_START_SCRIPT = Template("""#!/bin/bash
+set -e
+
+echo "Starting application..."
+
+# Start the application based on available files
+if [ -f main.py ]; then
+    python main.py
+elif [ -f app.py ]; then
+    python app.py
+elif [ -f package.json ]; then
+    npm start
+else
+    echo "No known entry point found"
+    exit 1
+fi
+""")
+
+# Templates by case-folded language and framework; anything else gets the
+# Node Dockerfile and the generic start script
+_DOCKERFILE_TEMPLATES = {'python': _PYTHON_DOCKERFILE}
+_START_SCRIPT_TEMPLATES = {'fastapi': _FASTAPI_START_SCRIPT, 'flask': _FLASK_START_SCRIPT}
+
+
+@lru_cache(maxsize=64)
+def _render_dockerfile(language: str, port: int) -> str:
+    """Render the default Dockerfile, reusing the text for a repeated language and port."""
+    return _DOCKERFILE_TEMPLATES.get(language, _NODE_DOCKERFILE).substitute(port=port)
+
+
+@lru_cache(maxsize=64)
+def _render_start_script(framework: str, port: int) -> str:
+    """Render the start script, reusing the text for a repeated framework and port."""
+    template = _START_SCRIPT_TEMPLATES.get(framework.casefold(), _GENERIC_START_SCRIPT)
+    return template.substitute(port=port, framework=framework)
+
+
+def _dockerignore_patterns(source: Path) -> List[str]:
+    """Read the exclude patterns of a source tree's .dockerignore, if any."""
+    try:
+        lines = (source / '.dockerignore').read_text().splitlines()
+    except OSError:
+        return []
+    return [line for line in map(str.strip, lines) if line and not line.startswith('#')]
+
+
+def _add_archive_member(tar: tarfile.TarFile, name: str, content: bytes, mode: int = 0o644):
+    """Add an in-memory file to a tar archive."""
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    info.mode = mode
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(content))
+
+
+def _dockerfile_bases(dockerfile: bytes) -> Optional[frozenset]:
+    """
+    Find the base images a Dockerfile builds from.
+    
+    Args:
+        dockerfile: Dockerfile content
+        
+    Returns:
+        Images named by FROM lines, leaving out earlier build stages and
+        scratch; None if a base is set through a build argument
+    """
+    stages = set()
+    bases = set()
+    for line in dockerfile.decode(errors='replace').splitlines():
+        words = line.split()
+        if not words or words[0].upper() != 'FROM':
+            continue
+        words = [word for word in words[1:] if not word.startswith('--')]
+        if not words:
+            continue
+        image = words[0]
+        if '$' in image:
+            return None
+        if image.lower() not in stages and image != 'scratch':
+            bases.add(image)
+        if len(words) >= 3 and words[1].upper() == 'AS':
+            stages.add(words[2].lower())
+    return frozenset(bases)
+
+
+def _snapshot_used_ports() -> set:
+    """
+    Read the ports of listening TCP sockets from /proc/net/tcp{,6}.
+    
+    Returns:
+        Set of local ports in LISTEN state; empty where the tables are not
+        available, leaving bind() probes to find taken ports
+    """
+    ports = set()
+    for table in _PROC_NET_TCP:
+        try:
+            with open(table) as f:
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 3 and fields[3] == _TCP_LISTEN:
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+        except (OSError, ValueError):
+            continue
+    return ports
 
 
 class DockerDeployer:
@@ -81,55 +314,128 @@ class DockerDeployer:
         self.container_manager = ContainerManager()
         self.health_checker = HealthChecker()
         
+        # One pooled client for port scans and builds, shared with the
+        # container manager instead of opening a new connection per call
+        self.docker_client = self.container_manager.docker_client
+        
         # Track active deployments
         self.active_deployments: Dict[str, DeploymentResult] = {}
+        # Health check configuration each active deployment was verified with
+        self._health_configs: Dict[str, HealthCheckConfig] = {}
+        # (monotonic time, host ports published by running containers)
+        self._port_cache: Optional[Tuple[float, set]] = None
+        
+        # Auto-assigned ports of deploys still in progress
+        self._reserved_ports: set = set()
+        self._port_lock = threading.Lock()
+        
+        # Base images already pulled fresh by a build of this deployer
+        self._pulled_bases: set = set()
         
         logger.debug("✓ DockerDeployer initialized with modular components")
     
+    def close(self):
+        """Stop the container event stream and close the shared Docker client."""
+        self.container_manager.close()
+        try:
+            self.docker_client.close()
+        except Exception as e:
+            logger.debug(f"Failed to close Docker client: {e}")
+    
     def _find_next_available_port(self, start_port: int = 8000) -> int:
         """
         Find the next available port starting from start_port, incrementing by 1.
         
+        If none of the first ports above start_port is free, a kernel-assigned
+        ephemeral port is used instead.
+        
         Args:
             start_port: Starting port number (default: 8000)
             
         Returns:
             int: Next available port number
         """
-        current_port = start_port
-        
-        # Check currently used ports by active deployments
-        used_ports = set()
-        for deployment in self.active_deployments.values():
+        # Check currently used ports by active and in-progress deployments
+        used_ports = set(self._reserved_ports)
+        # Concurrent deploys add to active_deployments, so walk a snapshot
+        for deployment in list(self.active_deployments.values()):
             for host_port in deployment.port_mappings.values():
                 used_ports.add(host_port)
         
         # Check Docker containers
+        used_ports |= self._docker_used_ports()
+        
+        # Listening sockets from one read of the kernel tables, so taken
+        # ports are skipped without a bind() each
+        used_ports |= _snapshot_used_ports()
+        
+        # Find next available port near start_port, keeping the 8000, 8001, ...
+        # numbering; a crowded range is handed to the kernel instead of being
+        # probed one bind at a time up to 65535
+        for current_port in range(start_port, min(start_port + _PORT_SCAN_WINDOW, 65536)):
+            if current_port not in used_ports and not self._is_port_in_use(current_port):
+                break
+        else:
+            current_port = self._ephemeral_port(used_ports)
+        
+        logger.info(f"🔌 Found next available port: {current_port}")
+        return current_port
+    
+    def _docker_used_ports(self) -> set:
+        """
+        Get the host ports published by running containers.
+        
+        The result is reused for a short while, so a burst of deploys lists
+        containers once instead of once per deploy.
+        
+        Returns:
+            Set of published host ports
+        """
+        cached = self._port_cache
+        if cached is not None and time.monotonic() - cached[0] < _PORT_CACHE_TTL:
+            return cached[1]
+        
+        used_ports = set()
         try:
-            docker_client = docker.from_env()
-            containers = docker_client.containers.list()
-            for container in containers:
-                if container.ports:
-                    for port_mapping in container.ports.values():
-                        if port_mapping:
-                            for mapping in port_mapping:
-                                if mapping.get('HostPort'):
-                                    used_ports.add(int(mapping['HostPort']))
+            # The raw list already carries each container's published ports;
+            # containers.list() would inspect every container on top of it
+            for container in self.docker_client.api.containers(filters={'status': 'running'}):
+                for mapping in container.get('Ports') or ():
+                    if mapping.get('PublicPort'):
+                        used_ports.add(mapping['PublicPort'])
         except Exception as e:
             logger.warning(f"Could not check Docker container ports: {e}")
+            return used_ports  # Not cached, so the next scan asks again
         
-        # Find next available port
-        while current_port in used_ports or self._is_port_in_use(current_port):
-            current_port += 1
-            if current_port > 65535:  # Max port number
-                raise RuntimeError("No available ports found")
+        self._port_cache = (time.monotonic(), used_ports)
+        return used_ports
+    
+    def _ephemeral_port(self, used_ports: set) -> int:
+        """
+        Ask the kernel for a free port by binding to port 0.
         
-        logger.info(f"🔌 Found next available port: {current_port}")
-        return current_port
+        Args:
+            used_ports: Ports already published by deployments or containers
+            
+        Returns:
+            int: A port that was free when checked
+        """
+        for _ in range(10):
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                # Let the container bind the port as soon as it is released
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(('', 0))
+                port = sock.getsockname()[1]
+            if port not in used_ports:
+                return port
+        raise RuntimeError("No available ports found")
     
     def _is_port_in_use(self, port: int) -> bool:
         """
-        Check if a port is currently in use on localhost.
+        Check if a port is currently in use on any interface.
+        
+        The probe binds the wildcard address as Docker does when publishing
+        a port, and sets SO_REUSEADDR so ports left in TIME_WAIT count as free.
         
         Args:
             port: Port number to check
@@ -138,8 +444,9 @@ class DockerDeployer:
             bool: True if port is in use, False otherwise
         """
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
-                sock.bind(('localhost', port))
+                sock.bind(('', port))
                 return False
             except socket.error:
                 return True
@@ -157,10 +464,15 @@ class DockerDeployer:
         start_time = datetime.now()
         logger.info(f"🚀 Starting deployment for iteration: {config.iteration_id}")
         
-        # Auto-increment port if base_port is 8000 (default) to avoid conflicts
+        # Auto-increment port if base_port is 8000 (default) to avoid conflicts;
+        # the port stays reserved until this deploy is tracked or has failed,
+        # so concurrent deploys cannot pick it as well
+        reserved_port = None
         if config.base_port == 8000:
-            auto_port = self._find_next_available_port(8000)
-            config.base_port = auto_port
+            with self._port_lock:
+                auto_port = self._find_next_available_port(8000)
+                self._reserved_ports.add(auto_port)
+            reserved_port = config.base_port = auto_port
             logger.info(f"🔌 Auto-assigned port {auto_port} to avoid conflicts")
         
         # Create deployment result
@@ -172,7 +484,8 @@ class DockerDeployer:
             image_name=f"coval-{config.iteration_id}:latest",
             port_mappings={8000: config.base_port},
             health_status=HealthStatus.UNKNOWN,
-            deployment_time=0.0
+            deployment_time=0.0,
+            started_at=start_time
         )
         
         try:
@@ -221,6 +534,8 @@ class DockerDeployer:
             
             # Track the deployment
             self.active_deployments[config.iteration_id] = result
+            self._health_configs[config.iteration_id] = health_config
+            self._port_cache = None  # The new container publishes a port
             
         except Exception as e:
             logger.error(f"❌ Deployment failed with exception: {e}")
@@ -228,9 +543,28 @@ class DockerDeployer:
         
         finally:
             result.deployment_time = (datetime.now() - start_time).total_seconds()
+            if reserved_port is not None:
+                with self._port_lock:
+                    self._reserved_ports.discard(reserved_port)
         
         return result
     
+    async def adeploy(self, config: DeploymentConfig) -> DeploymentResult:
+        """
+        Deploy an iteration without blocking the event loop.
+        
+        The deploy runs in a worker thread, so several iterations can be
+        deployed concurrently with asyncio.gather; auto-assigned ports are
+        reserved so concurrent deploys never share one.
+        
+        Args:
+            config: Deployment configuration
+            
+        Returns:
+            DeploymentResult: Result of the deployment
+        """
+        return await asyncio.to_thread(self.deploy, config)
+    
     def stop_deployment(self, iteration_id: str) -> bool:
         """
         Stop a deployment and cleanup resources.
@@ -255,6 +589,9 @@ class DockerDeployer:
             # Remove from active deployments
             if iteration_id in self.active_deployments:
                 del self.active_deployments[iteration_id]
+            self._health_configs.pop(iteration_id, None)
+            if success:
+                self._port_cache = None  # Its port is free again
             
             if success:
                 logger.info(f"✅ Deployment stopped successfully: {iteration_id}")
@@ -291,6 +628,66 @@ class DockerDeployer:
         """List all active deployments."""
         return list(self.active_deployments.values())
     
+    async def alist_active_deployments(self) -> List[DeploymentResult]:
+        """
+        List all active deployments with their health status probed now.
+        
+        The health checks run concurrently via refresh_all_health in a worker
+        thread, so the event loop stays free while they are in flight.
+        
+        Returns:
+            List of DeploymentResult for active deployments
+        """
+        await asyncio.to_thread(self.refresh_all_health)
+        return self.list_active_deployments()
+    
+    def refresh_all_health(self, timeout: float = 5.0) -> Dict[str, HealthStatus]:
+        """
+        Check every active deployment's health now, concurrently.
+        
+        The checks run in a thread pool, so the refresh takes about as long
+        as the slowest check rather than the sum of all of them.
+        
+        Args:
+            timeout: Seconds to wait for the whole refresh
+            
+        Returns:
+            Dict mapping iteration IDs to their refreshed health status;
+            deployments whose check did not finish in time get TIMEOUT
+        """
+        deployments = list(self.active_deployments.items())
+        if not deployments:
+            return {}
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(_MAX_PARALLEL_HEALTH_CHECKS, len(deployments)),
+            thread_name_prefix="coval-health"
+        )
+        futures = {}
+        try:
+            for iteration_id, deployment in deployments:
+                port = next(iter(deployment.port_mappings.values()), None)
+                if port is None:
+                    continue  # Nothing published to probe
+                config = self._health_configs.get(iteration_id) or self.health_checker.get_health_config_for_framework('')
+                futures[executor.submit(self.health_checker.perform_health_check, "localhost", port, config)] = deployment
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            # Checks still running finish in the background; nobody waits for them
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        statuses = {}
+        for future, deployment in futures.items():
+            if future not in done:
+                deployment.health_status = HealthStatus.TIMEOUT
+            elif future.exception() is not None:
+                logger.warning(f"Health check failed for {deployment.iteration_id}: {future.exception()}")
+                deployment.health_status = HealthStatus.FAILED
+            else:
+                deployment.health_status = future.result().status
+            statuses[deployment.iteration_id] = deployment.health_status
+        return statuses
+    
     def get_health_report(self, iteration_id: str) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive health report for a deployment.
@@ -315,21 +712,21 @@ class DockerDeployer:
         """
         logger.info(f"🧹 Cleaning up old deployments (keeping {keep_count})")
         
-        # Sort deployments by deployment time (most recent first)
-        sorted_deployments = sorted(
+        # Keep the most recently started deployments, cleanup the rest;
+        # deployment_time is how long a deploy took, not when it happened
+        newest = heapq.nlargest(
+            max(keep_count, 0),
             self.active_deployments.items(),
-            key=lambda x: x[1].deployment_time,
-            reverse=True
+            key=lambda x: x[1].started_at
         )
+        results = {iteration_id: True for iteration_id, _ in newest}  # Kept
+        to_stop = [iteration_id for iteration_id in self.active_deployments if iteration_id not in results]
         
-        results = {}
-        
-        # Keep the most recent deployments, cleanup the rest
-        for i, (iteration_id, deployment) in enumerate(sorted_deployments):
-            if i >= keep_count:
-                results[iteration_id] = self.stop_deployment(iteration_id)
-            else:
-                results[iteration_id] = True  # Kept
+        # Each stop waits on the daemon for its own container, so run them together
+        if to_stop:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_STOPS, len(to_stop)),
+                                    thread_name_prefix="coval-cleanup") as executor:
+                results.update(zip(to_stop, executor.map(self.stop_deployment, to_stop)))
         
         return results
     
@@ -345,20 +742,25 @@ class DockerDeployer:
             bool: True if built successfully, False otherwise
         """
         try:
-            # Prepare build context
-            build_context = self._prepare_build_context(config)
-            
-            # Build image
-            docker_client = self.container_manager.docker_client
+            # Pull base image updates once per deployer; later builds use the
+            # local base and keep its layer cache instead of asking the registry
+            dockerfile = self._dockerfile_text(config)
+            bases = _dockerfile_bases(dockerfile)
+            pull = bases is None or not bases <= self._pulled_bases
             
-            logger.debug(f"Building image: {result.image_name}")
-            image, build_logs = docker_client.images.build(
-                path=str(build_context),
-                tag=result.image_name,
-                rm=True,  # Remove intermediate containers
-                forcerm=True,  # Always remove intermediate containers
-                pull=True  # Pull base image updates
-            )
+            # Stream the build context as a tar instead of staging a copy on disk
+            with self._build_context_archive(config, dockerfile) as build_context:
+                logger.debug(f"Building image: {result.image_name}")
+                image, build_logs = self.docker_client.images.build(
+                    fileobj=build_context,
+                    custom_context=True,
+                    tag=result.image_name,
+                    rm=True,  # Remove intermediate containers
+                    forcerm=True,  # Always remove intermediate containers
+                    pull=pull
+                )
+            if pull and bases:
+                self._pulled_bases |= bases
             
             logger.info(f"✅ Image built successfully: {result.image_name}")
             return True
@@ -374,171 +776,70 @@ class DockerDeployer:
             result.error_message = error_msg
             return False
     
-    def _prepare_build_context(self, config: DeploymentConfig) -> Path:
+    def _dockerfile_text(self, config: DeploymentConfig) -> bytes:
         """
-        Prepare build context directory with all necessary files.
+        Get the Dockerfile a build will use.
         
         Args:
             config: Deployment configuration
             
         Returns:
-            Path: Path to the build context directory
-        """
-        # Create temporary build context
-        build_context = self.deployments_dir / f"build-{config.iteration_id}"
-        build_context.mkdir(exist_ok=True)
-        
-        # Copy source files
-        if config.source_path.is_dir():
-            # Copy entire directory
-            for item in config.source_path.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, build_context)
-                elif item.is_dir() and item.name not in {'.git', '__pycache__', 'node_modules'}:
-                    shutil.copytree(item, build_context / item.name, dirs_exist_ok=True)
-        else:
-            # Copy single file
-            shutil.copy2(config.source_path, build_context)
-        
-        # Ensure Dockerfile exists
-        dockerfile_path = build_context / "Dockerfile"
-        if not dockerfile_path.exists():
-            if config.dockerfile_path and config.dockerfile_path.exists():
-                shutil.copy2(config.dockerfile_path, dockerfile_path)
-            else:
-                # Create basic Dockerfile based on framework
-                self._create_default_dockerfile(config, dockerfile_path)
+            The source tree's Dockerfile, else the configured one, else the
+            rendered default
+        """
+        source = config.source_path
+        candidate = source / "Dockerfile" if source.is_dir() else source
+        if candidate.name == "Dockerfile" and candidate.is_file():
+            return candidate.read_bytes()
+        if config.dockerfile_path and config.dockerfile_path.exists():
+            return config.dockerfile_path.read_bytes()
+        return self._render_default_dockerfile(config).encode()
+    
+    def _build_context_archive(self, config: DeploymentConfig, dockerfile: Optional[bytes] = None) -> IO[bytes]:
+        """
+        Pack the build context into a tar archive for images.build().
         
-        # Create start script if needed
-        start_script = build_context / "start.sh"
-        if not start_script.exists():
-            self._create_start_script(config, start_script)
+        Source files are read straight into the archive, with the Dockerfile
+        and start script added from memory when the source has none, so the
+        context is never copied to disk first. .dockerignore is honoured as
+        a path build would. The archive is kept in memory up to a limit and
+        spills to a temporary file beyond it.
         
-        return build_context
-    
-    def _create_default_dockerfile(self, config: DeploymentConfig, dockerfile_path: Path):
-        """Create a default Dockerfile based on the framework."""
-        if config.language.lower() == 'python':
-            dockerfile_content = f"""FROM python:3.11-slim
-
-WORKDIR /app
-
-# Copy requirements first for better caching
-COPY requirements.txt* ./
-RUN if [ -f requirements.txt ]; then pip install --no-cache-dir -r requirements.txt; fi
-
-# Copy application code
-COPY . .
-
-# Make start script executable
-RUN chmod +x start.sh
-
-# Expose port
-EXPOSE {config.base_port}
-
-# Health check
-HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
-    CMD curl -f http://localhost:{config.base_port}/health || exit 1
-
-# Run application
-CMD ["./start.sh"]
-"""
+        Args:
+            config: Deployment configuration
+            dockerfile: Dockerfile content if already read
+            
+        Returns:
+            File object positioned at the start of the archive
+        """
+        source = config.source_path
+        if source.is_dir():
+            root = str(source)
+            patterns = [*_dockerignore_patterns(source), *_CONTEXT_SKIP_DIRS]
+            files = sorted(exclude_paths(root, patterns, dockerfile='Dockerfile'))
         else:
-            dockerfile_content = f"""FROM node:18-alpine
-
-WORKDIR /app
-
-# Copy package files first for better caching
-COPY package*.json ./
-RUN npm ci --only=production
-
-# Copy application code
-COPY . .
-
-# Make start script executable
-RUN chmod +x start.sh
-
-# Expose port
-EXPOSE {config.base_port}
-
-# Health check
-HEALTHCHECK --interval=30s --timeout=10s --start-period=60s --retries=3 \\
-    CMD curl -f http://localhost:{config.base_port}/health || exit 1
-
-# Run application
-CMD ["./start.sh"]
-"""
+            root, files = str(source.parent), [source.name]
         
-        dockerfile_path.write_text(dockerfile_content)
-        logger.debug(f"Created default Dockerfile for {config.language}")
-    
-    def _create_start_script(self, config: DeploymentConfig, start_script_path: Path):
-        """Create a start script for the application."""
-        if config.framework.lower() == 'fastapi':
-            script_content = f"""#!/bin/bash
-set -e
-
-echo "Starting {config.framework} application..."
-
-# Install dependencies if requirements.txt exists
-if [ -f requirements.txt ]; then
-    echo "Installing dependencies..."
-    pip install -r requirements.txt
-fi
-
-# Start the application
-if [ -f main.py ]; then
-    echo "Starting with uvicorn..."
-    uvicorn main:app --host 0.0.0.0 --port {config.base_port}
-elif [ -f app.py ]; then
-    echo "Starting with uvicorn..."
-    uvicorn app:app --host 0.0.0.0 --port {config.base_port}
-else
-    echo "No main.py or app.py found, starting with python..."
-    python -m uvicorn main:app --host 0.0.0.0 --port {config.base_port}
-fi
-"""
-        elif config.framework.lower() == 'flask':
-            script_content = f"""#!/bin/bash
-set -e
-
-echo "Starting {config.framework} application..."
-
-# Install dependencies if requirements.txt exists
-if [ -f requirements.txt ]; then
-    echo "Installing dependencies..."
-    pip install -r requirements.txt
-fi
-
-# Start the application
-export FLASK_APP=main.py
-export FLASK_RUN_HOST=0.0.0.0
-export FLASK_RUN_PORT={config.base_port}
-flask run
-"""
-        else:
-            # Generic script
-            script_content = f"""#!/bin/bash
-set -e
-
-echo "Starting application..."
-
-# Start the application based on available files
-if [ -f main.py ]; then
-    python main.py
-elif [ -f app.py ]; then
-    python app.py
-elif [ -f package.json ]; then
-    npm start
-else
-    echo "No known entry point found"
-    exit 1
-fi
-"""
+        archive = tempfile.SpooledTemporaryFile(max_size=_CONTEXT_SPOOL_SIZE)
+        with tarfile.open(fileobj=archive, mode='w') as tar:
+            for path in files:
+                tar.add(os.path.join(root, path), arcname=path, recursive=False)
+            
+            if 'Dockerfile' not in files:
+                _add_archive_member(tar, 'Dockerfile', dockerfile or self._dockerfile_text(config))
+            if 'start.sh' not in files:
+                _add_archive_member(tar, 'start.sh', self._render_start_script(config).encode(), 0o755)
         
-        start_script_path.write_text(script_content)
-        start_script_path.chmod(0o755)
-        logger.debug(f"Created start script for {config.framework}")
+        archive.seek(0)
+        return archive
+    
+    def _render_default_dockerfile(self, config: DeploymentConfig) -> str:
+        """Render the default Dockerfile for the deployment's language."""
+        return _render_dockerfile(config.language.casefold(), config.base_port)
+    
+    def _render_start_script(self, config: DeploymentConfig) -> str:
+        """Render the start script for the deployment's framework."""
+        return _render_start_script(config.framework, config.base_port)
     
     def _create_and_start_container(self, config: DeploymentConfig, result: DeploymentResult) -> Optional[ContainerStatus]:
         """
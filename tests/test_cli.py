@@ -3,7 +3,7 @@ Unit tests for CLI interface.
 Tests the command-line interface with modular components.
 """
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, AsyncMock, patch
 from click.testing import CliRunner
 
 from coval.cli import cli, COVALOrchestrator
@@ -51,8 +51,8 @@ class TestCOVALOrchestrator:
     """Test cases for COVALOrchestrator class."""
     
     @patch('coval.cli.IterationManager')
-    @patch('coval.cli.GenerationEngine')
-    @patch('coval.cli.DockerDeployer')
+    @patch('coval.engines.generation_engine.GenerationEngine')
+    @patch('coval.deployers.docker_deployer.DockerDeployer')
     @patch('pathlib.Path.mkdir')
     @patch('logging.FileHandler')
     def test_initialization_with_mocks(self, mock_filehandler, mock_mkdir, mock_deployer, mock_engine, mock_iter):
@@ -63,6 +63,19 @@ class TestCOVALOrchestrator:
         assert hasattr(orchestrator, 'deployment_manager')
         assert hasattr(orchestrator, 'iteration_manager')
     
+    def test_refresh_iterations_reloads_only_on_change(self, tmp_path):
+        """Test that iterations are reloaded only when the history file changes."""
+        orchestrator = COVALOrchestrator(str(tmp_path))
+        
+        with patch.object(orchestrator.iteration_manager, 'reload') as mock_reload:
+            orchestrator.refresh_iterations()
+            mock_reload.assert_not_called()
+            
+            (tmp_path / "iteration_history.json").write_text("[]")
+            orchestrator.refresh_iterations()
+            orchestrator.refresh_iterations()
+            mock_reload.assert_called_once()
+    
     def test_generate_command_missing_description(self):
         """Test generate command without required description."""
         runner = CliRunner()
@@ -76,7 +89,9 @@ class TestCOVALOrchestrator:
         # Mock orchestrator with empty iterations
         mock_orch = Mock()
         mock_orch.iteration_manager.iterations = {}
+        mock_orch.refresh_iterations.return_value = {}
         mock_orch.deployment_manager.active_deployments = []
+        mock_orch.deployment_manager.alist_active_deployments = AsyncMock(return_value=[])
         mock_get_orch.return_value = mock_orch
         
         runner = CliRunner()
@@ -85,6 +100,23 @@ class TestCOVALOrchestrator:
         assert result.exit_code in [0, 1]
 
 
+    @patch('coval.cli.get_orchestrator')
+    def test_stop_all_command(self, mock_get_orch):
+        """Test stopping all deployments concurrently."""
+        mock_orch = Mock()
+        mock_orch.deployment_manager.list_active_deployments.return_value = [
+            Mock(iteration_id='it-1'), Mock(iteration_id='it-2')
+        ]
+        mock_orch.deployment_manager.stop_deployment.side_effect = lambda iteration_id: iteration_id == 'it-1'
+        mock_get_orch.return_value = mock_orch
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['stop'])
+        assert result.exit_code == 0
+        assert "Stopped 1 deployments" in result.output
+        assert mock_orch.deployment_manager.stop_deployment.call_count == 2
+
+
 class TestCLIIntegration:
     """Integration tests for CLI with modular components."""
     
@@ -99,6 +131,8 @@ class TestCLIIntegration:
         mock_orch = Mock()
         mock_orch.deployment_manager.active_deployments = []
         mock_orch.iteration_manager.iterations = {}
+        mock_orch.refresh_iterations.return_value = {}
+        mock_orch.deployment_manager.alist_active_deployments = AsyncMock(return_value=[])
         mock_get_orch.return_value = mock_orch
         
         # Test that status command works with modular deployer
@@ -108,3 +142,26 @@ class TestCLIIntegration:
         # Verify that modular deployer method is called correctly
         # (This tests our fix for list_deployments -> active_deployments)
         assert hasattr(mock_orch.deployment_manager, 'active_deployments')
+
+
+class TestFastPath:
+    """Test cases for the argparse fast path used by hot commands."""
+    
+    @patch('coval.cli._stop_deployments')
+    @patch('coval.cli.get_orchestrator')
+    def test_fast_dispatch_stop(self, mock_get_orch, mock_stop):
+        """Test that stop is handled without Click."""
+        from coval.cli import _fast_dispatch
+        
+        assert _fast_dispatch(['stop', '-i', 'it-1']) is True
+        mock_stop.assert_called_once_with(mock_get_orch.return_value, 'it-1')
+    
+    def test_fast_dispatch_falls_back_to_click(self):
+        """Test that help, unknown options and other commands go through Click."""
+        from coval.cli import _fast_dispatch
+        
+        assert _fast_dispatch(['status', '--help']) is False
+        assert _fast_dispatch(['run', '--unknown']) is False
+        assert _fast_dispatch(['generate', '-d', 'x']) is False
+        assert _fast_dispatch([]) is False
+        assert _fast_dispatch(['stop', '--iter', 'it-1']) is False
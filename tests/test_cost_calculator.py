@@ -0,0 +1,106 @@
+"""
+Unit tests for CostCalculator.
+"""
+import pytest
+from unittest.mock import patch
+
+from coval.core.cost_calculator import CostCalculator, CostMetrics, ReasonFlag, RiskFlag
+
+
+def _metrics(**overrides) -> CostMetrics:
+    values = dict(
+        lines_of_code=500,
+        complexity_score=3.0,
+        technical_debt=10.0,
+        test_coverage=0.8,
+        dependencies_count=4,
+        modification_scope=0.1,
+        historical_success_rate=0.9,
+        iteration_count=1,
+        framework_maturity=0.9,
+        team_familiarity=0.8
+    )
+    values.update(overrides)
+    return CostMetrics(**values)
+
+
+class TestCostCalculator:
+    """Test cases for CostCalculator class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = CostCalculator()
+    
+    def test_compare_iterations_picks_cheapest_modify(self):
+        """Best modify is chosen by cost, not by iteration id."""
+        result = self.calculator.compare_iterations([
+            ("a_expensive", _metrics(lines_of_code=50000, complexity_score=6.0)),
+            ("b_cheap", _metrics(lines_of_code=100)),
+        ])
+        
+        assert result['best_modify'][0] == "b_cheap"
+        assert result['best_generate'] is None
+        assert result['overall_recommendation'] == "Modify iteration b_cheap"
+    
+    def test_compare_iterations_batch_matches_single(self):
+        """Batch scoring gives the same estimates as calculate_cost."""
+        metrics = [
+            ("v1", _metrics()),
+            ("v2", _metrics(modification_scope=0.9, technical_debt=80.0)),
+            ("v3", _metrics(modification_scope=0.5, test_coverage=0.2)),
+        ]
+        
+        result = self.calculator.compare_iterations(metrics)
+        
+        assert result['total_iterations'] == 3
+        for iteration_id, m in metrics:
+            assert result['analyses'][iteration_id] == self.calculator.calculate_cost(m)
+    
+    def test_duplicate_metrics_scored_once(self):
+        """Identical metrics are scored once and memoized across calls."""
+        metrics = _metrics()
+        
+        with patch.object(self.calculator, '_calculate_costs_batch',
+                          wraps=self.calculator._calculate_costs_batch) as batch:
+            result = self.calculator.compare_iterations([("v1", metrics), ("v2", _metrics())])
+            self.calculator.compare_iterations([("v3", metrics)])
+        
+        assert batch.call_args_list[0].args[0] == [metrics]
+        assert batch.call_args_list[1].args[0] == []
+        assert result['analyses']['v1'] == result['analyses']['v2']
+        
+        # Cached estimates are handed out as copies
+        first = self.calculator.calculate_cost(metrics)
+        confidence, flags = first.confidence, first.reasoning_flags
+        first.confidence = -1
+        first.reasoning_flags = 0
+        second = self.calculator.calculate_cost(metrics)
+        assert (second.confidence, second.reasoning_flags) == (confidence, flags)
+    
+    def test_reasoning_and_risks_formatted_from_flags(self):
+        """Flags on the estimate expand to the reasoning and risk messages."""
+        estimate = self.calculator.calculate_cost(
+            _metrics(modification_scope=0.9, technical_debt=70.0, test_coverage=0.2)
+        )
+        
+        assert estimate.reasoning_flags & ReasonFlag.LARGE_SCOPE
+        assert estimate.reasoning_flags & ReasonFlag.HIGH_DEBT
+        assert estimate.risk_flags == RiskFlag.HIGH_DEBT | RiskFlag.LOW_COVERAGE | RiskFlag.LARGE_SCOPE
+        assert "Large scope of changes (90%) favors generation" in estimate.reasoning
+        assert "High technical debt (70.0) suggests fresh start" in estimate.reasoning
+        assert estimate.risk_factors == [
+            "Very high technical debt may cause unexpected issues",
+            "Low test coverage increases chance of regressions",
+            "Large scope changes are inherently risky",
+        ]
+    
+    def test_strong_indicator_is_decisive_for_confidence(self):
+        """A strong indicator decides the action and gets the top cost confidence tier."""
+        metrics = _metrics(modification_scope=0.9, test_coverage=0.5,
+                           historical_success_rate=0.5)
+        
+        estimate = self.calculator.calculate_cost(metrics)
+        
+        assert estimate.recommended_action == 'generate'
+        # Cost tier 0.9, coverage 0.6, history 0.5, clear scope 0.8
+        assert estimate.confidence == pytest.approx((0.9 + 0.6 + 0.5 + 0.8) / 4)
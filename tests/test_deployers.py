@@ -2,14 +2,24 @@
 Unit tests for modular deployer components.
 Tests the new Docker deployment system with proper container lifecycle management.
 """
+import asyncio
+import shutil
+import socket
+import tarfile
+import tempfile
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from pathlib import Path
 
+from docker.errors import ImageNotFound
+
 from coval.deployers.container_manager import ContainerManager, ContainerConfig, ContainerStatus
 from coval.deployers.health_checker import HealthChecker, HealthStatus
-from coval.deployers.docker_deployer import DockerDeployer, DeploymentConfig, DeploymentResult
+from coval.deployers.docker_deployer import DockerDeployer, DeploymentConfig, DeploymentResult, _snapshot_used_ports
 
 
 class TestContainerManager:
@@ -54,16 +64,365 @@ class TestContainerManager:
     @patch('coval.deployers.container_manager.logger')
     def test_force_cleanup_container(self, mock_logger, mock_docker):
         """Test force cleanup of existing containers."""
-        # Mock container that exists and needs cleanup
-        mock_container = Mock()
-        mock_docker.return_value.containers.get.return_value = mock_container
+        # Mock a running container that exists and needs cleanup
+        api = mock_docker.return_value.api
+        api.inspect_container.return_value = {'State': {'Running': True}}
         
         manager = ContainerManager()
         manager._force_cleanup_container("test-container")
         
         # Should attempt to stop and remove the container
-        mock_container.stop.assert_called_once()
-        mock_container.remove.assert_called_once()
+        api.stop.assert_called_once_with("test-container", timeout=10)
+        api.remove_container.assert_called_once_with("test-container", v=False, force=True)
+
+
+class TestContainerManagerMockedClient:
+    """Test cases for ContainerManager operations with a mocked Docker client."""
+    
+    def setup_method(self):
+        """Set up a manager backed by a mocked Docker client."""
+        self.docker_patcher = patch('coval.deployers.container_manager.docker.from_env')
+        self.mock_from_env = self.docker_patcher.start()
+        self.mock_client = self.mock_from_env.return_value
+        self.api = self.mock_client.api
+        self.api.base_url = 'http+docker://localhost'
+        self.api.containers.return_value = []
+        self.api.images.return_value = [{'RepoTags': ['img:latest']}]
+        self.manager = ContainerManager()
+    
+    def teardown_method(self):
+        """Stop patching the Docker client."""
+        self.docker_patcher.stop()
+    
+    def _track(self, *names):
+        for name in names:
+            self.manager.managed_containers[name] = ContainerStatus(
+                container_id=None, name=name, status='running', ports={},
+                created_at=None, started_at=None, stopped_at=None
+            )
+    
+    def test_cleanup_all_batches_api_calls(self):
+        """Cleanup lists containers once and force removes failed stops."""
+        self._track('app-a', 'app-b', 'app-c')
+        self.api.containers.return_value = [
+            {'Id': 'id-a', 'Names': ['/app-a']},
+            {'Id': 'id-b', 'Names': ['/app-b']},
+            {'Id': 'id-ab', 'Names': ['/app-a-b']},
+        ]
+        
+        def stop(container_id, **kwargs):
+            if container_id == 'id-b':
+                raise Exception("stuck")
+        self.api.stop.side_effect = stop
+        
+        results = self.manager.cleanup_all_managed_containers()
+        
+        assert results == {'app-a': True, 'app-b': True, 'app-c': True}
+        self.api.containers.assert_called_once()
+        self.api.remove_container.assert_any_call('id-a')
+        self.api.remove_container.assert_any_call('id-b', force=True)
+        assert self.api.remove_container.call_count == 2
+        assert self.manager.managed_containers == {}
+    
+    def test_lifecycle_calls_skip_inspect(self):
+        """Start, stop and remove address the API by name without an inspect."""
+        self._track('app-a')
+        
+        assert self.manager.start_container('app-a')
+        assert self.manager.stop_container('app-a', timeout=5)
+        assert self.manager.remove_container('app-a')
+        
+        self.api.start.assert_called_once_with('app-a')
+        self.api.stop.assert_called_once_with('app-a', timeout=5)
+        self.api.remove_container.assert_called_once_with('app-a', force=False)
+        self.mock_client.containers.get.assert_not_called()
+        assert 'app-a' not in self.manager.managed_containers
+    
+    def test_status_polling_reuses_inspect(self):
+        """Repeated status reads share one inspect until an action runs."""
+        self._track('app-a')
+        self.api.inspect_container.return_value = {
+            'Id': 'id-a', 'State': {'Status': 'exited', 'ExitCode': 3}
+        }
+        
+        self.api.wait.side_effect = Exception("wait unavailable")
+        
+        for _ in range(5):
+            status = self.manager.get_container_status('app-a')
+        self.manager.start_container('app-a')
+        waiter = self.manager._waiters.get('app-a')
+        if waiter is not None:
+            waiter.join(timeout=5)
+        self.manager.get_container_status('app-a')
+        
+        assert status.status == 'exited'
+        assert status.exit_code == 3
+        assert self.api.inspect_container.call_count == 2
+    
+    def test_untracked_status_parsed_from_state(self):
+        """Untracked containers report status, exit code and start time."""
+        self.api.inspect_container.return_value = {
+            'Id': 'id-x',
+            'State': {'Status': 'exited', 'ExitCode': 1, 'StartedAt': '2024-05-01T10:00:00.123456789Z'}
+        }
+        
+        status = self.manager.get_container_status('external')
+        
+        assert (status.container_id, status.status, status.exit_code) == ('id-x', 'exited', 1)
+        assert status.started_at.tzinfo is None
+        
+        self.api.inspect_container.return_value = {'Id': 'id-y', 'State': {'StartedAt': '0001-01-01T00:00:00Z'}}
+        status = self.manager.get_container_status('never-started')
+        assert (status.status, status.started_at) == ('unknown', None)
+    
+    def test_events_update_tracked_status(self):
+        """Container events update tracking without further inspects."""
+        self.api.create_container.return_value = {'Id': 'id-a'}
+        self.mock_client.events.return_value = iter([
+            {'Action': 'start', 'Actor': {'Attributes': {'name': 'app-a'}}},
+            {'Action': 'die', 'Actor': {'Attributes': {'name': 'app-a', 'exitCode': '137'}}},
+            {'Action': 'die', 'Actor': {'Attributes': {'name': 'other'}}},
+        ])
+        config = ContainerConfig(name='app-a', image='img', ports={}, volumes={}, environment={})
+        
+        self.manager.create_container(config)
+        self.manager._events_thread.join(timeout=5)
+        status = self.manager.managed_containers['app-a']
+        
+        assert (status.status, status.exit_code) == ('exited', 137)
+        assert status.stopped_at is not None
+    
+    def test_image_events_record_full_references(self):
+        """A pull event records the pulled repo:tag, not the bare repository."""
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.mock_client.events.return_value = iter([
+            {'Type': 'image', 'Action': 'pull',
+             'Actor': {'ID': 'python:3.11-slim', 'Attributes': {'name': 'python'}}},
+            {'Type': 'image', 'Action': 'tag',
+             'Actor': {'ID': 'sha256:abc', 'Attributes': {'name': 'built:v2'}}},
+        ])
+        self.api.inspect_image.side_effect = ImageNotFound("missing")
+        
+        self.manager.create_container(ContainerConfig(name='a', image='img', ports={}, volumes={}, environment={}))
+        self.manager._events_thread.join(timeout=5)
+        
+        assert {'python:3.11-slim', 'built:v2'} <= self.manager._images
+        assert 'python:latest' not in self.manager._images
+        status = self.manager.create_container(
+            ContainerConfig(name='b', image='python', ports={}, volumes={}, environment={})
+        )
+        assert status.status == 'created'
+        self.api.pull.assert_called_once_with('python', tag='latest')
+    
+    def test_image_cache_reset_during_ensure_image(self):
+        """An image event clearing the cache mid-check does not fail the create."""
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.mock_client.events.side_effect = Exception("no events")
+        
+        def inspect_image(image):
+            self.manager._images = None  # As a concurrent 'untag' event would
+            raise ImageNotFound(image)
+        self.api.inspect_image.side_effect = inspect_image
+        
+        status = self.manager.create_container(
+            ContainerConfig(name='a', image='fresh:1', ports={}, volumes={}, environment={})
+        )
+        
+        assert status.status == 'created'
+        self.api.pull.assert_called_once_with('fresh', tag='1')
+    
+    def test_wait_records_exit_without_inspect(self):
+        """Without events, a started container's exit comes from api.wait."""
+        self._track('app-a')
+        self.manager.managed_containers['app-a'].container_id = 'id-a'
+        released = threading.Event()
+        
+        def wait(container_id, timeout=None):
+            released.wait(timeout=5)
+            return {'StatusCode': 2}
+        self.api.wait.side_effect = wait
+        
+        self.manager.start_container('app-a')
+        waiter = self.manager._waiters['app-a']
+        assert self.manager.get_container_status('app-a').status == 'running'
+        self.api.inspect_container.assert_not_called()
+        released.set()
+        waiter.join(timeout=5)
+        status = self.manager.managed_containers['app-a']
+        
+        assert (status.status, status.exit_code) == ('exited', 2)
+        self.api.wait.assert_called_once_with('id-a', timeout=None)
+        assert 'app-a' not in self.manager._waiters
+    
+    def test_force_cleanup_skips_stop_for_exited_container(self):
+        """Stale exited containers are removed without a graceful stop."""
+        self.api.inspect_container.return_value = {'State': {'Status': 'exited', 'Running': False}}
+        
+        self.manager._force_cleanup_container('stale')
+        
+        self.api.stop.assert_not_called()
+        self.api.remove_container.assert_called_once_with('stale', v=False, force=True)
+        self.mock_client.containers.get.assert_not_called()
+    
+    def test_create_containers_cleans_up_taken_names_only(self):
+        """Only names found by the batch lookup get a forced cleanup."""
+        self.api.containers.return_value = [{'Id': 'old-b', 'Names': ['/app-b']}]
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.mock_client.events.side_effect = Exception("no events")
+        configs = [
+            ContainerConfig(name=name, image='img', ports={}, volumes={}, environment={})
+            for name in ('app-a', 'app-b')
+        ]
+        
+        statuses = self.manager.create_containers(configs)
+        
+        assert [status.container_id for status in statuses] == ['app-a', 'app-b']
+        assert [status.status for status in statuses] == ['created', 'created']
+        self.api.containers.assert_called_once()
+        self.api.inspect_container.assert_called_once_with('app-b')
+    
+    def test_missing_images_pulled_once(self):
+        """Known images are not pulled; a missing one is pulled only once."""
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.mock_client.events.side_effect = Exception("no events")
+        
+        def inspect_image(image):
+            if image != 'built:latest':
+                raise ImageNotFound(image)
+            return {}
+        self.api.inspect_image.side_effect = inspect_image
+        configs = [
+            ContainerConfig(name=name, image=image, ports={}, volumes={}, environment={})
+            for name, image in (
+                ('a', 'img'), ('b', 'built'), ('c', 'registry:5000/tool:1.2'), ('d', 'registry:5000/tool:1.2')
+            )
+        ]
+        
+        statuses = self.manager.create_containers(configs)
+        
+        assert [status.status for status in statuses] == ['created'] * 4
+        self.api.images.assert_called_once()
+        assert self.api.inspect_image.call_count == 2
+        self.api.pull.assert_called_once_with('registry:5000/tool', tag='1.2')
+    
+    def test_network_looked_up_once(self):
+        """Containers joining the same network share one network lookup."""
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.mock_client.networks.get.return_value = Mock(id='net-1')
+        self.mock_client.events.side_effect = Exception("no events")
+        configs = [
+            ContainerConfig(name=name, image='img', ports={}, volumes={}, environment={}, network='coval')
+            for name in ('app-a', 'app-b')
+        ]
+        
+        self.manager.create_containers(configs)
+        
+        self.mock_client.networks.get.assert_called_once_with('coval')
+        self.api.connect_container_to_network.assert_any_call('app-a', 'net-1')
+        self.api.connect_container_to_network.assert_any_call('app-b', 'net-1')
+    
+    def test_container_config_wire_format(self):
+        """ContainerConfig pre-builds the Docker API forms of its fields."""
+        config = ContainerConfig(
+            name="test-container",
+            image="python:3.11",
+            ports={8000: 8000, "53/udp": 5353},
+            volumes={"/data": {"bind": "/app/data"}},
+            environment={"ENV": "test", "FLAG": None}
+        )
+        
+        assert config._port_bindings == {"8000/tcp": 8000, "53/udp": 5353}
+        assert config._exposed_ports == [("53", "udp"), ("8000", "tcp")]
+        assert config._binds == ["/data:/app/data:rw"]
+        assert config._env_list == ["ENV=test", "FLAG"]
+        assert config._shape == ContainerConfig(
+            name="other", image="python:3.11", ports={"8000/tcp": 8000, "53/udp": 5353},
+            volumes={"/data": {"bind": "/app/data"}}, environment={"ENV": "test", "FLAG": None}
+        )._shape
+    
+    def test_same_shaped_containers_share_create_arguments(self):
+        """The HostConfig is built once per container shape."""
+        self.api.create_container.side_effect = lambda **kwargs: {'Id': kwargs['name']}
+        self.api.create_host_config.side_effect = lambda **kwargs: dict(kwargs)
+        self.mock_client.events.side_effect = Exception("no events")
+        configs = [
+            ContainerConfig(name=name, image='img', ports={'80/tcp': port}, volumes={},
+                            environment={'MODE': 'prod'})
+            for name, port in (('app-a', 8080), ('app-b', 8080), ('app-c', 9090))
+        ]
+        
+        self.manager.create_containers(configs)
+        
+        assert self.api.create_host_config.call_count == 2
+        self.mock_client.containers.create.assert_not_called()
+        self.mock_client.containers.get.assert_not_called()
+        kwargs = self.api.create_container.call_args_list[1].kwargs
+        assert kwargs['name'] == 'app-b'
+        assert kwargs['environment'] == ['MODE=prod']
+        assert kwargs['ports'] == [('80', 'tcp')]
+        assert kwargs['host_config']['port_bindings'] == {'80/tcp': 8080}
+    
+    def test_docker_pool_size_from_environment(self):
+        """The Docker connection pool is sized from COVAL_DOCKER_POOL."""
+        with patch.dict('os.environ', {'COVAL_DOCKER_POOL': '48'}):
+            ContainerManager()
+        with patch.dict('os.environ', {'COVAL_DOCKER_POOL': 'lots'}):
+            ContainerManager()
+        
+        pool_sizes = [call.kwargs['max_pool_size'] for call in self.mock_from_env.call_args_list]
+        assert pool_sizes[-2:] == [48, 32]
+    
+    def test_tcp_endpoint_uses_keepalive_pool(self):
+        """TCP endpoints get a sized keep-alive adapter; Unix sockets do not."""
+        self.api.mount.assert_not_called()
+        self.api.base_url = 'https://docker.example:2376'
+        
+        ContainerManager()
+        
+        prefix, adapter = self.api.mount.call_args.args
+        assert prefix == 'https://'
+        assert adapter._pool_maxsize == 32
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    
+    def test_containers_by_status(self):
+        """Tracked containers can be filtered by their status."""
+        self._track('app-a', 'app-b', 'app-c')
+        self.manager.managed_containers['app-b'].status = 'exited'
+        
+        assert self.manager.containers_by_status('running') == ['app-a', 'app-c']
+        assert self.manager.containers_by_status('exited') == ['app-b']
+    
+    def test_concurrent_status_reads_share_one_inspect(self):
+        """Concurrent pollers of one container wait on a single inspect."""
+        self._track('app-a')
+        release = threading.Event()
+        
+        def inspect(name):
+            release.wait(timeout=5)
+            return {'Id': 'id-a', 'State': {'Status': 'running'}}
+        self.api.inspect_container.side_effect = inspect
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self.manager.get_container_status, 'app-a') for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            statuses = [future.result() for future in futures]
+        
+        assert {status.status for status in statuses} == {'running'}
+        assert self.api.inspect_container.call_count == 1
+    
+    def test_acleanup_containers_runs_concurrently(self):
+        """Async cleanup stops and removes every container it is given at once."""
+        self._track('app-a', 'app-b')
+        barrier = threading.Barrier(2, timeout=5)
+        # Fails unless both stops are in flight together
+        self.api.stop.side_effect = lambda *args, **kwargs: barrier.wait()
+        
+        results = asyncio.run(self.manager.acleanup_containers(['app-a', 'app-b']))
+        
+        assert results == {'app-a': True, 'app-b': True}
+        assert self.manager.managed_containers == {}
 
 
 class TestHealthChecker:
@@ -137,6 +496,296 @@ class TestDockerDeployer:
         assert result.error_message is None
 
 
+class TestDockerDeployerMocked:
+    """Test cases for DockerDeployer with mocked modular components."""
+    
+    def setup_method(self):
+        """Set up a deployer whose container manager and health checker are mocked."""
+        self.project_root = tempfile.mkdtemp()
+        self.patchers = [
+            patch('coval.deployers.docker_deployer.ContainerManager'),
+            patch('coval.deployers.docker_deployer.HealthChecker'),
+        ]
+        self.mock_manager_class, self.mock_checker_class = [patcher.start() for patcher in self.patchers]
+        self.mock_client = self.mock_manager_class.return_value.docker_client
+        self.deployer = DockerDeployer(self.project_root)
+    
+    def teardown_method(self):
+        """Stop patching and remove the project directory."""
+        for patcher in self.patchers:
+            patcher.stop()
+        shutil.rmtree(self.project_root, ignore_errors=True)
+    
+    def test_port_scan_reuses_shared_client(self):
+        """Port scans list containers through the container manager's client."""
+        self.mock_client.api.containers.return_value = [
+            {'Id': 'c1', 'Ports': [{'IP': '0.0.0.0', 'PrivatePort': 8000, 'PublicPort': 18000, 'Type': 'tcp'}]},
+            {'Id': 'c2', 'Ports': [{'PrivatePort': 5432, 'Type': 'tcp'}]},
+        ]
+        
+        with patch.object(self.deployer, '_is_port_in_use', return_value=False):
+            port = self.deployer._find_next_available_port(18000)
+        
+        assert port == 18001
+        assert self.deployer.docker_client is self.mock_client
+        self.mock_client.api.containers.assert_called_once()
+        
+        self.deployer.close()
+        self.mock_manager_class.return_value.close.assert_called_once()
+        self.mock_client.close.assert_called_once()
+    
+    def test_port_scan_tolerates_concurrent_deployment_inserts(self):
+        """A deployment tracked while ports are scanned does not break the scan."""
+        self.mock_client.api.containers.return_value = []
+        deployer = self.deployer
+        
+        def deployment(iteration_id, port_mappings):
+            return DeploymentResult(
+                success=True, iteration_id=iteration_id, container_name=f"coval-{iteration_id}",
+                container_id=None, image_name="img", port_mappings=port_mappings,
+                health_status=HealthStatus.HEALTHY, deployment_time=1.0
+            )
+        
+        class TrackingMappings(dict):
+            """Port mappings whose read stands in for another deploy finishing."""
+            def values(self):
+                deployer.active_deployments.setdefault('it-new', deployment('it-new', {8000: 18001}))
+                return super().values()
+        
+        deployer.active_deployments['it-old'] = deployment('it-old', TrackingMappings({8000: 18000}))
+        
+        with patch.object(deployer, '_is_port_in_use', return_value=False), \
+                patch('coval.deployers.docker_deployer._snapshot_used_ports', return_value=set()):
+            port = deployer._find_next_available_port(18000)
+        
+        assert port == 18001
+    
+    def test_published_ports_reused_within_ttl(self):
+        """Back-to-back port scans list containers once until a stop frees a port."""
+        self.mock_client.api.containers.return_value = [
+            {'Id': 'c1', 'Ports': [{'IP': '0.0.0.0', 'PrivatePort': 8000, 'PublicPort': 18000, 'Type': 'tcp'}]},
+            {'Id': 'c2', 'Ports': [{'PrivatePort': 5432, 'Type': 'tcp'}]},
+        ]
+        self.deployer.container_manager.stop_and_remove_container.return_value = True
+        
+        with patch.object(self.deployer, '_is_port_in_use', return_value=False):
+            ports = [self.deployer._find_next_available_port(18000) for _ in range(3)]
+            self.deployer.stop_deployment("it-0")
+            self.deployer._find_next_available_port(18000)
+        
+        assert ports == [18001] * 3
+        assert self.mock_client.api.containers.call_count == 2
+        self.mock_client.api.containers.assert_called_with(filters={'status': 'running'})
+        self.mock_client.containers.list.assert_not_called()
+    
+    def test_crowded_port_range_falls_back_to_ephemeral_port(self):
+        """A fully used scan window is not probed port by port up to 65535."""
+        self.mock_client.api.containers.return_value = []
+        
+        with patch.object(self.deployer, '_is_port_in_use', return_value=True) as mock_in_use:
+            port = self.deployer._find_next_available_port(18000)
+        
+        assert mock_in_use.call_count == 100
+        assert not 18000 <= port < 18100
+        assert 0 < port <= 65535
+    
+    def test_refresh_all_health_runs_checks_concurrently(self):
+        """Health checks overlap, and a stuck one is reported as a timeout."""
+        release = threading.Event()
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def check(host, port, config):
+            if port == 8002:
+                release.wait(timeout=5)
+            else:
+                barrier.wait()  # Fails unless both fast checks run at once
+            return Mock(status=HealthStatus.HEALTHY)
+        self.deployer.health_checker.perform_health_check.side_effect = check
+        for index in range(3):
+            self.deployer.active_deployments[f"it-{index}"] = DeploymentResult(
+                success=True, iteration_id=f"it-{index}", container_name=f"coval-it-{index}",
+                container_id=None, image_name="img", port_mappings={8000: 8000 + index},
+                health_status=HealthStatus.UNKNOWN, deployment_time=1.0
+            )
+        
+        statuses = self.deployer.refresh_all_health(timeout=1.0)
+        release.set()
+        
+        assert statuses == {'it-0': HealthStatus.HEALTHY, 'it-1': HealthStatus.HEALTHY, 'it-2': HealthStatus.TIMEOUT}
+        assert self.deployer.active_deployments['it-2'].health_status == HealthStatus.TIMEOUT
+    
+    def test_refresh_all_health_skips_deployments_without_ports(self):
+        """Deployments that publish no port are left out of the refresh."""
+        self.deployer.health_checker.perform_health_check.return_value = Mock(status=HealthStatus.HEALTHY)
+        for iteration_id, mappings in (("it-0", {}), ("it-1", {8000: 8001})):
+            self.deployer.active_deployments[iteration_id] = DeploymentResult(
+                success=True, iteration_id=iteration_id, container_name=f"coval-{iteration_id}",
+                container_id=None, image_name="img", port_mappings=mappings,
+                health_status=HealthStatus.UNKNOWN, deployment_time=1.0
+            )
+    
+        statuses = self.deployer.refresh_all_health(timeout=1.0)
+    
+        assert statuses == {'it-1': HealthStatus.HEALTHY}
+        assert self.deployer.active_deployments['it-0'].health_status == HealthStatus.UNKNOWN
+    
+    def test_alist_active_deployments_probes_health(self):
+        """Listing deployments asynchronously runs fresh health checks."""
+        self.deployer.health_checker.perform_health_check.return_value = Mock(status=HealthStatus.UNHEALTHY)
+        self.deployer.active_deployments["it-1"] = DeploymentResult(
+            success=True, iteration_id="it-1", container_name="coval-it-1",
+            container_id=None, image_name="img", port_mappings={8000: 8001},
+            health_status=HealthStatus.HEALTHY, deployment_time=1.0
+        )
+    
+        deployments = asyncio.run(self.deployer.alist_active_deployments())
+    
+        assert [d.health_status for d in deployments] == [HealthStatus.UNHEALTHY]
+        self.deployer.health_checker.perform_health_check.assert_called_once()
+        assert self.deployer.health_checker.perform_health_check.call_args.args[:2] == ("localhost", 8001)
+    
+    def test_build_streams_context_archive(self):
+        """Images build from an archive packed from the source, not a staged copy."""
+        source = Path(self.project_root) / "source"
+        (source / "pkg").mkdir(parents=True)
+        (source / "node_modules").mkdir()
+        (source / "main.py").write_text("print('hi')")
+        (source / "secret.env").write_text("TOKEN=1")
+        (source / "pkg" / "util.py").write_text("X = 1")
+        (source / ".dockerignore").write_text("# local only\nsecret.env\n")
+        config = DeploymentConfig(
+            iteration_id="it-1", project_name="p", framework="fastapi", language="python", source_path=source
+        )
+        members = {}
+        
+        def build(fileobj, **kwargs):
+            with tarfile.open(fileobj=fileobj) as tar:
+                for member in tar.getmembers():
+                    members[member.name] = member
+            return Mock(), []
+        self.mock_client.images.build.side_effect = build
+        result = Mock(image_name="coval-it-1:latest")
+        
+        assert self.deployer._build_image(config, result)
+        
+        assert self.mock_client.images.build.call_args.kwargs['custom_context'] is True
+        assert {'main.py', 'pkg', 'pkg/util.py', 'Dockerfile', 'start.sh'} <= set(members)
+        assert 'secret.env' not in members and 'node_modules' not in members
+        assert members['start.sh'].mode == 0o755
+        assert not (Path(self.project_root) / "deployments" / "build-it-1").exists()
+    
+    def test_base_images_pulled_once_per_deployer(self):
+        """Only the first build of a base image asks Docker to pull it."""
+        source = Path(self.project_root) / "source"
+        source.mkdir()
+        (source / "main.py").write_text("print('hi')")
+        self.mock_client.images.build.return_value = (Mock(), [])
+        config = DeploymentConfig(
+            iteration_id="it-1", project_name="p", framework="fastapi", language="python", source_path=source
+        )
+        
+        for _ in range(2):
+            assert self.deployer._build_image(config, Mock(image_name="coval-it-1:latest"))
+        (source / "Dockerfile").write_text("FROM node:18 AS deps\nFROM deps\nFROM python:3.11-slim\n")
+        self.deployer._build_image(config, Mock(image_name="coval-it-1:latest"))
+        
+        pulls = [call.kwargs['pull'] for call in self.mock_client.images.build.call_args_list]
+        assert pulls == [True, False, True]
+        assert self.deployer._pulled_bases == {'python:3.11-slim', 'node:18'}
+    
+    def test_cleanup_old_deployments_stops_concurrently(self):
+        """Old deployments are stopped in parallel and the last started are kept."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def stop_and_remove(container_name):
+            barrier.wait()  # Fails unless all three stops run at once
+            return True
+        self.deployer.container_manager.stop_and_remove_container.side_effect = stop_and_remove
+        for index in range(5):
+            self.deployer.active_deployments[f"it-{index}"] = DeploymentResult(
+                success=True, iteration_id=f"it-{index}", container_name=f"coval-it-{index}",
+                container_id=None, image_name="img", port_mappings={8000: 8000 + index},
+                health_status=HealthStatus.HEALTHY, deployment_time=float(10 - index),
+                started_at=datetime(2024, 1, 1, index)
+            )
+        
+        results = self.deployer.cleanup_old_deployments(keep_count=2)
+        
+        assert results == {f"it-{index}": True for index in range(5)}
+        assert sorted(self.deployer.active_deployments) == ['it-3', 'it-4']
+    
+    def test_port_in_use_on_any_interface(self):
+        """A port listened on by a non-localhost bind still counts as in use."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(('0.0.0.0', 0))
+            listener.listen()
+            port = listener.getsockname()[1]
+            
+            assert self.deployer._is_port_in_use(port)
+        
+        assert not self.deployer._is_port_in_use(port)
+    
+    def test_concurrent_adeploys_get_distinct_ports(self):
+        """Deploys run concurrently and never auto-assign the same port."""
+        self.mock_client.api.containers.return_value = []
+        self.deployer.health_checker.wait_for_healthy.return_value = True
+        container = Mock(status='running', container_id='cid')
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def build(config, result):
+            barrier.wait()  # Fails unless both deploys are in flight at once
+            return True
+        
+        async def deploy_both():
+            configs = [
+                DeploymentConfig(iteration_id=f"it-{index}", project_name="p", framework="fastapi",
+                                 language="python", source_path=Path(self.project_root))
+                for index in range(2)
+            ]
+            return await asyncio.gather(*(self.deployer.adeploy(config) for config in configs))
+        
+        with patch.object(self.deployer, '_build_image', side_effect=build), \
+                patch.object(self.deployer, '_create_and_start_container', return_value=container), \
+                patch.object(self.deployer, '_is_port_in_use', return_value=False), \
+                patch('coval.deployers.docker_deployer._snapshot_used_ports', return_value=set()):
+            results = asyncio.run(deploy_both())
+        
+        assert all(result.success for result in results)
+        assert sorted(result.port_mappings[8000] for result in results) == [8000, 8001]
+        assert self.deployer._reserved_ports == set()
+    
+    def test_default_build_files_rendered_from_templates(self):
+        """Default build files carry the port and are rendered once per shape."""
+        config = DeploymentConfig(
+            iteration_id="it-1", project_name="p", framework="flask", language="python",
+            source_path=Path("."), base_port=8123
+        )
+        
+        dockerfile = self.deployer._render_default_dockerfile(config)
+        script = self.deployer._render_start_script(config)
+        
+        assert dockerfile.startswith("FROM python:3.11-slim")
+        assert "EXPOSE 8123" in dockerfile
+        assert "export FLASK_RUN_PORT=8123" in script
+        assert self.deployer._render_default_dockerfile(config) is dockerfile
+    
+    @pytest.mark.skipif(not Path('/proc/net/tcp').exists(), reason="needs /proc/net/tcp")
+    def test_listening_ports_skipped_without_bind_probe(self):
+        """Ports found listening in /proc/net/tcp are not bind-probed."""
+        self.mock_client.api.containers.return_value = []
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(('127.0.0.1', 0))
+            listener.listen()
+            taken = listener.getsockname()[1]
+            
+            assert taken in _snapshot_used_ports()
+            with patch.object(self.deployer, '_is_port_in_use', return_value=False) as mock_in_use:
+                port = self.deployer._find_next_available_port(taken)
+        
+        assert port == taken + 1
+        mock_in_use.assert_called_once_with(taken + 1)
+
+
 class TestIntegration:
     """Integration tests for modular deployer components."""
     
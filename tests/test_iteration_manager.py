@@ -0,0 +1,234 @@
+"""
+Unit tests for IterationManager.
+"""
+import json
+import os
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+from pathlib import Path
+from threading import Event, Thread
+
+from coval.core.iteration_manager import IterationInfo, IterationManager
+
+
+def _write(root: Path, files: dict):
+    for relative, content in files.items():
+        file_path = root / relative
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
+
+class TestIterationManager:
+    """Test cases for IterationManager class."""
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return IterationManager(str(tmp_path))
+    
+    def test_code_metrics_single_walk(self, manager, tmp_path):
+        """Code metrics count files and lines like readlines() would."""
+        _write(tmp_path / "proj", {
+            "src/main.py": b"import os\nprint(os.name)\n",
+            "src/app.js": b"a\r\nb\rc",
+            "tests/test_main.py": b"def test(): pass\n",
+            "config.yaml": b"a: 1\n",
+            "empty.py": b"",
+            "node_modules/lib/index.js": b"module.exports = 1\n",
+            ".git/hooks/pre-commit.py": b"exit()\n",
+        })
+        
+        metrics = manager._calculate_code_metrics(tmp_path / "proj")
+        
+        assert metrics['total_files'] == 5
+        assert metrics['total_lines'] == 2 + 3 + 1 + 1
+        assert metrics['test_files'] == 1
+        assert metrics['code_files'] == 3
+        assert metrics['config_files'] == 1
+        assert metrics['languages'] == {'.py': 3, '.js': 1}
+    
+    def test_analyze_project_structure(self, manager):
+        """Structure analysis detects language, tests and entry point."""
+        iteration_id = manager.create_iteration("test project")
+        _write(manager.get_iteration_path(iteration_id), {
+            "src/main.py": b"print('hi')\n",
+            "tests/test_main.py": b"def test(): pass\n",
+            "tests/api_test.py": b"def test(): pass\n",
+            "web/app.test.js": b"test()\n",
+            "requirements.txt": b"fastapi\n",
+        })
+        
+        structure = manager.analyze_project_structure(iteration_id)
+        
+        assert structure.framework == 'fastapi'
+        assert structure.language == 'python'
+        assert structure.entry_point == 'src/main.py'
+        assert sorted(structure.test_files) == [
+            'tests/api_test.py', 'tests/test_main.py', 'web/app.test.js'
+        ]
+    
+    def test_iteration_metrics_size_from_reads(self, manager):
+        """The iteration size is the sum of the file sizes."""
+        iteration_id = manager.create_iteration("sized")
+        _write(manager.get_iteration_path(iteration_id), {
+            "src/main.py": b"x" * 1000,
+            "data/blob.bin": b"\n" * 70000,
+        })
+        
+        metrics = manager.get_iteration_metrics(iteration_id)
+        
+        assert metrics['size_mb'] == pytest.approx(71000 / 1024 / 1024)
+        assert metrics['code_metrics']['total_lines'] == 70001
+    
+    def test_analysis_reads_manifests_once(self, manager):
+        """Framework and dependency checks share one read per manifest."""
+        iteration_id = manager.create_iteration("manifests")
+        _write(manager.get_iteration_path(iteration_id), {
+            "requirements.txt": b"# pinned\nflask==3.0\n\nrequests\n",
+            "package.json": b'{"dependencies": {"react": "18"}}',
+            "docker/Dockerfile": b"FROM python\n",
+        })
+        
+        with patch("builtins.open", wraps=open) as opened:
+            structure = manager.analyze_project_structure(iteration_id)
+        
+        read_names = [Path(call.args[0]).name for call in opened.call_args_list]
+        assert read_names.count("requirements.txt") == 1
+        assert read_names.count("package.json") == 1
+        assert structure.framework == 'flask'
+        assert structure.dependencies == ['flask==3.0', 'requests', 'react']
+        assert structure.dockerfile_path == str(Path("docker/Dockerfile"))
+    
+    def test_history_and_config_reloads(self, manager, tmp_path):
+        """Cached loads hand out independent copies and see new writes."""
+        iteration_id = manager.create_iteration("first")
+        manager.config['project']['name'] = 'changed'
+        
+        second = IterationManager(str(tmp_path))
+        second.iterations[iteration_id].files_changed.append("src/main.py")
+        manager.update_iteration_status(iteration_id, 'tested')
+        third = IterationManager(str(tmp_path))
+        
+        assert second.config['project']['name'] == 'coval-project'
+        assert third.iterations[iteration_id].status == 'tested'
+        assert third.iterations[iteration_id].files_changed == []
+    
+    def test_status_updates_append_to_log(self, manager, tmp_path):
+        """Status updates are logged and replayed until compaction."""
+        iteration_id = manager.create_iteration("logged")
+        snapshot = (tmp_path / "iteration_history.json").read_text()
+        
+        manager.update_iteration_status(iteration_id, 'running', success_rate=0.5)
+        
+        assert (tmp_path / "iteration_history.json").read_text() == snapshot
+        assert (tmp_path / "iteration_history.jsonl").exists()
+        reloaded = IterationManager(str(tmp_path)).iterations[iteration_id]
+        assert (reloaded.status, reloaded.success_rate) == ('running', 0.5)
+        
+        for _ in range(20):
+            manager.update_iteration_status(iteration_id, 'tested')
+        
+        assert not (tmp_path / "iteration_history.jsonl").exists() or \
+            (tmp_path / "iteration_history.jsonl").stat().st_size <= 4 * len(snapshot)
+        assert IterationManager(str(tmp_path)).iterations[iteration_id].status == 'tested'
+    
+    def test_status_update_waits_for_snapshot_write(self, manager):
+        """An update from another thread cannot run while a snapshot is written."""
+        iteration_id = manager.create_iteration("locked")
+        writing, release, updated = Event(), Event(), Event()
+        real_fsync = os.fsync
+        
+        def slow_fsync(fd):
+            writing.set()
+            release.wait(5)
+            real_fsync(fd)
+        
+        def update():
+            manager.update_iteration_status(iteration_id, 'tested')
+            updated.set()
+        
+        with patch('coval.core.iteration_manager.os.fsync', side_effect=slow_fsync):
+            writer = Thread(target=manager._save_iteration_history)
+            writer.start()
+            assert writing.wait(5)
+            updater = Thread(target=update)
+            updater.start()
+            assert not updated.wait(0.2)
+            release.set()
+            writer.join(5)
+            updater.join(5)
+        
+        assert updated.is_set()
+        assert manager.iterations[iteration_id].status == 'tested'
+    
+    def test_child_iteration_copies_parent_files(self, manager):
+        """A child iteration starts from a copy of its parent's files."""
+        parent_id = manager.create_iteration("parent")
+        _write(manager.get_iteration_path(parent_id), {
+            "src/pkg/main.py": b"print('parent')\n",
+            "requirements.txt": b"flask\n",
+            "docker/Dockerfile": b"FROM python\n",
+        })
+        
+        child_id = manager.create_iteration("child", 'modify', parent_id)
+        child_path = manager.get_iteration_path(child_id)
+        
+        assert (child_path / "src/pkg/main.py").read_bytes() == b"print('parent')\n"
+        assert (child_path / "requirements.txt").read_bytes() == b"flask\n"
+        assert (child_path / "docker/Dockerfile").read_bytes() == b"FROM python\n"
+    
+    def test_latest_active_and_cleanup(self, manager):
+        """Scans order iterations by timestamp and spare deployed ones."""
+        for day, docker_status in ((1, 'deployed'), (2, 'not_deployed'), (3, 'not_deployed'), (4, 'running')):
+            iteration_id = f"it{day}"
+            manager.iterations[iteration_id] = IterationInfo(
+                iteration_id, datetime(2030, 1, day), "", None, 'generate', 'generated',
+                0.0, 0.0, [], docker_status, {}
+            )
+            manager.get_iteration_path(iteration_id).mkdir(parents=True)
+        
+        assert manager.get_latest_iteration() == 'it4'
+        assert sorted(manager.get_active_iterations()) == ['it1', 'it4']
+        assert manager.cleanup_old_iterations(keep_count=1) == ['it3', 'it2']
+        assert sorted(manager.iterations) == ['it1', 'it4']
+    
+    def test_latest_iteration_tracks_creation(self, manager):
+        """The latest iteration follows creations and direct record edits."""
+        assert manager.get_latest_iteration() is None
+        
+        first = manager.create_iteration("first")
+        assert manager.get_latest_iteration() == first
+        
+        second = manager.create_iteration("second", 'modify', first)
+        assert manager.get_latest_iteration() == second
+        
+        manager.iterations['future'] = IterationInfo(
+            'future', datetime(2999, 1, 1), "", None, 'generate', 'generated',
+            0.0, 0.0, [], 'not_deployed', {}
+        )
+        assert manager.get_latest_iteration() == 'future'
+        
+        manager.create_iteration("third", 'repair')
+        assert manager.get_latest_iteration() == 'future'
+    
+    def test_cleanup_logs_removals(self, manager, tmp_path):
+        """Removed iterations stay removed after reloading the history."""
+        old_ids = [manager.create_iteration("a"), manager.create_iteration("b", 'modify')]
+        newest = manager.create_iteration("c", 'repair')
+        
+        removed = manager.cleanup_old_iterations(keep_count=1)
+        
+        assert sorted(removed) == sorted(old_ids)
+        assert list(IterationManager(str(tmp_path)).iterations) == [newest]
+    
+    def test_to_dict_round_trip(self):
+        """to_dict output rebuilds an equal record through from_dict."""
+        info = IterationInfo(
+            'it1', datetime(2030, 1, 1, 12, 30), "desc", None, 'modify', 'tested',
+            1.5, 0.75, ['src/main.py'], 'running', {'latency_ms': 12}
+        )
+        
+        item = json.loads(json.dumps(info.to_dict()))
+        
+        assert item['timestamp'] == '2030-01-01T12:30:00'
+        assert IterationInfo.from_dict(item) == info